@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the time needed for "import obspy" and some other imports used
+by short-lived command line scripts, each measured in a fresh interpreter.
+
+The time for starting the bare interpreter is given as reference.
+
+Usage: python core_import.py [number of runs per case]
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import subprocess
+import sys
+import time
+
+
+CASES = [
+    ('python (reference)', 'pass'),
+    ('import numpy', 'import numpy'),
+    ('import obspy', 'import obspy'),
+    ('from obspy import read', 'from obspy import read'),
+    ('read() MiniSEED file',
+     'from obspy import read; read("/path/to/test.mseed")'),
+    ('obspy-print script', 'import obspy.core.scripts.print'),
+]
+
+
+def benchmark(runs=10):
+    print('%-28s %10s' % ('case', 'ms (best)'))
+    for name, code in CASES:
+        timings = []
+        for _i in range(runs):
+            start = time.time()
+            subprocess.check_call([sys.executable, '-c', code])
+            timings.append(time.time() - start)
+        print('%-28s %10.1f' % (name, min(timings) * 1e3))
+
+
+if __name__ == '__main__':
+    benchmark(*[int(_i) for _i in sys.argv[1:2]])
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark of Stream.merge() against adding up the traces one after another
+with Trace.__add__().
+
+Usage: python core_merge.py [number of fragments per channel]
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from future.builtins import range
+
+from obspy import Stream, Trace, UTCDateTime
+import numpy as np
+import sys
+import timeit
+
+
+def createFragments(fragments=10000, channels=3, npts=100):
+    """
+    Every tenth fragment is followed by a gap, every tenth fragment overlaps
+    the previous one, all others are directly adjacent.
+    """
+    np.random.seed(42)
+    st = Stream()
+    for channel in ['HHZ', 'HHN', 'HHE'][:channels]:
+        data = np.cumsum(np.random.randint(-100, 100, fragments * npts))
+        data = data.astype(np.int32)
+        start = 0
+        for _i in range(fragments):
+            if _i % 10 == 5:
+                start += 20
+            elif _i % 10 == 9:
+                start -= 20
+            header = {'network': 'BW', 'station': 'BENCH',
+                      'channel': channel, 'sampling_rate': 100.0,
+                      'starttime': UTCDateTime(2014, 1, 1) + start / 100.0}
+            st.append(Trace(data=data[start:start + npts].copy(),
+                            header=header))
+            start += npts
+    return st
+
+
+def benchmark(fragments=10000, repeat=3):
+    st = createFragments(fragments)
+    ids = sorted(set(tr.id for tr in st))
+
+    def merge():
+        st.copy().merge()
+
+    def pairwise():
+        for _id in ids:
+            traces = sorted(st.select(id=_id),
+                            key=lambda x: x.stats.starttime)
+            cur_trace = traces[0]
+            for trace in traces[1:]:
+                cur_trace = cur_trace + trace
+
+    def copy():
+        st.copy()
+
+    print('%i channels with %i fragments of 100 samples each' % (
+        len(ids), fragments))
+    for name, func in [('Stream.copy (overhead)', copy),
+                       ('Stream.merge', merge),
+                       ('Trace.__add__ one by one', pairwise)]:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print('  %-26s %8.3f s' % (name, best))
+
+
+if __name__ == '__main__':
+    benchmark(*[int(_i) for _i in sys.argv[1:2]])
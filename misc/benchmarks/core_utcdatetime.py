@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Microbenchmarks of UTCDateTime construction, parsing, comparison and
+arithmetic, covering the input types of obspy/core/tests/test_utcdatetime.py.
+
+Most string cases parse the same string over and over again, the "not
+cached" cases cycle through the 86400 seconds of a day instead.
+
+Usage: python core_utcdatetime.py [number of loops per case]
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from obspy import UTCDateTime
+import copy
+import datetime
+import itertools
+import pickle
+import sys
+import timeit
+
+
+T1 = UTCDateTime(2009, 12, 31, 12, 23, 34, 500000)
+T2 = UTCDateTime(2009, 12, 31, 12, 23, 35)
+SECONDS = [(_i // 3600, _i // 60 % 60, _i % 60) for _i in range(86400)]
+ISO8601_STRINGS = itertools.cycle(
+    ["2009-12-31T%02d:%02d:%02d.5" % _i for _i in SECONDS])
+SEED_STRINGS = itertools.cycle(
+    ["2008,275,%02d:%02d:%02d.0450" % _i for _i in SECONDS])
+
+CASES = [
+    # construction
+    ('timestamp (float)', lambda: UTCDateTime(1240561632.5)),
+    ('timestamp (int)', lambda: UTCDateTime(1240561632)),
+    ('UTCDateTime', lambda: UTCDateTime(T1)),
+    ('datetime', lambda: UTCDateTime(
+        datetime.datetime(2009, 5, 24, 8, 28, 12, 5001))),
+    ('date', lambda: UTCDateTime(datetime.date(2009, 5, 24))),
+    ('args', lambda: UTCDateTime(2009, 12, 31, 12, 23, 34, 500000)),
+    ('kwargs julday', lambda: UTCDateTime(year=2009, julday=234, hour=14)),
+    ('precision kwarg', lambda: UTCDateTime(1240561632.5, precision=4)),
+    # string parsing
+    ('ISO8601 calendar', lambda: UTCDateTime("2009-12-31T12:23:34.5")),
+    ('ISO8601 calendar Z', lambda: UTCDateTime("2009-12-31T12:23:34Z")),
+    ('ISO8601 compact', lambda: UTCDateTime("20091231T122334.5")),
+    ('ISO8601 time zone', lambda: UTCDateTime("2009-12-31T12:23:34+01:15")),
+    ('ISO8601 ordinal', lambda: UTCDateTime("2009-365T12:23:34.5")),
+    ('ISO8601 week', lambda: UTCDateTime("2009-W53-7T12:23:34.5")),
+    ('date only', lambda: UTCDateTime("2009-12-31")),
+    ('space separated', lambda: UTCDateTime("1970-01-01 12:23:34")),
+    ('SEED', lambda: UTCDateTime("2008,275,12:30:35.0450")),
+    ('ISO8601 (not cached)', lambda: UTCDateTime(next(ISO8601_STRINGS))),
+    ('SEED (not cached)', lambda: UTCDateTime(next(SEED_STRINGS))),
+    ('SEED date only', lambda: UTCDateTime("2008,275")),
+    ('compact digits', lambda: UTCDateTime("20090701121212")),
+    # comparison and arithmetic
+    ('==', lambda: T1 == T2),
+    ('<', lambda: T1 < T2),
+    ('>=', lambda: T1 >= T2),
+    ('== float', lambda: T1 == 1262262214.5),
+    ('UTCDateTime + float', lambda: T1 + 1.5),
+    ('UTCDateTime - float', lambda: T1 - 1.5),
+    ('UTCDateTime - UTCDateTime', lambda: T2 - T1),
+    # conversion and copying
+    ('str', lambda: str(T1)),
+    ('repr', lambda: repr(T1)),
+    ('copy.deepcopy', lambda: copy.deepcopy(T1)),
+    ('pickle', lambda: pickle.loads(pickle.dumps(T1, protocol=2))),
+]
+
+
+def benchmark(number=20000, repeat=3):
+    print('%-28s %10s' % ('case', 'us/call'))
+    for name, func in CASES:
+        best = min(timeit.repeat(func, number=number, repeat=repeat))
+        print('%-28s %10.3f' % (name, best / number * 1e6))
+
+
+if __name__ == '__main__':
+    benchmark(*[int(_i) for _i in sys.argv[1:2]])
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the batch Steim codec of obspy.mseed.util against the per
+record and per trace code paths.
+
+Usage: python mseed_steim.py [number of samples]
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from future.builtins import range
+
+from obspy import Trace
+from obspy.core import compatibility
+from obspy.mseed.core import readMSEED
+from obspy.mseed.util import packSteimRecords, unpackSteimRecords, \
+    _unpackSteim1, _unpackSteim2
+import numpy as np
+import sys
+import timeit
+
+
+def benchmark(npts=2000000, reclen=4096, repeat=3):
+    np.random.seed(42)
+    data = np.cumsum(np.random.randint(-500, 500, npts)).astype(np.int32)
+    for encoding, unpack in [('STEIM1', _unpackSteim1),
+                             ('STEIM2', _unpackSteim2)]:
+        buf = compatibility.BytesIO()
+        Trace(data=data).write(buf, format='MSEED', encoding=encoding,
+                               reclen=reclen)
+        raw = np.frombuffer(buf.getvalue(), dtype=np.uint8)
+        records = raw.reshape(-1, reclen)
+        _, sample_offsets = unpackSteimRecords(raw, reclen)
+        counts = np.diff(sample_offsets)
+        swapflag = 1 if sys.byteorder == 'little' else 0
+
+        def per_record():
+            for _i in range(len(records)):
+                unpack(records[_i, 64:].tostring(), int(counts[_i]),
+                       swapflag)
+
+        def read_buffer():
+            readMSEED(compatibility.BytesIO(buf.getvalue()))
+
+        def batch_decode():
+            unpackSteimRecords(raw, reclen)
+
+        def write_mseed():
+            Trace(data=data).write(compatibility.BytesIO(), format='MSEED',
+                                   encoding=encoding, reclen=reclen)
+
+        def batch_encode():
+            packSteimRecords(data, encoding, reclen)
+
+        print('%s, %i samples, %i records of %i bytes' % (
+            encoding, npts, len(records), reclen))
+        for name, func in [('decode, _unpackSteim per record', per_record),
+                           ('decode, readMSEED', read_buffer),
+                           ('decode, unpackSteimRecords', batch_decode),
+                           ('encode, writeMSEED', write_mseed),
+                           ('encode, packSteimRecords', batch_encode)]:
+            best = min(timeit.repeat(func, number=1, repeat=repeat))
+            print('  %-34s %8.2f ms  %8.1f Msamples/s' % (
+                name, best * 1e3, npts / best / 1e6))
+
+
+if __name__ == '__main__':
+    benchmark(*[int(_i) for _i in sys.argv[1:2]])
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark of array_processing() FK and Capon analysis of a plane wave
+crossing a synthetic array, serially and in a pool of workers.
+
+Usage: python signal_array_processing.py [number of stations]
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from future.builtins import range
+
+from obspy import Stream, Trace, UTCDateTime
+from obspy.core.util import AttribDict
+from obspy.signal.array_analysis import array_processing
+import numpy as np
+import sys
+import timeit
+
+
+def createArray(stations=30, npts=60000, slowness=0.3):
+    """
+    Ten minutes of 100 Hz data of stations within a 2 km aperture, plane
+    wave from the east plus noise.
+    """
+    np.random.seed(42)
+    st = Stream()
+    geometry = np.random.uniform(-1.0, 1.0, (stations, 2))
+    wave = np.random.randn(npts + 200)
+    for _i in range(stations):
+        shift = 100 + int(round(100 * slowness * geometry[_i, 0]))
+        data = wave[shift:shift + npts] + 0.5 * np.random.randn(npts)
+        header = {'network': 'XX', 'station': 'S%03i' % _i,
+                  'channel': 'HHZ', 'sampling_rate': 100.0,
+                  'starttime': UTCDateTime(2014, 1, 1)}
+        tr = Trace(data=data, header=header)
+        tr.stats.coordinates = AttribDict({
+            'x': geometry[_i, 0], 'y': geometry[_i, 1], 'elevation': 0.0})
+        st.append(tr)
+    return st
+
+
+def benchmark(stations=30, repeat=1):
+    st = createArray(stations)
+    stime = st[0].stats.starttime
+    args = (st, 2.0, 0.5, -0.5, 0.5, -0.5, 0.5, 0.02, -1e99, -1e99, 1.0,
+            8.0, stime, stime + 590, 0)
+    print('%i stations, 10 minutes of 100 Hz data each' % stations)
+    for name, func in [
+            ('fk', lambda: array_processing(
+                *args, coordsys='xy', method=0)),
+            ('fk, processes', lambda: array_processing(
+                *args, coordsys='xy', method=0, parallel=True)),
+            ('capon', lambda: array_processing(
+                *args, coordsys='xy', method=1)),
+            ('capon, processes', lambda: array_processing(
+                *args, coordsys='xy', method=1, parallel=True))]:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print('  %-26s %8.3f s' % (name, best))
+
+
+if __name__ == '__main__':
+    benchmark(*[int(_i) for _i in sys.argv[1:2]])
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark of coincidenceTrigger() on a synthetic network with precomputed
+characteristic functions (coincidence sum computation only) and with
+recursive STA/LTA triggering, serially and in a pool of workers.
+
+Usage: python signal_coincidence.py [number of stations]
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from future.builtins import range
+
+from obspy import Stream, Trace, UTCDateTime
+from obspy.signal.trigger import coincidenceTrigger
+import numpy as np
+import sys
+import timeit
+
+
+def createNetwork(stations=300, npts=360000, events=100, noise=20):
+    """
+    One hour of 100 Hz data per station. Each station records about 70% of
+    the events and has some triggers of its own.
+    """
+    np.random.seed(42)
+    st = Stream()
+    onsets = np.random.randint(0, npts - 2000, events)
+    for _i in range(stations):
+        data = np.random.randn(npts)
+        for onset in onsets:
+            if np.random.rand() < 0.7:
+                start = onset + np.random.randint(0, 500)
+                data[start:start + 1000] *= 20
+        for start in np.random.randint(0, npts - 200, noise):
+            data[start:start + 200] *= 10
+        header = {'network': 'XX', 'station': 'S%03i' % _i,
+                  'channel': 'HHZ', 'sampling_rate': 100.0,
+                  'starttime': UTCDateTime(2014, 1, 1)}
+        st.append(Trace(data=data, header=header))
+    return st
+
+
+def benchmark(stations=300, repeat=1):
+    st = createNetwork(stations)
+    cft = st.copy().trigger('recstalta', sta=0.5, lta=10)
+    thr_sum = stations // 4
+    print('%i stations, 1 hour of 100 Hz data each' % stations)
+    for name, func in [
+            ('precomputed cft', lambda: coincidenceTrigger(
+                None, 3.5, 1.0, cft, thr_sum)),
+            ('recstalta', lambda: coincidenceTrigger(
+                'recstalta', 3.5, 1.0, st, thr_sum, sta=0.5, lta=10)),
+            ('recstalta, processes', lambda: coincidenceTrigger(
+                'recstalta', 3.5, 1.0, st, thr_sum, sta=0.5, lta=10,
+                parallel=True))]:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print('  %-26s %8.3f s' % (name, best))
+
+
+if __name__ == '__main__':
+    benchmark(*[int(_i) for _i in sys.argv[1:2]])
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark of matched filtering many templates against continuous
+three-component data with xcorrTemplates() (frequency domain) against
+np.correlate() per template and channel (time domain, with the same running
+normalization).
+
+Usage: python signal_xcorr_templates.py [number of templates]
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from future.builtins import range
+
+from obspy.signal.cross_correlation import xcorrTemplates
+import numpy as np
+import sys
+import timeit
+
+
+def timeDomain(data, templates):
+    ntemplates, nchannels, nt = templates.shape
+    cc_sum = np.zeros((ntemplates, data.shape[1] - nt + 1))
+    for channel in range(nchannels):
+        trace = data[channel] - data[channel].mean()
+        cumsum = np.concatenate(([0], np.cumsum(trace)))
+        cumsum2 = np.concatenate(([0], np.cumsum(trace ** 2)))
+        sum1 = cumsum[nt:] - cumsum[:-nt]
+        norm = np.sqrt(cumsum2[nt:] - cumsum2[:-nt] - sum1 ** 2 / nt)
+        for _i in range(ntemplates):
+            template = templates[_i, channel]
+            template = template - template.mean()
+            template /= np.sqrt((template ** 2).sum())
+            cc_sum[_i] += np.correlate(trace, template, 'valid') / norm
+    return cc_sum
+
+
+def benchmark(ntemplates=10, repeat=1):
+    np.random.seed(42)
+    # one hour of 100 Hz data, templates of 10 s
+    data = np.random.randn(3, 360000)
+    templates = np.random.randn(ntemplates, 3, 1000)
+    print('%i templates of 10 s, 3 channels, 1 hour of 100 Hz data' %
+          ntemplates)
+    for name, func in [
+            ('np.correlate', lambda: timeDomain(data, templates)),
+            ('xcorrTemplates', lambda: xcorrTemplates(data, templates)),
+            ('xcorrTemplates, processes', lambda: xcorrTemplates(
+                data, templates, parallel=True))]:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print('  %-26s %8.3f s' % (name, best))
+
+
+if __name__ == '__main__':
+    benchmark(*[int(_i) for _i in sys.argv[1:2]])
@@ -84,7 +84,7 @@ from __future__ import unicode_literals
 from __future__ import print_function
 
 # don't change order
-from obspy.core.utcdatetime import UTCDateTime
+from obspy.core.utcdatetime import UTCDateTime, UTCDateTimeArray  # NOQA
 from obspy.core.util.attribdict import AttribDict
 from obspy.core.trace import Stats, Trace
 from obspy.core.stream import Stream, read
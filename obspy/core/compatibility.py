@@ -20,7 +20,6 @@ if PY2:
     from urllib2 import HTTPError  # NOQA
     from urllib2 import Request  # NOQA
     from httplib import HTTPConnection  # NOQA
-    import mock  # NOQA
 else:
     import urllib.request
     urlopen = urllib.request.urlopen
@@ -34,7 +33,6 @@ else:
     from urllib.request import HTTPError  # NOQA
     from urllib.request import Request  # NOQA
     from http.client import HTTPConnection  # NOQA
-    from unittest import mock  # NOQA
 
 if PY2:
     from StringIO import StringIO
@@ -50,6 +48,28 @@ else:
     maketrans = bytes.maketrans
 
 
+class _LazyModule(object):
+    """
+    Placeholder for a module which is only needed by the test suites. The
+    module is imported on first attribute access.
+    """
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, name):
+        if self._module is None:
+            self._module = __import__(self._name, fromlist=[str('*')])
+        return getattr(self._module, name)
+
+
+# "mock" is part of the standard library since Python 3.3
+if PY2:
+    mock = _LazyModule('mock')
+else:
+    mock = _LazyModule('unittest.mock')
+
+
 def round_away(number):
     """
     Simple function that rounds a number to the nearest integer. If the number
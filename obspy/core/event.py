@@ -22,28 +22,31 @@ from obspy.core.event_header import PickOnset, PickPolarity, EvaluationMode, \
     EventDescriptionType, EventType, EventTypeCertainty, OriginType, \
     AmplitudeCategory, AmplitudeUnit, DataUsedWaveType, MTInversionType, \
     SourceTimeFunctionType, MomentTensorCategory
-from obspy.core.utcdatetime import UTCDateTime
+from obspy.core.utcdatetime import UTCDateTime, UTCDateTimeArray
 from obspy.core.util import uncompressFile, _readFromPlugin, \
     NamedTemporaryFile, AttribDict
 from obspy.core.util.decorator import map_example_filename
-from obspy.core.util.base import ENTRY_POINTS
+from obspy.core.util.base import ENTRY_POINTS, _getPluginFunction, \
+    _LazyEntryPointGroup
 from obspy.core.util.decorator import deprecated_keywords, deprecated
 from obspy.core import compatibility
-from pkg_resources import load_entry_point
 from uuid import uuid4
 from copy import deepcopy
 import collections
 import copy
 import glob
 import inspect
+import numpy as np
 import os
 import re
 import warnings
 import weakref
 
 
-EVENT_ENTRY_POINTS = ENTRY_POINTS['event']
-EVENT_ENTRY_POINTS_WRITE = ENTRY_POINTS['event_write']
+# kept for backwards compatibility, use ENTRY_POINTS['event'] and
+# ENTRY_POINTS['event_write'] of obspy.core.util.base instead
+EVENT_ENTRY_POINTS = _LazyEntryPointGroup(ENTRY_POINTS, 'event')
+EVENT_ENTRY_POINTS_WRITE = _LazyEntryPointGroup(ENTRY_POINTS, 'event_write')
 ATTRIBUTE_HAS_ERRORS = True
 
 
@@ -2783,6 +2786,10 @@ class Catalog(object):
                         "<=": __is_smaller_or_equal,
                         ">": __is_greater,
                         ">=": __is_greater_or_equal}
+        array_operator_map = {"<": UTCDateTimeArray.__lt__,
+                              "<=": UTCDateTimeArray.__le__,
+                              ">": UTCDateTimeArray.__gt__,
+                              ">=": UTCDateTimeArray.__ge__}
 
         try:
             inverse = kwargs["inverse"]
@@ -2805,13 +2812,34 @@ class Catalog(object):
                             float(value))):
                         temp_events.append(event)
                 events = temp_events
-            elif key in ("longitude", "latitude", "depth", "time"):
+            elif key == "time":
+                # compare all origin times at once
+                events = [event for event in events if event.origins and
+                          key in event.origins[0]]
+                times = [event.origins[0].time for event in events]
+                known = np.array([_i is not None for _i in times],
+                                 dtype=np.bool_)
+                matches = np.empty(len(events), dtype=np.bool_)
+                # same handling of unset times as in the helper functions
+                matches[~known] = operator in ("<", "<=")
+                times = [_i for _i in times if _i is not None]
+                value = UTCDateTime(value)
+                try:
+                    matches[known] = array_operator_map[operator](
+                        UTCDateTimeArray(times), value)
+                except ValueError:
+                    # times outside the int64 nanosecond range of
+                    # UTCDateTimeArray (about 1677-2262)
+                    matches[known] = [operator_map[operator](_i, value)
+                                      for _i in times]
+                events = [event for event, match in zip(events, matches)
+                          if match]
+            elif key in ("longitude", "latitude", "depth"):
                 temp_events = []
                 for event in events:
                     if (event.origins and key in event.origins[0] and
                         operator_map[operator](
                             event.origins[0].get(key),
-                            UTCDateTime(value) if key == 'time' else
                             float(value))):
                         temp_events.append(event)
                 events = temp_events
@@ -2925,14 +2953,13 @@ class Catalog(object):
         format = format.upper()
         try:
             # get format specific entry point
-            format_ep = EVENT_ENTRY_POINTS_WRITE[format]
+            format_ep = ENTRY_POINTS['event_write'][format]
             # search writeFormat method for given entry point
-            writeFormat = load_entry_point(
-                format_ep.dist.key, 'obspy.plugin.event.%s' % (format_ep.name),
-                'writeFormat')
+            writeFormat = _getPluginFunction('event', format_ep,
+                                             'writeFormat')
         except (IndexError, ImportError):
             msg = "Format \"%s\" is not supported. Supported types: %s"
-            raise TypeError(msg % (format, ', '.join(EVENT_ENTRY_POINTS)))
+            raise TypeError(msg % (format, ', '.join(ENTRY_POINTS['event'])))
         writeFormat(self, filename, **kwargs)
 
     @deprecated_keywords({'date_colormap': 'colormap'})
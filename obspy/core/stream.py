@@ -18,14 +18,14 @@ from future.builtins import str
 from future.utils import native_str
 from glob import glob, has_magic
 from obspy.core.trace import Trace
-from obspy.core.utcdatetime import UTCDateTime
+from obspy.core.utcdatetime import UTCDateTime, UTCDateTimeArray
 from obspy.core.util import NamedTemporaryFile
 from obspy.core.util.decorator import map_example_filename
 from obspy.core.util.base import ENTRY_POINTS, _readFromPlugin, \
-    _getFunctionFromEntryPoint
+    _getFunctionFromEntryPoint, _getPluginFunction, createEmptyDataChunk
 from obspy.core.util.decorator import uncompressFile, raiseIfMasked
+from obspy.core.util.misc import worker_pool, _check_parallel
 from obspy.core import compatibility
-from pkg_resources import load_entry_point
 import pickle
 import copy
 import fnmatch
@@ -33,12 +33,19 @@ import math
 import numpy as np
 import os
 import warnings
+import weakref
+
+
+# filters which work along the last axis of multidimensional arrays and can
+# be applied to many traces at once, see Stream.filter()
+_BATCH_FILTERS = ('bandpass', 'bandstop', 'lowpass', 'highpass',
+                  'lowpasscheby2')
 
 
 @map_example_filename("pathname_or_url")
 def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
          endtime=None, nearest_sample=True, dtype=None, apply_calib=False,
-         **kwargs):
+         parallel=False, workers=None, lazy=False, **kwargs):
     """
     Read waveform files into an ObsPy Stream object.
 
@@ -80,6 +87,25 @@ def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
     :type apply_calib: bool, optional
     :param apply_calib: Automatically applies the calibration factor
         ``trace.stats.calib`` for each trace, if set. Defaults to ``False``.
+    :type parallel: bool, str or pool-like object, optional
+    :param parallel: Only applied if multiple files match a file name
+        pattern. Decodes the files concurrently using a pool of workers:
+        ``"thread"`` uses a thread pool, ``"process"`` or ``True`` a process
+        pool. Alternatively any existing pool or executor object providing a
+        ``map`` method may be passed, which will not be closed afterwards.
+        Traces are always returned in the same order as for serial reading.
+        Defaults to ``False``.
+    :type workers: int, optional
+    :param workers: Number of workers used if ``parallel`` is ``"thread"``,
+        ``"process"`` or ``True``. Defaults to the number of CPUs.
+    :type lazy: bool, optional
+    :param lazy: Only applied to file names. If set to ``True``, only the
+        headers are read (as with ``headonly``) and the data of each trace is
+        read from its file the first time ``trace.data`` is accessed.
+        :meth:`~obspy.core.stream.Stream.select`,
+        :meth:`~obspy.core.stream.Stream.sort`,
+        :meth:`~obspy.core.stream.Stream.slice` and trimming without padding
+        work without loading any samples. Defaults to ``False``.
     :param kwargs: Additional keyword arguments passed to the underlying
         waveform reader method.
     :return: An ObsPy :class:`~obspy.core.stream.Stream` object.
@@ -186,6 +212,30 @@ def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
         >>> print(st)  # doctest: +ELLIPSIS
         1 Trace(s) in Stream:
         .RJOB..Z | 2005-08-31T02:34:00.000000Z - ... | 200.0 Hz, 2001 samples
+
+    (7) Reading many files in parallel.
+
+        Using the ``parallel`` parameter the files matching a wildcard
+        pattern are decoded by a pool of worker processes or threads.
+
+        >>> from obspy import read
+        >>> st = read("/path/to/*.mseed", parallel="process",
+        ...           workers=4)  # doctest: +SKIP
+
+    (8) Deferring the data loading.
+
+        With ``lazy=True`` traces can be picked by header information before
+        any data is decoded. Only the selected traces are read afterwards.
+
+        >>> from obspy import read
+        >>> st = read("/path/to/test.mseed", lazy=True)
+        >>> st = st.select(channel="BHZ").slice(st[0].stats.starttime,
+        ...                                     st[0].stats.starttime + 10)
+        >>> print(st)  # doctest: +ELLIPSIS
+        1 Trace(s) in Stream:
+        NL.HGN.00.BHZ | 2003-05-29T02:13:22.043400Z ... | 40.0 Hz, 401 samples
+        >>> st[0].data  # doctest: +ELLIPSIS
+        array([...], dtype=int32)
     """
     # add default parameters to kwargs so sub-modules may handle them
     kwargs['starttime'] = starttime
@@ -221,8 +271,14 @@ def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
     else:
         # some file name
         pathname = pathname_or_url
-        for file in sorted(glob(pathname)):
-            st.extend(_read(file, format, headonly, **kwargs).traces)
+        filenames = sorted(glob(pathname))
+        streams = _readFiles(filenames, format, headonly or lazy,
+                             parallel=parallel, workers=workers, **kwargs)
+        for filename, stream in zip(filenames, streams):
+            if lazy and not headonly:
+                _LazyFile(filename, stream, dtype=dtype,
+                          apply_calib=apply_calib, **kwargs)
+            st.extend(stream.traces)
         if len(st) == 0:
             # try to give more specific information why the stream is empty
             if has_magic(pathname) and not glob(pathname):
@@ -246,14 +302,16 @@ def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
         st._ltrim(starttime, nearest_sample=nearest_sample)
     if endtime:
         st._rtrim(endtime, nearest_sample=nearest_sample)
-    # convert to dtype if given
+    # convert to dtype if given (done on load for lazily read traces)
     if dtype:
         for tr in st:
-            tr.data = np.require(tr.data, dtype)
+            if '_lazy' not in tr.__dict__:
+                tr.data = np.require(tr.data, dtype)
     # applies calibration factor
     if apply_calib:
         for tr in st:
-            tr.data = tr.data * tr.stats.calib
+            if '_lazy' not in tr.__dict__:
+                tr.data = tr.data * tr.stats.calib
     return st
 
 
@@ -270,6 +328,147 @@ def _read(filename, format=None, headonly=False, **kwargs):
     return stream
 
 
+def _readWorker(args):
+    """
+    Reads a single file given as tuple of ``_read`` arguments.
+
+    Module level helper so it can be sent to worker processes.
+    """
+    filename, format, headonly, kwargs = args
+    return _read(filename, format, headonly, **kwargs)
+
+
+def _readFiles(filenames, format=None, headonly=False, parallel=False,
+               workers=None, **kwargs):
+    """
+    Reads multiple files, optionally distributed over a pool of workers.
+
+    :return: List of ObsPy Stream objects in the order of ``filenames``.
+    """
+    _check_parallel(parallel)
+    if not parallel or len(filenames) < 2:
+        return [_read(f, format, headonly, **kwargs) for f in filenames]
+    args = [(f, format, headonly, kwargs) for f in filenames]
+    with worker_pool(parallel, workers) as pool:
+        # map keeps the input order, so the result is deterministic
+        return list(pool.map(_readWorker, args))
+
+
+class _LazyFile(object):
+    """
+    Handle to a waveform file whose traces have been read header only.
+
+    Each trace of the given stream gets attached to this handle and its data
+    is decoded on first access of ``trace.data``. Decoding a file fills all
+    still pending traces of that file which are alive at that time, so every
+    file is decoded at most once per batch of accesses.
+    """
+    def __init__(self, filename, stream, dtype=None, apply_calib=False,
+                 **kwargs):
+        self.filename = filename
+        self.format = None
+        self.dtype = dtype
+        self.apply_calib = apply_calib
+        self.kwargs = kwargs
+        self._traces = []
+        for i, tr in enumerate(stream):
+            # some formats can't read headers only - keep their data
+            if len(tr.data) or not tr.stats.npts:
+                continue
+            self.format = tr.stats._format
+            del tr.__dict__['data']
+            tr.__dict__['_lazy'] = (self, i, tr.stats.starttime)
+            self.register(tr)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # weak references can't be pickled
+        state['_traces'] = []
+        return state
+
+    def __deepcopy__(self, memo):
+        # the handle is immutable, so deep copies of traces may share it
+        return self
+
+    def register(self, trace):
+        """
+        Registers a trace to be filled when this file gets decoded.
+        """
+        self._traces = [r for r in self._traces if r() is not None]
+        if not any(r() is trace for r in self._traces):
+            self._traces.append(weakref.ref(trace))
+
+    def load(self, trace):
+        """
+        Decodes the file and sets the data of all its pending traces.
+        """
+        stream = _read(self.filename, self.format, headonly=False,
+                       **self.kwargs)
+        traces = [trace] + [r() for r in self._traces]
+        self._traces = []
+        for tr in traces:
+            if tr is None or tr.__dict__.get('_lazy', [None])[0] is not self:
+                continue
+            _, index, starttime = tr.__dict__.pop('_lazy')
+            if index >= len(stream) or \
+                    stream[index].stats.starttime != starttime:
+                msg = "File %s changed since it has been read lazily."
+                raise Exception(msg % self.filename)
+            data = stream[index].data
+            # account for any trimming applied in the meantime
+            offset = int(compatibility.round_away(
+                (tr.stats.starttime - starttime) * tr.stats.sampling_rate))
+            data = data[offset:offset + tr.stats.npts]
+            if self.dtype:
+                data = np.require(data, self.dtype)
+            if self.apply_calib:
+                data = data * tr.stats.calib
+            tr.data = data
+
+
+def _processWorker(args):
+    """
+    Calls a Trace method for a single trace, used by
+    :meth:`~obspy.core.stream.Stream._processParallel`.
+    """
+    trace, method, args, kwargs = args
+    getattr(trace, method)(*args, **kwargs)
+    return trace
+
+
+class _TraceGroup(Trace):
+    """
+    Trace holding the data of several traces with equal sampling rate, number
+    of samples and data type as rows of a 2D array.
+
+    Processing methods of the Trace class called on this object run once for
+    the whole group, e.g. a filter gets designed only once. Afterwards
+    :meth:`_distribute` hands the rows and the processing information over to
+    the original traces.
+    """
+    def __init__(self, traces):
+        header = {'sampling_rate': traces[0].stats.sampling_rate}
+        super(_TraceGroup, self).__init__(header=header)
+        self._traces = traces
+        self.data = np.vstack([tr.data for tr in traces])
+
+    def __setattr__(self, key, value):
+        if key == 'data':
+            self.stats.npts = value.shape[-1]
+            return object.__setattr__(self, key, value)
+        return super(_TraceGroup, self).__setattr__(key, value)
+
+    def __len__(self):
+        return self.stats.npts
+
+    def _distribute(self):
+        processing = self.stats.get('processing', [])
+        for tr, data in zip(self._traces, self.data):
+            tr.data = data
+            for info in processing:
+                tr._addProcessingInfo(info)
+
+
 def _createExampleStream(headonly=False):
     """
     Create an example stream.
@@ -309,6 +508,109 @@ def _createExampleStream(headonly=False):
     return st
 
 
+def _mergeTraces(traces, method=0, fill_value=None, interpolation_samples=0):
+    """
+    Merges a list of traces with the same id into a single trace.
+
+    The traces have to be sorted by starttime and must have passed
+    :meth:`~obspy.core.stream.Stream._mergeChecks`. The result is the same as
+    adding up all traces one after another using
+    :meth:`~obspy.core.trace.Trace.__add__`, but the merged data array is
+    allocated only once and every trace is copied into it a single time.
+    Overlaps involving masked samples are left to
+    :meth:`~obspy.core.trace.Trace.__add__`.
+    """
+    first = traces[0]
+    if len(traces) == 1:
+        return first
+
+    def add(cur_trace, others):
+        for trace in others:
+            cur_trace = cur_trace.__add__(
+                trace, method, fill_value=fill_value, sanity_checks=False,
+                interpolation_samples=interpolation_samples)
+        return cur_trace
+
+    if method not in (0, 1) or (method == 1 and interpolation_samples < -1) \
+            or any(isinstance(tr.data, np.ma.masked_array) for tr in traces):
+        return add(first, traces[1:])
+    # first sweep: sample offsets of all traces relative to the first one,
+    # calculated exactly like Trace.__add__ does it for the growing trace
+    sr = first.stats.sampling_rate
+    delta = 1.0 / float(sr)
+    t0 = first.stats.starttime
+    npts = len(first)
+    offsets = []
+    for trace in traces[1:]:
+        endtime = t0 + (npts - 1) * delta
+        offset = npts - 1 + int(compatibility.round_away(
+            (trace.stats.starttime - endtime) * sr))
+        contained = offset < npts and endtime - trace.stats.endtime >= 0
+        offsets.append((offset, contained))
+        npts = max(npts, offset + len(trace))
+    # second sweep: fill the preallocated array
+    dtype = first.data.dtype
+    data = np.empty(npts, dtype=dtype)
+    mask = np.zeros(npts, dtype=np.bool_) if fill_value is None else None
+    end = len(first)
+    data[:end] = first.data
+
+    def fill(start, stop, right):
+        if mask is not None:
+            mask[start:stop] = True
+            return
+        value = fill_value
+        if value == 'latest':
+            value = data[end - 1]
+        elif value == 'interpolate':
+            value = (data[end - 1], right[0])
+        data[start:stop] = createEmptyDataChunk(stop - start, dtype, value)
+
+    for _i, (offset, contained) in enumerate(offsets):
+        right = traces[_i + 1].data
+        stop = offset + len(right)
+        if offset >= end:
+            # gap or exact fit
+            if offset > end:
+                fill(end, offset, right)
+            data[offset:stop] = right
+        elif offset < 0 or (contained and stop > end) or \
+                (mask is not None and mask[max(offset - 1, 0):end].any()):
+            # leave everything else to Trace.__add__
+            break
+        elif contained:
+            if method == 0 and not np.all(data[offset:stop] == right):
+                fill(offset, stop, right)
+        else:
+            # overlap
+            overlap = end - offset
+            if np.all(np.equal(data[offset:end], right[:overlap])):
+                data[end:stop] = right[overlap:]
+            elif method == 0:
+                fill(offset, end, right)
+                data[end:stop] = right[overlap:]
+            else:
+                left = data[offset - 1] if offset > 0 else data[0]
+                samples = overlap
+                if 0 <= interpolation_samples < overlap:
+                    samples = interpolation_samples
+                if samples < len(right):
+                    interpolation = np.linspace(left, right[samples],
+                                                samples + 2)
+                    data[offset:offset + samples] = \
+                        np.require(interpolation[1:-1], dtype)
+                    data[offset + samples:stop] = right[samples:]
+        end = max(end, stop)
+    else:
+        _i = len(offsets)
+    data = data[:end]
+    if mask is not None and mask[:end].any():
+        data = np.ma.masked_array(data, mask=mask[:end])
+    out = first.__class__(header=copy.deepcopy(first.stats))
+    out.data = data
+    return add(out, traces[_i + 1:])
+
+
 class Stream(object):
     """
     List like object of multiple ObsPy Trace objects.
@@ -1343,9 +1645,8 @@ class Stream(object):
             # get format specific entry point
             format_ep = ENTRY_POINTS['waveform_write'][format]
             # search writeFormat method for given entry point
-            writeFormat = load_entry_point(
-                format_ep.dist.key,
-                'obspy.plugin.waveform.%s' % (format_ep.name), 'writeFormat')
+            writeFormat = _getPluginFunction('waveform', format_ep,
+                                             'writeFormat')
         except (IndexError, ImportError, KeyError):
             msg = "Writing format \"%s\" is not supported. Supported types: %s"
             raise TypeError(msg % (format,
@@ -1357,10 +1658,16 @@ class Stream(object):
         """
         Cuts all traces of this Stream object to given start and end time.
 
-        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`, optional
-        :param starttime: Specify the start time.
-        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`, optional
-        :param endtime: Specify the end time.
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime` or
+            :class:`~obspy.core.utcdatetime.UTCDateTimeArray`, optional
+        :param starttime: Specify the start time. An
+            :class:`~obspy.core.utcdatetime.UTCDateTimeArray` specifies an
+            individual start time for each trace.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime` or
+            :class:`~obspy.core.utcdatetime.UTCDateTimeArray`, optional
+        :param endtime: Specify the end time. An
+            :class:`~obspy.core.utcdatetime.UTCDateTimeArray` specifies an
+            individual end time for each trace.
         :type pad: bool, optional
         :param pad: Gives the possibility to trim at time points outside the
             time frame of the original trace, filling the trace with the
@@ -1409,6 +1716,16 @@ class Stream(object):
         """
         if not self:
             return
+        if isinstance(starttime, UTCDateTimeArray) or \
+                isinstance(endtime, UTCDateTimeArray):
+            # individual time window for each trace
+            starttimes = self._perTraceTimes(starttime)
+            endtimes = self._perTraceTimes(endtime)
+            for trace, t1, t2 in zip(self.traces, starttimes, endtimes):
+                trace.trim(t1, t2, pad=pad, nearest_sample=nearest_sample,
+                           fill_value=fill_value)
+            self.traces = [_i for _i in self.traces if _i.stats.npts]
+            return self
         # select starttime/endtime fitting to a sample point of the first trace
         if nearest_sample:
             tr = self.traces[0]
@@ -1490,10 +1807,14 @@ class Stream(object):
         """
         Returns new Stream object cut to the given start- and endtime.
 
-        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`
-        :param starttime: Specify the start time of all traces.
-        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`
-        :param endtime: Specify the end time of all traces.
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime` or
+            :class:`~obspy.core.utcdatetime.UTCDateTimeArray`
+        :param starttime: Specify the start time of all traces or, as
+            :class:`~obspy.core.utcdatetime.UTCDateTimeArray`, of each trace.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime` or
+            :class:`~obspy.core.utcdatetime.UTCDateTimeArray`
+        :param endtime: Specify the end time of all traces or, as
+            :class:`~obspy.core.utcdatetime.UTCDateTimeArray`, of each trace.
         :type keep_empty_traces: bool, optional
         :param keep_empty_traces: Empty traces will be kept if set to ``True``.
             Defaults to ``False``.
@@ -1525,13 +1846,32 @@ class Stream(object):
         tmp = copy.copy(self)
         tmp.traces = []
         new = tmp.copy()
-        for trace in self:
-            sliced_trace = trace.slice(starttime=starttime, endtime=endtime)
+        starttimes = self._perTraceTimes(starttime)
+        endtimes = self._perTraceTimes(endtime)
+        for trace, t1, t2 in zip(self, starttimes, endtimes):
+            sliced_trace = trace.slice(starttime=t1, endtime=t2)
             if keep_empty_traces is False and not sliced_trace.stats.npts:
                 continue
             new.append(sliced_trace)
         return new
 
+    def _perTraceTimes(self, value):
+        """
+        Returns a list with one time per trace for the given start or end
+        time.
+
+        A :class:`~obspy.core.utcdatetime.UTCDateTimeArray` has to contain a
+        time for each trace of the stream, all other values are used for all
+        traces.
+        """
+        if not isinstance(value, UTCDateTimeArray):
+            return [value] * len(self.traces)
+        if len(value) != len(self.traces):
+            msg = "UTCDateTimeArray with %d times given for %d traces." % (
+                len(value), len(self.traces))
+            raise ValueError(msg)
+        return value.toUTCDateTimes()
+
     def select(self, network=None, station=None, location=None, channel=None,
                sampling_rate=None, npts=None, component=None, id=None):
         """
@@ -1644,6 +1984,64 @@ class Stream(object):
             trace.verify()
         return self
 
+    def _processBatched(self, method, *args, **kwargs):
+        """
+        Calls the given Trace method once per group of traces with equal
+        sampling rate, number of samples and data type.
+
+        The data of every group is stacked into a 2D array, see
+        :class:`~obspy.core.stream._TraceGroup`. Traces without data, with
+        masked data or without any partner are processed one by one.
+        """
+        groups = {}
+        singles = []
+        for tr in self:
+            data = tr.data
+            if len(data) == 0 or isinstance(data, np.ma.masked_array):
+                singles.append([tr])
+                continue
+            key = (tr.stats.sampling_rate, len(data), data.dtype)
+            groups.setdefault(key, []).append(tr)
+        for traces in singles + list(groups.values()):
+            if len(traces) == 1:
+                getattr(traces[0], method)(*args, **kwargs)
+                continue
+            group = _TraceGroup(traces)
+            getattr(group, method)(*args, **kwargs)
+            group._distribute()
+        return self
+
+    def _processParallel(self, method, parallel, workers, *args, **kwargs):
+        """
+        Calls the given Trace method for all traces, optionally distributed
+        over a pool of workers.
+
+        Every trace is processed by a single worker, so it gets the same
+        processing information as if processed serially. Data and header of
+        traces processed in another process are copied back into the
+        original Trace objects.
+        """
+        _check_parallel(parallel)
+        if not parallel or len(self.traces) < 2:
+            for tr in self:
+                getattr(tr, method)(*args, **kwargs)
+            return self
+        # decode lazily read data before handing out the traces
+        for tr in self:
+            tr.data
+        jobs = [(tr, method, args, kwargs) for tr in self]
+        with worker_pool(parallel, workers) as pool:
+            # map keeps the input order, so the result is deterministic
+            results = list(pool.map(_processWorker, jobs))
+        for tr, result in zip(self, results):
+            if result is not tr:
+                # update the header in place, references to it stay valid
+                for key in set(tr.stats.keys()) - set(result.stats.keys()):
+                    del tr.stats[key]
+                tr.stats.update(result.stats)
+                tr.data = result.data
+        return self
+
     def _mergeChecks(self):
         """
         Sanity checks for merging.
@@ -1655,21 +2053,22 @@ class Stream(object):
             # skip empty traces
             if len(trace) == 0:
                 continue
+            _id = trace.id
             # Check sampling rate.
-            sr.setdefault(trace.id, trace.stats.sampling_rate)
-            if trace.stats.sampling_rate != sr[trace.id]:
+            sr.setdefault(_id, trace.stats.sampling_rate)
+            if trace.stats.sampling_rate != sr[_id]:
                 msg = "Can't merge traces with same ids but differing " + \
                       "sampling rates!"
                 raise Exception(msg)
             # Check dtype.
-            dtype.setdefault(trace.id, trace.data.dtype)
-            if trace.data.dtype != dtype[trace.id]:
+            dtype.setdefault(_id, trace.data.dtype)
+            if trace.data.dtype != dtype[_id]:
                 msg = "Can't merge traces with same ids but differing " + \
                       "data types!"
                 raise Exception(msg)
             # Check calibration factor.
-            calib.setdefault(trace.id, trace.stats.calib)
-            if trace.stats.calib != calib[trace.id]:
+            calib.setdefault(_id, trace.stats.calib)
+            if trace.stats.calib != calib[_id]:
                 msg = "Can't merge traces with same ids but differing " + \
                       "calibration factors.!"
                 raise Exception(msg)
@@ -1729,33 +2128,18 @@ class Stream(object):
                         'starttime', 'endtime'])
         # build up dictionary with with lists of traces with same ids
         traces_dict = {}
-        # using pop() and try-except saves memory
-        try:
-            while True:
-                trace = self.traces.pop(0)
-                # skip empty traces
-                if len(trace) == 0:
-                    continue
-                _id = trace.getId()
-                if _id not in traces_dict:
-                    traces_dict[_id] = [trace]
-                else:
-                    traces_dict[_id].append(trace)
-        except IndexError:
-            pass
+        for trace in self.traces:
+            # skip empty traces
+            if len(trace) == 0:
+                continue
+            traces_dict.setdefault(trace.getId(), []).append(trace)
         # clear traces of current stream
         self.traces = []
         # loop through ids
         for _id in list(traces_dict.keys()):
-            cur_trace = traces_dict[_id].pop(0)
-            # loop through traces of same id
-            for _i in range(len(traces_dict[_id])):
-                trace = traces_dict[_id].pop(0)
-                # disable sanity checks because there are already done
-                cur_trace = cur_trace.__add__(
-                    trace, method, fill_value=fill_value, sanity_checks=False,
-                    interpolation_samples=interpolation_samples)
-            self.traces.append(cur_trace)
+            self.traces.append(_mergeTraces(
+                traces_dict.pop(_id), method, fill_value=fill_value,
+                interpolation_samples=interpolation_samples))
 
         # trying to restore order, newly created traces are placed at
         # start
@@ -1763,7 +2147,8 @@ class Stream(object):
         return self
 
     def simulate(self, paz_remove=None, paz_simulate=None,
-                 remove_sensitivity=True, simulate_sensitivity=True, **kwargs):
+                 remove_sensitivity=True, simulate_sensitivity=True,
+                 batch=False, parallel=False, workers=None, **kwargs):
         """
         Correct for instrument response / Simulate new instrument response.
 
@@ -1790,6 +2175,20 @@ class Stream(object):
             ``paz_simulate['sensitivity']`` to simulate overall sensitivity of
             new instrument (seismometer/digitizer) during instrument
             simulation.
+        :type batch: bool, optional
+        :param batch: If ``True``, traces with equal sampling rate, number of
+            samples and data type are corrected together and the frequency
+            responses are computed only once per group. The results are the
+            same. Not used together with ``paz_remove='self'``, ``seedresp``
+            or ``shsim``, which depend on the single trace or are not exactly
+            reproducible for several traces at once.
+        :type parallel: bool, str or pool-like object, optional
+        :param parallel: Processes the traces in a pool of workers, either
+            ``"thread"``, ``"process"`` or a pool-like object, see
+            :func:`~obspy.core.util.misc.worker_pool`. Defaults to ``False``.
+            Not used if the traces are processed with ``batch``.
+        :type workers: int, optional
+        :param workers: Number of workers used if a new pool is created.
 
         This function corrects for the original instrument response given by
         ``paz_remove`` and/or simulates a new instrument response given by
@@ -1858,13 +2257,19 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             st.simulate(paz_remove=paz_sts2, paz_simulate=paz_1hz)
             st.plot()
         """
-        for tr in self:
-            tr.simulate(paz_remove=paz_remove, paz_simulate=paz_simulate,
-                        remove_sensitivity=remove_sensitivity,
-                        simulate_sensitivity=simulate_sensitivity, **kwargs)
-        return self
+        if batch and paz_remove != 'self' and 'seedresp' not in kwargs \
+                and not kwargs.get('shsim'):
+            return self._processBatched(
+                'simulate', paz_remove=paz_remove, paz_simulate=paz_simulate,
+                remove_sensitivity=remove_sensitivity,
+                simulate_sensitivity=simulate_sensitivity, **kwargs)
+        return self._processParallel(
+            'simulate', parallel, workers, paz_remove=paz_remove,
+            paz_simulate=paz_simulate, remove_sensitivity=remove_sensitivity,
+            simulate_sensitivity=simulate_sensitivity, **kwargs)
 
-    def filter(self, type, **options):
+    def filter(self, type, batch=False, parallel=False, workers=None,
+               **options):
         """
         Filters the data of all traces in the Stream.
 
@@ -1872,6 +2277,18 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         :param type: String that specifies which filter is applied (e.g.
             ``"bandpass"``). See the `Supported Filter`_ section below for
             further details.
+        :type batch: bool, optional
+        :param batch: If ``True``, traces with equal sampling rate, number of
+            samples and data type are filtered together as one 2D array, so
+            that the filter is designed only once per group. The results are
+            the same. Only used for the Butterworth and Cheby2 filters.
+        :type parallel: bool, str or pool-like object, optional
+        :param parallel: Processes the traces in a pool of workers, either
+            ``"thread"``, ``"process"`` or a pool-like object, see
+            :func:`~obspy.core.util.misc.worker_pool`. Defaults to ``False``.
+            Not used if the traces are processed with ``batch``.
+        :type workers: int, optional
+        :param workers: Number of workers used if a new pool is created.
         :param options: Necessary keyword arguments for the respective filter
             that will be passed on. (e.g. ``freqmin=1.0``, ``freqmax=20.0`` for
             ``"bandpass"``)
@@ -1924,17 +2341,24 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             st.filter("highpass", freq=1.0)
             st.plot()
         """
-        for tr in self:
-            tr.filter(type, **options)
-        return self
+        if batch and type.lower() in _BATCH_FILTERS:
+            return self._processBatched('filter', type, **options)
+        return self._processParallel('filter', parallel, workers, type,
+                                     **options)
 
-    def trigger(self, type, **options):
+    def trigger(self, type, parallel=False, workers=None, **options):
         """
         Runs a triggering algorithm on all traces in the stream.
 
         :param type: String that specifies which trigger is applied (e.g.
             ``'recstalta'``). See the `Supported Trigger`_ section below for
             further details.
+        :type parallel: bool, str or pool-like object, optional
+        :param parallel: Processes the traces in a pool of workers, either
+            ``"thread"``, ``"process"`` or a pool-like object, see
+            :func:`~obspy.core.util.misc.worker_pool`. Defaults to ``False``.
+        :type workers: int, optional
+        :param workers: Number of workers used if a new pool is created.
         :param options: Necessary keyword arguments for the respective
             trigger that will be passed on. (e.g. ``sta=3``, ``lta=10``)
             Arguments ``sta`` and ``lta`` (seconds) will be mapped to ``nsta``
@@ -1994,12 +2418,11 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             st.trigger('recstalta', sta=1, lta=4)
             st.plot()
         """
-        for tr in self:
-            tr.trigger(type, **options)
-        return self
+        return self._processParallel('trigger', parallel, workers, type,
+                                     **options)
 
     def resample(self, sampling_rate, window='hanning', no_filter=True,
-                 strict_length=False):
+                 strict_length=False, parallel=False, workers=None):
         """
         Resample data in all traces of stream using Fourier method.
 
@@ -2015,6 +2438,12 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         :type strict_length: bool, optional
         :param strict_length: Leave traces unchanged for which endtime of trace
             would change. Defaults to ``False``.
+        :type parallel: bool, str or pool-like object, optional
+        :param parallel: Processes the traces in a pool of workers, either
+            ``"thread"``, ``"process"`` or a pool-like object, see
+            :func:`~obspy.core.util.misc.worker_pool`. Defaults to ``False``.
+        :type workers: int, optional
+        :param workers: Number of workers used if a new pool is created.
 
         .. note::
 
@@ -2044,12 +2473,13 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         BW.RJOB..EHN | 2009-08-24T00:20:03.000000Z ... | 10.0 Hz, 300 samples
         BW.RJOB..EHE | 2009-08-24T00:20:03.000000Z ... | 10.0 Hz, 300 samples
         """
-        for tr in self:
-            tr.resample(sampling_rate, window=native_str(window),
-                        no_filter=no_filter, strict_length=strict_length)
-        return self
+        return self._processParallel(
+            'resample', parallel, workers, sampling_rate,
+            window=native_str(window), no_filter=no_filter,
+            strict_length=strict_length)
 
-    def decimate(self, factor, no_filter=False, strict_length=False):
+    def decimate(self, factor, no_filter=False, strict_length=False,
+                 parallel=False, workers=None):
         """
         Downsample data in all traces of stream by an integer factor.
 
@@ -2062,6 +2492,12 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         :type strict_length: bool, optional
         :param strict_length: Leave traces unchanged for which endtime of trace
             would change. Defaults to ``False``.
+        :type parallel: bool, str or pool-like object, optional
+        :param parallel: Processes the traces in a pool of workers, either
+            ``"thread"``, ``"process"`` or a pool-like object, see
+            :func:`~obspy.core.util.misc.worker_pool`. Defaults to ``False``.
+        :type workers: int, optional
+        :param workers: Number of workers used if a new pool is created.
 
         Currently a simple integer decimation is implemented.
         Only every decimation_factor-th sample remains in the trace, all other
@@ -2103,10 +2539,9 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         >>> tr.data
         array([0, 4, 8])
         """
-        for tr in self:
-            tr.decimate(factor, no_filter=no_filter,
-                        strict_length=strict_length)
-        return self
+        return self._processParallel('decimate', parallel, workers, factor,
+                                     no_filter=no_filter,
+                                     strict_length=strict_length)
 
     def max(self):
         """
@@ -2184,7 +2619,8 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         return self
 
     @raiseIfMasked
-    def detrend(self, type='simple'):
+    def detrend(self, type='simple', batch=False, parallel=False,
+                workers=None):
         """
         Method to remove a linear trend from all traces.
 
@@ -2192,6 +2628,18 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             optional
         :param type: Method to use for detrending. Defaults to ``'simple'``.
             See the `Supported Methods`_ section below for further details.
+        :type batch: bool, optional
+        :param batch: If ``True``, traces with equal sampling rate, number of
+            samples and data type are detrended together as one 2D array.
+            The results are the same. Not used for ``'linear'``, as the least
+            squares fit for several traces at once differs in the last digits.
+        :type parallel: bool, str or pool-like object, optional
+        :param parallel: Processes the traces in a pool of workers, either
+            ``"thread"``, ``"process"`` or a pool-like object, see
+            :func:`~obspy.core.util.misc.worker_pool`. Defaults to ``False``.
+            Not used if the traces are processed with ``batch``.
+        :type workers: int, optional
+        :param workers: Number of workers used if a new pool is created.
 
         .. note::
 
@@ -2215,16 +2663,19 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         ``'constant'`` or ``'demean'``
             Mean of data is subtracted (uses :func:`scipy.signal.detrend`).
         """
-        for tr in self:
-            tr.detrend(type=type)
-        return self
+        if batch and type.lower() != 'linear':
+            return self._processBatched('detrend', type=type)
+        return self._processParallel('detrend', parallel, workers, type=type)
 
     def taper(self, *args, **kwargs):
         """
         Method to taper all Traces in Stream.
 
         For details see the corresponding :meth:`~obspy.core.trace.Trace.taper`
-        method of :class:`~obspy.core.trace.Trace`.
+        method of :class:`~obspy.core.trace.Trace`. If the keyword ``batch``
+        is set to ``True``, traces with equal sampling rate, number of samples
+        and data type are tapered together and the taper window is computed
+        only once per group.
 
         .. note::
 
@@ -2233,6 +2684,8 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             original data, use :meth:`~obspy.core.stream.Stream.copy` to create
             a copy of your stream object.
         """
+        if kwargs.pop('batch', False):
+            return self._processBatched('taper', *args, **kwargs)
         for tr in self:
             tr.taper(*args, **kwargs)
         return self
@@ -2448,10 +2901,15 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
                     comp.stats.inclination = inclination
         return self
 
-    def copy(self):
+    def copy(self, copy_on_write=False):
         """
         Returns a deepcopy of the Stream object.
 
+        :type copy_on_write: bool, optional
+        :param copy_on_write: If ``True``, the data arrays are shared with
+            the copy until a trace gets new data, see the ``copy_on_write``
+            option of :meth:`~obspy.core.trace.Trace.copy`. Defaults to
+            ``False``.
         :rtype: :class:`~obspy.core.stream.Stream`
         :return: Copy of current stream.
 
@@ -2482,8 +2940,26 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             True
             >>> st == st3
             True
+
+        3. Filtering copies of a stream in different frequency bands without
+           copying the raw data first:
+
+            >>> bands = [(0.5, 2.0), (2.0, 8.0)]
+            >>> filtered = [st.copy(copy_on_write=True).filter(
+            ...     "bandpass", freqmin=fmin, freqmax=fmax)
+            ...     for fmin, fmax in bands]
+            >>> st == st2
+            True
         """
-        return copy.deepcopy(self)
+        if not copy_on_write:
+            return copy.deepcopy(self)
+        memo = {}
+        for tr in self.traces:
+            tr._shareData(memo)
+        new = copy.deepcopy(self, memo)
+        for tr, tr2 in zip(self.traces, new.traces):
+            tr2._shareDataWith(tr)
+        return new
 
     def clear(self):
         """
@@ -2692,7 +3168,9 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
 
         For details see the corresponding
         :meth:`~obspy.core.trace.Trace.remove_response` method of
-        :class:`~obspy.core.trace.Trace`.
+        :class:`~obspy.core.trace.Trace`. The traces can be processed in a
+        pool of workers using the keywords ``parallel`` and ``workers``, see
+        :meth:`~obspy.core.stream.Stream.filter`.
 
         >>> from obspy import read
         >>> st = read()
@@ -2725,9 +3203,10 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             original data, use :meth:`~obspy.core.stream.Stream.copy` to create
             a copy of your stream object.
         """
-        for tr in self:
-            tr.remove_response(*args, **kwargs)
-        return self
+        parallel = kwargs.pop('parallel', False)
+        workers = kwargs.pop('workers', None)
+        return self._processParallel('remove_response', parallel, workers,
+                                     *args, **kwargs)
 
 
 def isPickle(filename):  # @UnusedVariable
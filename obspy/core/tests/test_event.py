@@ -421,6 +421,22 @@ class CatalogTestCase(unittest.TestCase):
             self.assertTrue(all(event in cat_smaller
                                 for event in cat_bigger_inverse))
 
+    def test_filterHistoricalTimes(self):
+        """
+        Filtering by time works for origin times outside the range of
+        int64 nanoseconds (before 1677 or after 2262).
+        """
+        cat = Catalog(events=[
+            Event(origins=[Origin(time=UTCDateTime(1600, 2, 19))]),
+            Event(origins=[Origin(time=UTCDateTime(2012, 4, 4))]),
+            Event(origins=[Origin()])])
+        self.assertEqual(len(cat.filter('time > 2000-01-01')), 1)
+        self.assertEqual(len(cat.filter('time < 2000-01-01')), 2)
+        self.assertEqual(len(cat.filter('time >= 1600-02-19')), 2)
+        self.assertEqual(len(cat.filter('time < 1600-02-19')), 1)
+        self.assertEqual(len(cat.filter('time > 1500-01-01',
+                                        'time < 1700-01-01')), 1)
+
     def test_catalog_resource_id(self):
         """
         See #662
@@ -225,6 +225,69 @@ class StatsTestCase(unittest.TestCase):
         self.assertEqual(ad, adict)
         self.assertEqual(adict, ad)
 
+    def test_slots(self):
+        """
+        Default attributes are kept in slots, only custom headers end up in
+        the instance dictionary.
+        """
+        stats = Stats({'network': 'BW', 'npts': 10, 'test': 1})
+        self.assertEqual(stats.__dict__, {'test': 1})
+        self.assertEqual(len(stats), 11)
+        self.assertEqual(sorted(stats), sorted(list(Stats.defaults) +
+                                               ['test']))
+        self.assertTrue('endtime' in stats)
+        self.assertTrue('test' in stats)
+        self.assertFalse('foo' in stats)
+        # deleting a default attribute resets it to its default value
+        del stats.network
+        del stats['npts']
+        self.assertEqual(stats.network, '')
+        self.assertEqual(stats.npts, 0)
+        del stats.test
+        self.assertFalse('test' in stats)
+        self.assertRaises(KeyError, stats.__delitem__, 'test')
+
+    def test_derivedAttributes(self):
+        """
+        delta and endtime are derived on access and follow all changes of
+        sampling_rate, npts and starttime.
+        """
+        stats = Stats({'sampling_rate': 10.0, 'npts': 11})
+        self.assertEqual(stats.endtime, UTCDateTime(1))
+        stats.npts = 21
+        self.assertEqual(stats.endtime, UTCDateTime(2))
+        stats.starttime = UTCDateTime(10)
+        self.assertEqual(stats.endtime, UTCDateTime(12))
+        stats.delta = 0.5
+        self.assertEqual(stats.sampling_rate, 2.0)
+        self.assertEqual(stats.endtime, UTCDateTime(20))
+        stats.update({'sampling_rate': 1.0})
+        self.assertEqual(stats.delta, 1.0)
+        self.assertEqual(stats.endtime, UTCDateTime(30))
+        stats.sampling_rate = 0
+        self.assertEqual(stats.delta, 0)
+        self.assertEqual(stats.endtime, UTCDateTime(10))
+        # copies are independent of the original
+        stats2 = copy.deepcopy(stats)
+        stats2.npts = 0
+        stats2.starttime += 1
+        self.assertEqual(stats.npts, 21)
+        self.assertEqual(stats.starttime, UTCDateTime(10))
+        self.assertEqual(stats2.endtime, UTCDateTime(11))
+
+    def test_unpickleDictState(self):
+        """
+        Stats objects pickled with a plain dictionary state (as done by
+        older versions) can still be restored.
+        """
+        stats = Stats({'sampling_rate': 20.0, 'npts': 21, 'test': 1})
+        state = dict(stats)
+        stats2 = Stats.__new__(Stats)
+        stats2.__setstate__(state)
+        self.assertEqual(stats2, stats)
+        self.assertEqual(stats2.endtime, UTCDateTime(1))
+        self.assertEqual(stats2.__dict__, {'test': 1})
+
 
 def suite():
     return unittest.makeSuite(StatsTestCase, 'test')
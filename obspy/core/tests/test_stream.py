@@ -7,6 +7,7 @@ from future.builtins import open
 from future.builtins import str  # NOQA
 from copy import deepcopy
 from obspy import UTCDateTime, Stream, Trace, read
+from obspy.core.utcdatetime import UTCDateTimeArray
 from obspy.core.stream import writePickle, readPickle, isPickle
 from obspy.core.util.attribdict import AttribDict
 from obspy.core.util.base import NamedTemporaryFile, getMatplotlibVersion
@@ -431,6 +432,32 @@ class StreamTestCase(unittest.TestCase):
         self.assertEqual(st2.test, 1)
         self.assertEqual(st2.muh, "Muh")
 
+    def test_sliceAndTrimUTCDateTimeArray(self):
+        """
+        An UTCDateTimeArray cuts each trace to its own time window.
+        """
+        st = read()
+        t = st[0].stats.starttime
+        starttimes = UTCDateTimeArray([t + 1, t + 2, t + 3])
+        st2 = st.slice(starttimes, t + 10)
+        self.assertEqual([tr.stats.starttime for tr in st2], list(starttimes))
+        self.assertEqual([tr.stats.npts for tr in st2], [901, 801, 701])
+        # equal to slicing each trace on its own
+        for tr, tr2, starttime in zip(st, st2, starttimes):
+            self.assertEqual(tr.slice(starttime, t + 10), tr2)
+        # empty traces are removed
+        starttimes = UTCDateTimeArray([t + 1, t + 40, t + 3])
+        endtimes = UTCDateTimeArray([t + 5, t + 50, t + 10])
+        st2 = st.slice(starttimes, endtimes)
+        self.assertEqual([tr.stats.npts for tr in st2], [401, 701])
+        st2 = st.slice(starttimes, endtimes, keep_empty_traces=True)
+        self.assertEqual([tr.stats.npts for tr in st2], [401, 0, 701])
+        st.trim(endtime=endtimes)
+        self.assertEqual([tr.stats.npts for tr in st], [501, 3000, 1001])
+        # number of times has to fit to the number of traces
+        self.assertRaises(ValueError, st.slice, starttimes[:2])
+        self.assertRaises(ValueError, st.trim, starttimes[:2])
+
     def test_cutout(self):
         """
         Test cutout method of the Stream object. Compare against equivalent
@@ -1747,6 +1774,79 @@ class StreamTestCase(unittest.TestCase):
             self.assertRaises(UserWarning, read, '/path/to/slist_float.ascii',
                               headonly=True, starttime=0, endtime=1)
 
+    def test_readParallel(self):
+        """
+        Reading multiple files in parallel returns the same stream in the same
+        order as serial reading.
+        """
+        path = os.path.dirname(__file__)
+        filename = os.path.join(path, 'data', '*_float.ascii')
+        st = read(filename)
+        self.assertEqual(len(st), 2)
+        for parallel in ('thread', 'process', True):
+            st2 = read(filename, parallel=parallel, workers=2)
+            self.assertEqual(st, st2)
+        # an existing pool is used as is and stays open
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(2)
+        try:
+            self.assertEqual(st, read(filename, parallel=pool))
+            self.assertEqual(st, read(filename, parallel=pool))
+        finally:
+            pool.close()
+            pool.join()
+        # keyword arguments are handed to the workers
+        st2 = read(filename, parallel='process', headonly=True)
+        self.assertEqual([tr.stats.npts for tr in st2],
+                         [tr.stats.npts for tr in st])
+        self.assertFalse(any(len(tr.data) for tr in st2))
+        self.assertRaises(ValueError, read, filename, parallel='XXX')
+        # invalid values are rejected also if only a single file matches
+        single = os.path.join(path, 'data', 'slist_float.ascii')
+        self.assertRaises(ValueError, read, single, parallel='XXX')
+
+    def test_readLazy(self):
+        """
+        Lazily read traces load their data on first access only.
+        """
+        path = os.path.dirname(__file__)
+        filename = os.path.join(path, os.pardir, os.pardir, 'mseed', 'tests',
+                                'data', '[gt]*.mseed')
+        st = read(filename)
+        lazy = read(filename, lazy=True)
+        self.assertEqual(len(st), len(lazy))
+        self.assertTrue(all('_lazy' in tr.__dict__ for tr in lazy))
+        # header only operations do not load any data
+        str(lazy)
+        lazy.sort(keys=['npts'])
+        lazy.sort()
+        sel = lazy.select(channel='EHE')
+        t = st[0].stats.starttime
+        sliced = lazy.slice(t + 1, t + 3)
+        self.assertTrue(all('_lazy' in tr.__dict__ for tr in lazy))
+        self.assertTrue(all('_lazy' in tr.__dict__ for tr in sel))
+        self.assertTrue(all('_lazy' in tr.__dict__ for tr in sliced))
+        self.assertEqual(len(sliced[0]), sliced[0].stats.npts)
+        # data access decodes it
+        self.assertEqual(sliced, st.slice(t + 1, t + 3))
+        self.assertEqual(lazy, st)
+        self.assertFalse(any('_lazy' in tr.__dict__ for tr in lazy))
+        # copies and pickled streams still load their data
+        self.assertEqual(read(filename, lazy=True).copy(), st)
+        lazy = pickle.loads(pickle.dumps(read(filename, lazy=True)))
+        self.assertEqual(lazy, st)
+        # read options are applied when loading
+        lazy = read(filename, lazy=True, starttime=t + 1, endtime=t + 3,
+                    dtype='float32')
+        self.assertTrue(all('_lazy' in tr.__dict__ for tr in lazy))
+        st2 = read(filename, starttime=t + 1, endtime=t + 3, dtype='float32')
+        self.assertEqual(lazy, st2)
+        # setting data drops the pending load
+        lazy = read(filename, lazy=True)
+        lazy[0].data = np.arange(5)
+        self.assertEqual(lazy[0].stats.npts, 5)
+        self.assertFalse('_lazy' in lazy[0].__dict__)
+
     def test_copy(self):
         """
         Testing the copy method of the Stream object.
@@ -1760,6 +1860,39 @@ class StreamTestCase(unittest.TestCase):
         self.assertTrue(st.traces[0] == st2.traces[0])
         self.assertFalse(st.traces[0] is st2.traces[0])
 
+    def test_copyOnWrite(self):
+        """
+        Testing the copy method of the Stream object with copy_on_write=True.
+        """
+        st = read()
+        raw = [tr.data.copy() for tr in st]
+        st2 = st.copy(copy_on_write=True)
+        self.assertEqual(st2, st)
+        for tr, tr2 in zip(st, st2):
+            self.assertFalse(tr2 is tr)
+            self.assertTrue(tr2.data is tr.data)
+        st2.filter("bandpass", freqmin=1.0, freqmax=5.0)
+        st2.merge()
+        st2.trim(st[0].stats.starttime + 1, st[0].stats.endtime - 1)
+        for tr, data in zip(st, raw):
+            np.testing.assert_array_equal(tr.data, data)
+            self.assertTrue(tr.data.flags.writeable)
+        # trimmed copies are not affected by in place changes of the original
+        st2 = st.copy(copy_on_write=True)
+        st2.trim(st[0].stats.starttime + 1, st[0].stats.endtime - 1)
+        trimmed = [tr.data.copy() for tr in st2]
+        for tr in st:
+            tr.writable().data *= 2
+        for tr, data in zip(st2, trimmed):
+            np.testing.assert_array_equal(tr.data, data)
+        for tr in st:
+            tr.data /= 2
+        self.assertEqual(st.copy(copy_on_write=True).filter(
+            "lowpass", freq=2.0), st.copy().filter("lowpass", freq=2.0))
+        # a dropped copy leaves the stream writeable
+        st.copy(copy_on_write=True)
+        st[0].data[:5] = 0
+
     def test_merge_with_empty_trace(self):
         """
         Merging a stream containing a empty trace with a differing sampling
@@ -1775,6 +1908,119 @@ class StreamTestCase(unittest.TestCase):
         st.merge(fill_value='interpolate')
         self.assertEqual(len(st), 1)
 
+    def test_mergeManyFragments(self):
+        """
+        Merging many fragments at once has to give the same result as adding
+        them up one after another.
+        """
+        np.random.seed(815)
+        base = np.random.randint(0, 5, 500).astype('int32')
+        traces = []
+        for _i in range(200):
+            start = np.random.randint(0, 450)
+            npts = np.random.randint(1, 50)
+            if _i % 2:
+                data = base[start:start + npts].copy()
+            else:
+                data = np.random.randint(0, 5, npts).astype('int32')
+            # some fragments are off the sampling grid
+            if _i % 7 == 0:
+                start += 0.3
+            tr = Trace(data=data)
+            tr.stats.starttime += start
+            traces.append(tr)
+        traces.sort(key=lambda x: (x.stats.starttime, x.stats.endtime))
+        for kwargs in [{}, {'fill_value': 0}, {'fill_value': 'latest'},
+                       {'fill_value': 'interpolate'},
+                       {'method': 1}, {'method': 1, 'fill_value': 0},
+                       {'method': 1, 'interpolation_samples': 3},
+                       {'method': 1, 'interpolation_samples': -1,
+                        'fill_value': 'interpolate'}]:
+            method = kwargs.get('method', 0)
+            expected = traces[0]
+            for tr in traces[1:]:
+                expected = expected.__add__(
+                    tr, method, fill_value=kwargs.get('fill_value'),
+                    interpolation_samples=kwargs.get(
+                        'interpolation_samples', 0))
+            st = Stream([tr.copy() for tr in traces[::-1]])
+            st.merge(**kwargs)
+            self.assertEqual(len(st), 1)
+            self.assertEqual(st[0].stats, expected.stats)
+            self.assertEqual(type(st[0].data), type(expected.data))
+            np.testing.assert_array_equal(np.ma.getmaskarray(st[0].data),
+                                          np.ma.getmaskarray(expected.data))
+            np.testing.assert_array_equal(st[0].data, expected.data)
+
+    def test_batchProcessing(self):
+        """
+        Processing traces of equal sampling rate and length together has to
+        give the same results as processing them one by one.
+        """
+        paz_sts2 = {'poles': [-0.037004 + 0.037016j, -0.037004 - 0.037016j,
+                              -251.33 + 0j, -131.04 - 467.29j,
+                              -131.04 + 467.29j],
+                    'zeros': [0j, 0j], 'gain': 60077000.0,
+                    'sensitivity': 2516778400.0}
+        np.random.seed(815)
+        st = Stream()
+        for _i in range(8):
+            dtype = ['int32', 'float64'][_i % 2]
+            npts = 1000 if _i < 6 else 900 + _i
+            data = (np.random.randn(npts) * 1e3).astype(dtype)
+            st.append(Trace(data=data, header={'station': 'S%i' % _i}))
+        st[0].stats.sampling_rate = 50.0
+        calls = [('filter', ('bandpass',), {'freqmin': 0.1, 'freqmax': 0.3}),
+                 ('filter', ('lowpass',), {'freq': 0.2, 'zerophase': True}),
+                 ('detrend', (), {'type': 'simple'}),
+                 ('detrend', (), {'type': 'demean'}),
+                 ('taper', (), {'max_percentage': 0.05, 'type': 'hann'}),
+                 ('simulate', (), {'paz_remove': paz_sts2}),
+                 ('simulate', (), {'paz_remove': paz_sts2,
+                                   'pre_filt': (0.01, 0.02, 0.3, 0.4)})]
+        for method, args, kwargs in calls:
+            st1 = st.copy()
+            st2 = st.copy()
+            getattr(st1, method)(*args, **kwargs)
+            getattr(st2, method)(*args, batch=True, **kwargs)
+            for tr1, tr2 in zip(st1, st2):
+                self.assertEqual(tr1.stats, tr2.stats)
+                self.assertEqual(tr1.data.dtype, tr2.data.dtype)
+                np.testing.assert_array_equal(tr1.data, tr2.data)
+
+    def test_processParallel(self):
+        """
+        Processing the traces in a pool of workers gives the same traces and
+        processing information as serial processing.
+        """
+        st = read()
+        st += read()
+        for tr in st[3:]:
+            tr.stats.station = 'XXXX'
+        calls = [('filter', ('bandpass',), {'freqmin': 1.0, 'freqmax': 10.0}),
+                 ('detrend', ('linear',), {}),
+                 ('decimate', (2,), {}),
+                 ('trigger', ('recstalta',), {'sta': 1, 'lta': 4}),
+                 ('remove_response', (), {'output': 'DISP'})]
+        for parallel in ('thread', 'process'):
+            st1 = st.copy()
+            st2 = st.copy()
+            traces = st2.traces[:]
+            headers = [tr.stats for tr in st2]
+            for method, args, kwargs in calls:
+                getattr(st1, method)(*args, **kwargs)
+                getattr(st2, method)(*args, parallel=parallel, workers=2,
+                                     **kwargs)
+            self.assertEqual(st1, st2)
+            # Trace and Stats objects are modified in place
+            for tr1, tr2, stats in zip(traces, st2, headers):
+                self.assertTrue(tr1 is tr2)
+                self.assertTrue(tr2.stats is stats)
+            self.assertEqual([tr.stats.processing for tr in st1],
+                             [stats.processing for stats in headers])
+        # invalid values are rejected also for a single trace
+        self.assertRaises(ValueError, st[:1].detrend, parallel='XXX')
+
     def test_rotate(self):
         """
         Testing the rotate method.
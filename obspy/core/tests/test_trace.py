@@ -7,12 +7,15 @@ from copy import deepcopy
 from numpy.ma import is_masked
 from obspy import UTCDateTime, Trace, read, Stream, __version__
 from obspy.core import Stats
+from obspy.core.trace import ProcessingInfo, noProcessingInfo, \
+    setProcessingInfo
 from obspy.core.compatibility import mock
 from obspy.core.util.base import getMatplotlibVersion
 from obspy.core.util.decorator import skipIf
 from obspy.xseed import Parser
 import math
 import numpy as np
+import pickle
 import unittest
 import warnings
 import os
@@ -1358,6 +1361,18 @@ class TraceTestCase(unittest.TestCase):
         tr.data[30:40] = np.ma.masked
         tm = tr.times()
         self.assertTrue(np.alltrue(tr.data.mask == tm.mask))
+        # absolute times
+        tm = tr.times("timestamp")
+        self.assertTrue(np.alltrue(tr.data.mask == tm.mask))
+        self.assertEqual(tm[0], start.timestamp)
+        self.assertAlmostEqual(tm[-1], tr.stats.endtime.timestamp)
+        tm = tr.times("utcdatetime")
+        self.assertEqual(len(tm), 100)
+        self.assertEqual(tm[0], start)
+        self.assertEqual(tm[-1], tr.stats.endtime)
+        self.assertEqual(list(tm[::10]), [start + _i * 0.5
+                                          for _i in range(10)])
+        self.assertRaises(ValueError, tr.times, "matplotlib")
 
     def test_modulo_operation(self):
         """
@@ -1706,6 +1721,129 @@ class TraceTestCase(unittest.TestCase):
         self.assertTrue("taper" in pr[9])
         self.assertTrue("normalize" in pr[10])
 
+    def test_switchProcessingInfo(self):
+        """
+        Tests switching off the processing information and the lazily
+        formatted processing entries.
+        """
+        tr = Trace(data=np.arange(20, dtype=np.float64) ** 2)
+        with noProcessingInfo():
+            tr.detrend()
+            tr.taper(max_percentage=0.05)
+        self.assertFalse("processing" in tr.stats)
+        previous = setProcessingInfo(False)
+        try:
+            self.assertTrue(previous)
+            tr.normalize()
+            self.assertFalse("processing" in tr.stats)
+        finally:
+            self.assertFalse(setProcessingInfo(previous))
+        tr.decimate(2, no_filter=True)
+        info = tr.stats.processing[0]
+        self.assertTrue(isinstance(info, ProcessingInfo))
+        expected = ("ObsPy %s: decimate(factor=2::no_filter=True::"
+                    "strict_length=False)" % __version__)
+        self.assertEqual(str(info), expected)
+        self.assertEqual(info, expected)
+        self.assertEqual(repr(info), repr(expected))
+        self.assertTrue(info.startswith("ObsPy"))
+        self.assertTrue("factor=2" in info)
+        # copies share the immutable entries, pickles store plain strings
+        self.assertTrue(deepcopy(tr).stats.processing[0] is info)
+        tr2 = pickle.loads(pickle.dumps(tr, protocol=0))
+        self.assertEqual(tr2.stats.processing, [expected])
+        self.assertEqual(tr2, tr)
+
+    def test_processingInfoSnapshot(self):
+        """
+        Mutable arguments are recorded as they were at call time and are
+        not referenced by the processing entry.
+        """
+        tr = Trace(data=np.arange(200, dtype=np.float64))
+        paz = {'poles': [-4.21 + 4.66j, -4.21 - 4.66j], 'zeros': [0j],
+               'gain': 1.0, 'sensitivity': 1.0}
+        tr.simulate(paz_remove=paz)
+        paz['gain'] = 999.0
+        info = tr.stats.processing[-1]
+        self.assertTrue("'gain': 1.0" in info)
+        self.assertFalse("999" in info)
+        self.assertFalse(any(v is paz for v in info.kwargs.values()))
+        # scalars are kept as they are
+        tr.decimate(2, no_filter=True)
+        self.assertEqual(tr.stats.processing[-1].args, (2, ))
+
+    def test_copyOnWrite(self):
+        """
+        Tests copying a trace with copy_on_write=True.
+        """
+        tr = Trace(data=np.arange(100, dtype=np.float64),
+                   header={'network': 'BW'})
+        tr2 = tr.copy(copy_on_write=True)
+        self.assertEqual(tr2, tr)
+        self.assertTrue(tr2.data is tr.data)
+        self.assertFalse(tr2.stats is tr.stats)
+        self.assertFalse(tr.data.flags.writeable)
+        # headers are independent
+        tr2.stats.network = 'GR'
+        self.assertEqual(tr.stats.network, 'BW')
+        # processing one trace leaves the other one untouched
+        data = tr2.data.base
+        tr2.filter("lowpass", freq=0.1)
+        tr2.taper(max_percentage=0.05)
+        np.testing.assert_array_equal(tr.data, np.arange(100))
+        self.assertTrue(tr2.data.flags.writeable)
+        # the trace left alone gets the original writeable array back
+        self.assertTrue(tr.data is data)
+        self.assertTrue(tr.data.flags.writeable)
+        # in place modification of shared data needs a writable copy
+        tr3 = tr.copy(copy_on_write=True)
+        self.assertRaises(ValueError, tr.data.__imul__, 2)
+        self.assertTrue(tr.writable() is tr)
+        self.assertFalse(tr.data is data)
+        tr.data *= 2
+        np.testing.assert_array_equal(tr.data, np.arange(0, 200, 2))
+        np.testing.assert_array_equal(tr3.data, np.arange(100))
+        self.assertTrue(tr3.data is data)
+        # writable data is left alone
+        data = tr.data
+        tr.writable()
+        self.assertTrue(tr.data is data)
+        # deleted copies give the data back as well
+        for _i in range(3):
+            tr.copy(copy_on_write=True)
+        tr2 = tr.copy(copy_on_write=True)
+        tr3 = tr2.copy(copy_on_write=True)
+        self.assertFalse(tr.data.flags.writeable)
+        del tr2
+        self.assertFalse(tr.data.flags.writeable)
+        del tr3
+        self.assertTrue(tr.data is data)
+        tr.data[:5] = 0
+        # regular copies of shared traces are independent
+        tr2 = tr.copy(copy_on_write=True)
+        tr3 = tr2.copy()
+        self.assertTrue(tr3.data.flags.writeable)
+        self.assertFalse(tr3.data is tr2.data)
+        del tr2
+        self.assertTrue(tr.data is data)
+        # a trimmed copy still uses the shared data, modifying the original
+        # in place needs a writable copy first
+        tr2 = tr.copy(copy_on_write=True)
+        tr2.trim(tr.stats.starttime + 10, tr.stats.endtime - 10)
+        expected = tr2.data.copy()
+        self.assertRaises(ValueError, tr.data.__imul__, 2)
+        tr.writable().data *= 2
+        np.testing.assert_array_equal(tr2.data, expected)
+        # the trimmed copy left alone keeps its read-only view
+        self.assertEqual(len(tr2), 80)
+        self.assertFalse(tr2.data.flags.writeable)
+        # masked arrays are copied right away
+        tr = Trace(data=np.ma.masked_equal([1, 2, 3], 2))
+        tr2 = tr.copy(copy_on_write=True)
+        self.assertFalse(tr2.data is tr.data)
+        self.assertTrue(tr.data.flags.writeable)
+        np.testing.assert_array_equal(tr2.data.mask, tr.data.mask)
+
     def test_no_processing_info_for_failed_operations(self):
         """
         If an operation fails, no processing information should be attached
@@ -4,11 +4,14 @@ from __future__ import unicode_literals
 from future.builtins import str
 
 from obspy import UTCDateTime
+from obspy.core.utcdatetime import UTCDateTimeArray
 from obspy.core.util.decorator import skipIf
 import copy
 import datetime
 import numpy as np
+import pickle
 import unittest
+import weakref
 
 
 # some Python version don't support negative timestamps
@@ -282,6 +285,61 @@ class UTCDateTimeTestCase(unittest.TestCase):
         self.assertEqual(dt2.timestamp, 1240561632.0050001)
         self.assertEqual(dt.timestamp, 1240561700.0050001)
 
+    def test_slots(self):
+        """
+        UTCDateTime uses __slots__ but is still copied and pickled including
+        its precision.
+        """
+        dt = UTCDateTime(1240561632.0050001, precision=4)
+        self.assertFalse(hasattr(dt, '__dict__'))
+        self.assertRaises(AttributeError, setattr, dt, 'foo', 1)
+        # weak references are used by resource identifiers of events
+        self.assertTrue(weakref.ref(dt)() is dt)
+        for dt2 in [copy.copy(dt), copy.deepcopy(dt)] + \
+                [pickle.loads(pickle.dumps(dt, protocol=_i))
+                 for _i in range(pickle.HIGHEST_PROTOCOL + 1)]:
+            self.assertEqual(dt2.timestamp, dt.timestamp)
+            self.assertEqual(dt2.precision, 4)
+        # state of UTCDateTime objects pickled by older versions
+        dt2 = UTCDateTime.__new__(UTCDateTime)
+        dt2.__setstate__({'timestamp': 1240561632.0050001,
+                          '_UTCDateTime__precision': 4,
+                          '_UTCDateTime__ms_pattern': '%0.4f'})
+        self.assertEqual(dt2.timestamp, dt.timestamp)
+        self.assertEqual(dt2.precision, 4)
+        self.assertEqual(str(dt2), '2009-04-24T08:27:12.0050Z')
+
+    def test_parseCommonStrings(self):
+        """
+        ISO8601 calendar dates and SEED dates are parsed without strptime and
+        the parsed strings are cached. Results have to match the complete
+        parser.
+        """
+        strings = ["2009-12-31T12:23:34.5", "2009-12-31T12:23:34.000005Z",
+                   "1969-12-31T23:59:59.999999", "2009-12-31",
+                   "2012-02-29Z", "1970-01-01 12:23:34", "1905-12-31",
+                   "2008,275,12:30:35.0450", "2008,366", "2009,366",
+                   "2008,001,00:00:00"]
+        for string in strings:
+            for iso8601 in (False, True):
+                try:
+                    expected = UTCDateTime.__new__(UTCDateTime)
+                    expected._fromString(string, iso8601)
+                except ValueError:
+                    self.assertRaises(ValueError, UTCDateTime, string,
+                                      iso8601=iso8601)
+                    continue
+                # parse twice to use the cache
+                for _i in range(2):
+                    dt = UTCDateTime(string, iso8601=iso8601)
+                    self.assertEqual(dt.timestamp, expected.timestamp)
+        self.assertEqual(UTCDateTime("2009,366"), UTCDateTime(2010, 1, 1))
+        # invalid dates and times are left to the complete parser
+        for string in ["2009-02-29", "2009-12-31T24:00:00", "2009,000",
+                       "2009-12-31T12:60:00.5", "9999,366"]:
+            self.assertRaises(ValueError, UTCDateTime, string)
+            self.assertRaises(ValueError, UTCDateTime, string)
+
     def test_add(self):
         a = UTCDateTime(0.0)
         self.assertEqual(a + 1, UTCDateTime(1970, 1, 1, 0, 0, 1))
@@ -935,6 +993,98 @@ class UTCDateTimeTestCase(unittest.TestCase):
         for time_string in time_strings:
             self.assertEqual(t, UTCDateTime(time_string))
 
+    def test_utcdatetimearray(self):
+        """
+        Tests parsing, arithmetic and comparisons of UTCDateTimeArray against
+        single UTCDateTime objects.
+        """
+        strings = ["2009-08-24T00:20:03.123456Z", "2013-09-01T12:34:56",
+                   "2009-236T00:20:03", "2013-09-01T14:34:56+02:00",
+                   "1969-12-31T23:59:59.5"]
+        times = UTCDateTimeArray(strings)
+        self.assertEqual(len(times), 5)
+        for string, t in zip(strings, times):
+            self.assertEqual(t, UTCDateTime(string))
+        # vectorized parsing of plain calendar dates
+        times = UTCDateTimeArray(strings[:2] + strings[4:])
+        self.assertEqual(times.toUTCDateTimes(),
+                         [UTCDateTime(_i) for _i in strings[:2] + strings[4:]])
+        # other input types
+        self.assertEqual(
+            list(UTCDateTimeArray([UTCDateTime(10.5), 1.5,
+                                   datetime.datetime(1970, 1, 1)])),
+            [UTCDateTime(10.5), UTCDateTime(1.5), UTCDateTime(0)])
+        times = UTCDateTimeArray(np.array([1.2345678e9, -0.25]))
+        self.assertEqual(times[0], UTCDateTime(1.2345678e9))
+        self.assertEqual(times[-1], UTCDateTime(-0.25))
+        self.assertEqual(UTCDateTimeArray(times.datetime64).ns.tolist(),
+                         times.ns.tolist())
+        self.assertEqual(UTCDateTime(times.datetime64[0]), times[0])
+        self.assertEqual(list(UTCDateTimeArray(times)), list(times))
+        # arithmetic
+        t = UTCDateTime(1.2345678e9)
+        np.testing.assert_array_equal(times + 1.5, [t + 1.5, 1.25])
+        np.testing.assert_array_equal((times - 0.5).timestamp,
+                                      [t.timestamp - 0.5, -0.75])
+        span = t - UTCDateTime(-0.25)
+        np.testing.assert_array_equal(times - t, [0.0, -span])
+        np.testing.assert_array_equal(t - times, [0.0, span])
+        np.testing.assert_array_equal(times - times, [0.0, 0.0])
+        np.testing.assert_array_equal(times + np.array([1.0, 2.0]),
+                                      [t + 1, 1.75])
+        self.assertRaises(TypeError, times.__add__, t)
+        # index arrays and slices return a new array
+        self.assertEqual(list(times[::-1]), [UTCDateTime(-0.25), t])
+        self.assertEqual(list(times[times > 0]), [t])
+
+    def test_utcdatetimearrayPrecision(self):
+        """
+        Comparisons and rounding of UTCDateTimeArray use the precision.
+        """
+        times = UTCDateTimeArray([UTCDateTime(123.000000012),
+                                  UTCDateTime(124.5)])
+        other = UTCDateTime(123.000000099)
+        self.assertEqual((times == other).tolist(), [True, False])
+        self.assertEqual((times != other).tolist(), [False, True])
+        self.assertEqual((times <= other).tolist(), [True, False])
+        self.assertEqual((times < other).tolist(), [False, False])
+        self.assertEqual((times >= other).tolist(), [True, True])
+        self.assertEqual((times > other).tolist(), [False, True])
+        self.assertEqual((times == "abc").tolist(), [False, False])
+        times.precision = 11
+        self.assertEqual((times == other).tolist(), [False, False])
+        self.assertEqual((times < other).tolist(), [True, False])
+        # rounding to precision using round half to even
+        times = UTCDateTimeArray.fromNanoseconds([1500000000, 2500000000,
+                                                  -1500000000, 1123456789])
+        self.assertEqual(times.round(0).ns.tolist(),
+                         [2000000000, 2000000000, -2000000000, 1000000000])
+        self.assertEqual(times.round(3).ns.tolist()[-1], 1123000000)
+        self.assertEqual(times.round().ns.tolist()[-1], 1123457000)
+        self.assertEqual(times.round(9).ns.tolist()[-1], 1123456789)
+        # subtraction is rounded to precision as well
+        times = UTCDateTimeArray([UTCDateTime(0.0000001)], precision=4)
+        self.assertEqual((times - UTCDateTime(0)).tolist(), [0.0])
+        self.assertEqual(times[0].precision, 4)
+
+    def test_utcdatetimearrayRange(self):
+        """
+        Times outside the int64 nanosecond range raise a ValueError instead
+        of wrapping around.
+        """
+        for values in [[UTCDateTime(2300, 1, 1)], [UTCDateTime(1600, 1, 1)],
+                       ['1600-01-01T00:00:00'], [1e10],
+                       np.array(['2300-01-01'], dtype='datetime64[D]')]:
+            self.assertRaises(ValueError, UTCDateTimeArray, values)
+        times = UTCDateTimeArray([UTCDateTime(2000, 1, 1)])
+        self.assertRaises(ValueError, times.__lt__, UTCDateTime(1600, 1, 1))
+        # the limits themselves are fine
+        times = UTCDateTimeArray([UTCDateTime(1677, 9, 21, 0, 12, 44),
+                                  UTCDateTime(2262, 4, 11, 23, 47, 15)])
+        self.assertEqual(times.toUTCDateTimes(),
+                         [UTCDateTime(1677, 9, 21, 0, 12, 44),
+                          UTCDateTime(2262, 4, 11, 23, 47, 15)])
+
 
 def suite():
     return unittest.makeSuite(UTCDateTimeTestCase, 'test')
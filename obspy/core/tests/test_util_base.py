@@ -2,13 +2,16 @@ from __future__ import unicode_literals
 from future.builtins import open
 # -*- coding: utf-8 -*-
 
-from obspy.core.util.base import getMatplotlibVersion, NamedTemporaryFile
+from obspy.core.util.base import getMatplotlibVersion, NamedTemporaryFile, \
+    DEFAULT_MODULES, _LazyEntryPoints, _getEntryPoints
 from obspy.core.util.testing import ImageComparison, \
     ImageComparisonException, HAS_COMPARE_IMAGE
 from obspy.core.util.decorator import skipIf
 import os
 import unittest
 import shutil
+import subprocess
+import sys
 
 
 # checking for matplotlib
@@ -113,6 +116,69 @@ class UtilBaseTestCase(unittest.TestCase):
         # check that temp file is deleted
         self.assertFalse(os.path.exists(ic.name))
 
+    def test_lightweightImport(self):
+        """
+        Importing obspy must not import any plug-ins, matplotlib, SciPy or
+        other modules which are only needed later on.
+        """
+        code = "import sys, obspy; print(' '.join(sys.modules))"
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(sys.path)
+        try:
+            output = subprocess.check_output(
+                [sys.executable, '-c', code], env=env,
+                stderr=open(os.devnull, 'wb'))
+        except subprocess.CalledProcessError:
+            self.skipTest('obspy can not be imported in a subprocess')
+        modules = output.decode().split()
+        self.assertTrue('obspy.core.stream' in modules)
+        plugins = ['obspy.%s' % _i for _i in DEFAULT_MODULES
+                   if _i not in ('core', 'station')]
+        unwanted = [_i for _i in modules
+                    if _i.split('.')[0] in ('matplotlib', 'scipy', 'mock')
+                    or _i.startswith('unittest.mock')
+                    or '.'.join(_i.split('.')[:2]) in plugins]
+        self.assertEqual(unwanted, [])
+
+    def test_lazyEntryPoints(self):
+        """
+        Groups of the lazy entry point mapping are scanned on first access,
+        all ways of access agree with each other.
+        """
+        calls = []
+
+        def scan(group):
+            calls.append(group)
+            return _getEntryPoints(group)
+
+        eps = _LazyEntryPoints({'detrend': (scan, ('obspy.plugin.detrend', ))})
+        self.assertTrue('detrend' in eps)
+        self.assertFalse('filter' in eps)
+        self.assertEqual(list(eps), ['detrend'])
+        self.assertEqual(len(eps), 1)
+        self.assertEqual(calls, [])
+        detrend = eps.get('detrend')
+        self.assertTrue('simple' in detrend)
+        self.assertTrue(eps['detrend'] is detrend)
+        self.assertEqual(eps.get('filter'), None)
+        self.assertEqual(eps.copy(), {'detrend': detrend})
+        self.assertEqual(dict(eps.items()), {'detrend': detrend})
+        self.assertEqual(calls, ['obspy.plugin.detrend'])
+        self.assertRaises(KeyError, eps.__getitem__, 'filter')
+
+    def test_eventEntryPointAliases(self):
+        """
+        The old module level entry point dictionaries of obspy.core.event
+        are still available.
+        """
+        from obspy.core.event import EVENT_ENTRY_POINTS, \
+            EVENT_ENTRY_POINTS_WRITE
+        from obspy.core.util.base import ENTRY_POINTS
+        self.assertEqual(dict(EVENT_ENTRY_POINTS), ENTRY_POINTS['event'])
+        self.assertEqual(dict(EVENT_ENTRY_POINTS_WRITE),
+                         ENTRY_POINTS['event_write'])
+        self.assertTrue('QUAKEML' in EVENT_ENTRY_POINTS_WRITE)
+
 
 def suite():
     return unittest.makeSuite(UtilBaseTestCase, 'test')
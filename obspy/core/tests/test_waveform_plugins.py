@@ -6,11 +6,15 @@ from future.builtins import str
 
 from obspy import Trace, read
 from obspy.core.utcdatetime import UTCDateTime
-from obspy.core.util.base import NamedTemporaryFile, _getEntryPoints
+from obspy.core.util.base import NamedTemporaryFile, _getEntryPoints, \
+    _detectFormat, _getPluginFunction, _FORMAT_CHECKS, _FORMAT_HINTS, \
+    _HEADER_SIZE
 from obspy.core import compatibility
 from pkg_resources import load_entry_point
 import numpy as np
 import os
+import shutil
+import tempfile
 import threading
 import time
 import unittest
@@ -175,6 +179,58 @@ class WaveformPluginsTestCase(unittest.TestCase):
                               false_positives])
             raise Exception(msg)
 
+    def test_formatChecks(self):
+        """
+        The quick checks of the first bytes of a file used by the automatic
+        format detection must agree with the isFormat methods for all data
+        test files.
+        """
+        formats_ep = _getEntryPoints('obspy.plugin.waveform', 'isFormat')
+        paths = set(os.path.join(f.dist.location, 'obspy',
+                                 f.module_name.split('.')[1], 'tests', 'data')
+                    for f in formats_ep.values())
+        filelist = []
+        for path in paths:
+            for directory, _, files in os.walk(path):
+                filelist.extend([os.path.join(directory, _i) for _i in files])
+        mismatches = []
+        for name, check in _FORMAT_CHECKS['waveform'].items():
+            if name not in formats_ep:  # pragma: no cover
+                continue
+            isFormat = _getPluginFunction('waveform', formats_ep[name],
+                                          'isFormat')
+            for file in filelist:
+                with open(file, 'rb') as fh:
+                    result = check(fh.read(_HEADER_SIZE))
+                if result is not None and result != bool(isFormat(file)):
+                    mismatches.append((name, file))  # pragma: no cover
+        self.assertEqual(mismatches, [])
+
+    def test_detectFormatHint(self):
+        """
+        The format detected last in a directory is checked first, files of
+        other formats in the same directory are still detected correctly.
+        """
+        formats = [('MSEED', 'mseed', 'test.mseed'),
+                   ('SAC', 'sac', 'test.sac'),
+                   ('GSE2', 'gse2', 'loc_RJOB20050831023349.z')]
+        tempdir = tempfile.mkdtemp(prefix='obspy-')
+        try:
+            for format, module, name in formats:
+                shutil.copy(os.path.join(os.path.dirname(__file__), os.pardir,
+                                         os.pardir, module, 'tests', 'data',
+                                         name), tempdir)
+            for _ in range(2):
+                for format, _, name in formats:
+                    filename = os.path.join(tempdir, name)
+                    self.assertEqual(
+                        _detectFormat('waveform', filename).name, format)
+                    self.assertEqual(
+                        _FORMAT_HINTS[('waveform', tempdir)], format)
+                    self.assertEqual(read(filename)[0].stats._format, format)
+        finally:
+            shutil.rmtree(tempdir)
+
     def test_readThreadSafe(self):
         """
         Tests for race conditions. Reading n_threads (currently 30) times
@@ -16,7 +16,7 @@ from future.builtins import super
 from future.builtins import str
 from future.utils import native_str
 from copy import deepcopy, copy
-from obspy.core.utcdatetime import UTCDateTime
+from obspy.core.utcdatetime import UTCDateTime, UTCDateTimeArray
 from obspy.core.util import AttribDict, createEmptyDataChunk
 from obspy.core.util.base import _getFunctionFromEntryPoint
 from obspy.core.util.decorator import raiseIfMasked, skipIfNoData, \
@@ -24,9 +24,13 @@ from obspy.core.util.decorator import raiseIfMasked, skipIfNoData, \
 from obspy.core import compatibility
 from obspy.core.util.misc import flatnotmaskedContiguous
 import math
+import numbers
 import numpy as np
 import warnings
 import functools
+import itertools
+import weakref
+from contextlib import contextmanager
 
 
 class Stats(AttribDict):
@@ -96,6 +100,8 @@ class Stats(AttribDict):
 
     (2) The attributes ``starttime``, ``npts``, ``sampling_rate`` and ``delta``
         are monitored and used to automatically calculate the ``endtime``.
+        ``delta`` and ``endtime`` are derived on access, so changing a
+        header does not trigger any further calculations.
 
         >>> stats = Stats()
         >>> stats.npts = 60
@@ -135,6 +141,9 @@ class Stats(AttribDict):
         >>> trace.stats.npts
         4
     """
+    # default attributes are stored in slots, all others in __dict__
+    __slots__ = ('sampling_rate', 'starttime', 'npts', '_endtime', 'calib',
+                 'network', 'station', 'location', 'channel')
     readonly = ['endtime']
     defaults = {
         'sampling_rate': 1.0,
@@ -148,17 +157,57 @@ class Stats(AttribDict):
         'location': '',
         'channel': '',
     }
+    _keys = ('sampling_rate', 'delta', 'starttime', 'endtime', 'npts',
+             'calib', 'network', 'station', 'location', 'channel')
+    _key_set = frozenset(_keys)
 
     def __init__(self, header={}):
         """
         """
-        super(Stats, self).__init__(header)
+        _set = object.__setattr__
+        _set(self, 'sampling_rate', 1.0)
+        _set(self, 'starttime', self.defaults['starttime'])
+        _set(self, 'npts', 0)
+        _set(self, '_endtime', None)
+        _set(self, 'calib', 1.0)
+        _set(self, 'network', '')
+        _set(self, 'station', '')
+        _set(self, 'location', '')
+        _set(self, 'channel', '')
+        if header:
+            self.update(header)
+
+    @property
+    def delta(self):
+        # derived value
+        try:
+            return 1.0 / self.sampling_rate
+        except ZeroDivisionError:
+            return 0
+
+    @property
+    def endtime(self):
+        # derived value, calculated on first access after any change
+        endtime = self._endtime
+        if endtime is None:
+            if self.npts == 0:
+                timediff = 0
+            else:
+                timediff = (self.npts - 1) * self.delta
+            endtime = self.starttime + timediff
+            object.__setattr__(self, '_endtime', endtime)
+        return endtime
+
+    def __getitem__(self, name, default=None):
+        if name in self._key_set:
+            return getattr(self, name)
+        return super(Stats, self).__getitem__(name, default)
 
     def __setitem__(self, key, value):
         """
         """
         # keys which need to refresh derived values
-        if key in ['delta', 'sampling_rate', 'starttime', 'npts']:
+        if key in ('delta', 'sampling_rate', 'starttime', 'npts'):
             # ensure correct data type
             if key == 'delta':
                 key = 'sampling_rate'
@@ -169,33 +218,76 @@ class Stats(AttribDict):
                 value = UTCDateTime(value)
             elif key == 'npts':
                 value = int(value)
-            # set current key
-            super(Stats, self).__setitem__(key, value)
-            # set derived value: delta
-            try:
-                delta = 1.0 / float(self.sampling_rate)
-            except ZeroDivisionError:
-                delta = 0
-            self.__dict__['delta'] = delta
-            # set derived value: endtime
-            if self.npts == 0:
-                timediff = 0
-            else:
-                timediff = (self.npts - 1) * delta
-            self.__dict__['endtime'] = self.starttime + timediff
+            # set current key and reset derived value endtime
+            object.__setattr__(self, key, value)
+            object.__setattr__(self, '_endtime', None)
             return
+        if key in self.readonly:
+            msg = 'Attribute "%s" in %s object is read only!'
+            raise AttributeError(msg % (key, self.__class__.__name__))
         # prevent a calibration factor of 0
         if key == 'calib' and value == 0:
             msg = 'Calibration factor set to 0.0!'
             warnings.warn(msg, UserWarning)
         # all other keys
         if isinstance(value, dict):
-            super(Stats, self).__setitem__(key, AttribDict(value))
+            value = AttribDict(value)
+        if key in self._key_set:
+            object.__setattr__(self, key, value)
         else:
-            super(Stats, self).__setitem__(key, value)
+            self.__dict__[key] = value
 
     __setattr__ = __setitem__
 
+    def __delitem__(self, name):
+        # default attributes are reset to their default value
+        if name in self._key_set:
+            self.__setitem__(name, self.defaults[name])
+            return
+        super(Stats, self).__delitem__(name)
+
+    __delattr__ = __delitem__
+
+    def __contains__(self, key):
+        return key in self._key_set or key in self.__dict__
+
+    def __iter__(self):
+        return itertools.chain(self._keys, self.__dict__)
+
+    def __len__(self):
+        return len(self._keys) + len(self.__dict__)
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__, dict(self))
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        for key in self._keys:
+            if key not in ('delta', 'endtime'):
+                state[key] = getattr(self, key)
+        return state
+
+    def __setstate__(self, adict):
+        self.__init__()
+        # states pickled by older versions contain the derived delta
+        if 'sampling_rate' in adict:
+            adict = dict(adict)
+            adict.pop('delta', None)
+        self.update(adict)
+
+    def __deepcopy__(self, memo=None):
+        new = self.__class__.__new__(self.__class__)
+        _set = object.__setattr__
+        _set(new, 'sampling_rate', self.sampling_rate)
+        _set(new, 'starttime', UTCDateTime(self.starttime))
+        _set(new, 'npts', self.npts)
+        _set(new, '_endtime', None)
+        for key in ('calib', 'network', 'station', 'location', 'channel'):
+            _set(new, key, deepcopy(getattr(self, key), memo))
+        if self.__dict__:
+            new.__dict__.update(deepcopy(self.__dict__, memo))
+        return new
+
     def __str__(self):
         """
         Return better readable string representation of Stats object.
@@ -206,34 +298,185 @@ class Stats(AttribDict):
         return self._pretty_str(priorized_keys)
 
 
+# processing information gets attached as long as this is True, see
+# setProcessingInfo() and noProcessingInfo()
+_PROCESSING_INFO = {'enabled': True}
+
+
+def setProcessingInfo(enabled=True):
+    """
+    Globally switches the processing information in ``stats.processing`` on
+    or off.
+
+    Every call of a processing method of :class:`~obspy.core.trace.Trace`
+    (e.g. :meth:`~obspy.core.trace.Trace.filter`) appends an entry to
+    ``stats.processing``. Switching this off removes this (small) overhead
+    from tight loops, e.g. when filtering many short windows.
+
+    :type enabled: bool
+    :param enabled: ``False`` stops recording the processing information.
+    :rtype: bool
+    :returns: The previous setting.
+
+    .. note::
+        The setting is global for all threads. Worker processes started with
+        the ``parallel`` option of the Stream methods only share it if the
+        platform forks them.
+    """
+    previous = _PROCESSING_INFO['enabled']
+    _PROCESSING_INFO['enabled'] = bool(enabled)
+    return previous
+
+
+@contextmanager
+def noProcessingInfo():
+    """
+    A context manager switching off the processing information for its scope.
+
+    See :func:`~obspy.core.trace.setProcessingInfo`.
+
+    >>> tr = Trace(data=np.arange(10, dtype=np.float64))
+    >>> with noProcessingInfo():
+    ...     tr = tr.detrend()
+    >>> 'processing' in tr.stats
+    False
+    >>> tr = tr.detrend()
+    >>> len(tr.stats.processing)
+    1
+    """
+    previous = setProcessingInfo(False)
+    try:
+        yield
+    finally:
+        setProcessingInfo(previous)
+
+
+class _ProcessingArgument(object):
+    """
+    Argument of a processing call formatted at call time, see
+    :class:`~obspy.core.trace.ProcessingInfo`.
+    """
+    __slots__ = ('_info', )
+
+    def __init__(self, info):
+        self._info = info
+
+    def __str__(self):
+        return self._info
+
+    @classmethod
+    def snapshot(cls, value):
+        """
+        Returns immutable scalar values unchanged and the formatted string
+        of all other values.
+        """
+        if value is None or isinstance(value, (numbers.Number, str,
+                                               native_str, bytes)):
+            return value
+        return cls("%s" % (value, ))
+
+
+class ProcessingInfo(object):
+    """
+    A single entry of ``stats.processing``.
+
+    Only the called function and its arguments are stored, the informational
+    string is created on first access. The entry behaves like that string,
+    i.e. it may be printed, compared to strings or searched with ``in``.
+
+    >>> info = ProcessingInfo(Trace.decimate, (4, ), {})
+    >>> print(info)  # doctest: +ELLIPSIS
+    ObsPy ...: decimate(factor=4::no_filter=False::strict_length=False)
+    >>> 'factor=4' in info
+    True
+
+    .. note::
+        Numbers, strings and ``None`` are kept as they are, all other
+        arguments (e.g. dictionaries, arrays or response objects) are
+        formatted right away. Later changes of these objects therefore do
+        not alter the history and they are not kept alive by the trace.
+        Pickled entries are stored as plain strings.
+    """
+    __slots__ = ('function', 'args', 'kwargs', '_info')
+
+    def __init__(self, function, args, kwargs):
+        self.function = function
+        self.args = tuple(_ProcessingArgument.snapshot(_i) for _i in args)
+        self.kwargs = dict((k, _ProcessingArgument.snapshot(v))
+                           for k, v in kwargs.items())
+        self._info = None
+
+    def __str__(self):
+        if self._info is None:
+            func = self.function
+            callargs = compatibility.getcallargs(func, None, *self.args,
+                                                 **self.kwargs)
+            callargs.pop("self")
+            kwargs_ = callargs.pop("kwargs", {})
+            from obspy import __version__
+            info = "ObsPy {version}: {function}(%s)".format(
+                version=__version__,
+                function=func.__name__)
+            arguments = []
+            arguments += \
+                ["%s=%s" % (k, v) if not isinstance(v, native_str) else
+                 "%s='%s'" % (k, v) for k, v in callargs.items()]
+            arguments += \
+                ["%s=%s" % (k, v) if not isinstance(v, native_str) else
+                 "%s='%s'" % (k, v) for k, v in kwargs_.items()]
+            arguments.sort()
+            self._info = info % "::".join(arguments)
+        return self._info
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __eq__(self, other):
+        if isinstance(other, ProcessingInfo):
+            other = str(other)
+        return str(self) == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __contains__(self, item):
+        return item in str(self)
+
+    def __len__(self):
+        return len(str(self))
+
+    def __getattr__(self, name):
+        # all other string methods, e.g. startswith()
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(str(self), name)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo=None):
+        return self
+
+    def __reduce__(self):
+        return (str, (str(self), ))
+
+
 def _add_processing_info(func):
     """
     This is a decorator that attaches information about a processing call as a
-    string to the Trace.stats.processing list.
+    :class:`~obspy.core.trace.ProcessingInfo` to the Trace.stats.processing
+    list.
     """
     @functools.wraps(func)
-    def new_func(*args, **kwargs):
-        callargs = compatibility.getcallargs(func, *args, **kwargs)
-        callargs.pop("self")
-        kwargs_ = callargs.pop("kwargs", {})
-        from obspy import __version__
-        info = "ObsPy {version}: {function}(%s)".format(
-            version=__version__,
-            function=func.__name__)
-        arguments = []
-        arguments += \
-            ["%s=%s" % (k, v) if not isinstance(v, native_str) else
-             "%s='%s'" % (k, v) for k, v in callargs.items()]
-        arguments += \
-            ["%s=%s" % (k, v) if not isinstance(v, native_str) else
-             "%s='%s'" % (k, v) for k, v in kwargs_.items()]
-        arguments.sort()
-        info = info % "::".join(arguments)
-        self = args[0]
-        result = func(*args, **kwargs)
+    def new_func(self, *args, **kwargs):
+        result = func(self, *args, **kwargs)
         # Attach after executing the function to avoid having it attached
         # while the operation failed.
-        self._addProcessingInfo(info)
+        if _PROCESSING_INFO['enabled']:
+            self._addProcessingInfo(ProcessingInfo(func, args, kwargs))
         return result
 
     new_func.__name__ = func.__name__
@@ -242,6 +485,48 @@ def _add_processing_info(func):
     return new_func
 
 
+# traces sharing their data array after a copy with copy_on_write=True,
+# maps id(trace) to the _SharedData object of the trace
+_SHARED_DATA = {}
+
+
+class _SharedData(object):
+    """
+    The writeable data array of traces sharing it read-only, see the
+    ``copy_on_write`` option of :meth:`~obspy.core.trace.Trace.copy`.
+
+    Keeps weak references of all sharing traces. As soon as only one of them
+    is left (the others were deleted or got new data not sharing the array),
+    that trace gets the original writeable array back, unless it only uses a
+    part of it (e.g. after trimming), then its data stays read-only.
+    """
+    def __init__(self, data):
+        self.data = data
+        self.refs = {}
+
+    def add(self, trace):
+        key = id(trace)
+        self.refs[key] = weakref.ref(
+            trace, lambda ref, key=key: self.release(key))
+        _SHARED_DATA[key] = self
+
+    def release(self, key):
+        self.refs.pop(key, None)
+        _SHARED_DATA.pop(key, None)
+        if len(self.refs) == 1:
+            key, ref = self.refs.popitem()
+            _SHARED_DATA.pop(key, None)
+            trace = ref()
+            if trace is None:
+                return
+            data = trace.__dict__.get('data')
+            if isinstance(data, np.ndarray) and \
+                    data.shape == self.data.shape and \
+                    data.dtype == self.data.dtype and \
+                    np.byte_bounds(data) == np.byte_bounds(self.data):
+                object.__setattr__(trace, 'data', self.data)
+
+
 class Trace(object):
     """
     An object containing data of a continuous series, such as a seismic trace.
@@ -377,8 +662,8 @@ class Trace(object):
                 out = out + ' | '\
                     "%(starttime)s - %(endtime)s | " + \
                     "%(sampling_rate).1f Hz, %(npts)d samples"
-        # check for masked array
-        if np.ma.count_masked(self.data):
+        # check for masked array (lazily read traces are never masked)
+        if '_lazy' not in self.__dict__ and np.ma.count_masked(self.data):
             out += ' (masked)'
         return trace_id + out % (self.stats)
 
@@ -397,6 +682,8 @@ class Trace(object):
         >>> len(trace)
         4
         """
+        if '_lazy' in self.__dict__:
+            return self.stats.npts
         return len(self.data)
 
     count = __len__
@@ -409,8 +696,30 @@ class Trace(object):
         if key == 'data':
             _data_sanity_checks(value)
             self.stats.npts = len(value)
+            # new data replaces any pending lazily read data
+            self.__dict__.pop('_lazy', None)
+            # and ends sharing the data with copies, unless it is a view of
+            # the shared data (e.g. after trimming)
+            shared = _SHARED_DATA.get(id(self))
+            if shared is not None and \
+                    not np.may_share_memory(value, shared.data):
+                shared.release(id(self))
         return super(Trace, self).__setattr__(key, value)
 
+    def __getattr__(self, key):
+        """
+        __getattr__ method of Trace object.
+
+        Only called if the attribute was not found the usual way. Loads the
+        data of a lazily read trace on first access, see the ``lazy`` option
+        of :func:`~obspy.core.stream.read`.
+        """
+        if key == 'data' and '_lazy' in self.__dict__:
+            self.__dict__['_lazy'][0].load(self)
+            return self.__dict__['data']
+        msg = "'%s' object has no attribute '%s'"
+        raise AttributeError(msg % (self.__class__.__name__, key))
+
     def __getitem__(self, index):
         """
         __getitem__ method of Trace object.
@@ -899,6 +1208,9 @@ class Trace(object):
         >>> tr.stats.starttime
         UTCDateTime(1970, 1, 1, 0, 0, 8)
         """
+        if '_lazy' in self.__dict__ and not pad:
+            return self._lazyTrim(self._ltrim, starttime,
+                                  nearest_sample=nearest_sample)
         org_dtype = self.data.dtype
         if isinstance(starttime, float) or isinstance(starttime, int):
             starttime = UTCDateTime(self.stats.starttime) + starttime
@@ -961,6 +1273,9 @@ class Trace(object):
         >>> tr.stats.endtime
         UTCDateTime(1970, 1, 1, 0, 0, 2)
         """
+        if '_lazy' in self.__dict__ and not pad:
+            return self._lazyTrim(self._rtrim, endtime,
+                                  nearest_sample=nearest_sample)
         org_dtype = self.data.dtype
         if isinstance(endtime, float) or isinstance(endtime, int):
             endtime = UTCDateTime(self.stats.endtime) - endtime
@@ -1004,6 +1319,26 @@ class Trace(object):
         self.data = self.data[:total]
         return self
 
+    def _lazyTrim(self, method, *args, **kwargs):
+        """
+        Applies a trim method to a lazily read trace without loading data.
+
+        A zero-strided dummy array of the current length stands in for the
+        data while the given method adjusts the header.
+        """
+        lazy = self.__dict__.pop('_lazy')
+        dummy = np.lib.stride_tricks.as_strided(
+            np.zeros(1, dtype=np.int8), shape=(self.stats.npts,),
+            strides=(0,))
+        super(Trace, self).__setattr__('data', dummy)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            del self.__dict__['data']
+            self.__dict__['_lazy'] = lazy
+            # trimmed copies (e.g. from slice) share the pending load
+            lazy[0].register(self)
+
     @_add_processing_info
     def trim(self, starttime=None, endtime=None, pad=False,
              nearest_sample=True, fill_value=None):
@@ -1949,10 +2284,14 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
 
         return self
 
-    def copy(self):
+    def copy(self, copy_on_write=False):
         """
         Returns a deepcopy of the trace.
 
+        :type copy_on_write: bool, optional
+        :param copy_on_write: If ``True``, the copy and the original trace
+            share the same (read-only) data array until one of them gets new
+            data, see `Copy on Write`_ below. Defaults to ``False``.
         :return: Copy of trace.
 
         This actually copies all data in the trace and does not only provide
@@ -1985,14 +2324,108 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         True
         >>> tr3 == tr
         True
+
+        .. rubric:: _`Copy on Write`
+
+        Copying the data can be postponed with ``copy_on_write=True``. Both
+        traces then share a read-only data array, i.e. the data of the
+        original trace becomes read-only, too. All processing methods
+        assign new data to the trace they are called on, which leaves the
+        other trace untouched. This saves time and memory e.g. if a trace is
+        copied to be filtered in several different frequency bands.
+
+        >>> tr = Trace(data=np.arange(10, dtype=np.float64))
+        >>> tr2 = tr.copy(copy_on_write=True)
+        >>> tr2.data is tr.data
+        True
+        >>> tr.data.flags.writeable
+        False
+
+        Modifying the shared array in place raises an error, use
+        :meth:`~obspy.core.trace.Trace.writable` to get a private copy first:
+
+        >>> tr2.data *= 2  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        ValueError: ...read-only
+        >>> tr2.writable().data *= 2
+        >>> tr2.data.tolist()
+        [0.0, 2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 14.0, 16.0, 18.0]
+
+        As soon as only one trace is left using the shared data (the others
+        got new data or were deleted), it gets its original writeable data
+        array back without any copying:
+
+        >>> tr.data.flags.writeable
+        True
+        >>> tr.data.tolist()
+        [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0]
+
+        .. note::
+            Masked arrays and not yet loaded data (see the ``lazy`` option of
+            :func:`~obspy.core.stream.read`) are always copied right away.
+        """
+        if not copy_on_write:
+            return deepcopy(self)
+        new = deepcopy(self, self._shareData())
+        new._shareDataWith(self)
+        return new
+
+    def _shareData(self, memo=None):
+        """
+        Makes the data read-only to share it with copies of the trace.
+
+        Returns the memo dictionary for :func:`copy.deepcopy` that prevents
+        the data from being copied.
+        """
+        if memo is None:
+            memo = {}
+        if '_lazy' in self.__dict__:
+            return memo
+        data = self.data
+        if isinstance(data, np.ma.MaskedArray):
+            return memo
+        if data.flags.writeable:
+            shared = _SharedData(data)
+            shared.add(self)
+            data = data.view()
+            data.flags.writeable = False
+            super(Trace, self).__setattr__('data', data)
+        memo[id(data)] = data
+        return memo
+
+    def _shareDataWith(self, other):
         """
-        return deepcopy(self)
+        Registers the trace as another user of the shared data of the trace
+        it was copied from, see :meth:`_shareData`.
+        """
+        shared = _SHARED_DATA.get(id(other))
+        if shared is not None and self.__dict__.get('data') is \
+                other.__dict__.get('data'):
+            shared.add(self)
+
+    def writable(self):
+        """
+        Makes sure the data array of the trace may be modified in place.
+
+        Data shared with copies of the trace (see ``copy_on_write`` option of
+        :meth:`~obspy.core.trace.Trace.copy`) or other read-only data gets
+        copied, otherwise nothing happens.
+
+        :return: The trace itself.
+        """
+        data = self.data
+        if not data.flags.writeable:
+            self.data = data.copy()
+        return self
 
     def _addProcessingInfo(self, info):
         """
         Adds the given informational string to the `processing` field in the
         trace's :class:`~obspy.core.trace.stats.Stats` object.
         """
+        if not _PROCESSING_INFO['enabled']:
+            return
         proc = self.stats.setdefault('processing', [])
         proc.append(info)
 
@@ -2023,18 +2456,47 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             trace_list.append(tr)
         return Stream(trace_list)
 
-    def times(self):
+    def times(self, type="relative"):
         """
         For convenient plotting compute a Numpy array of seconds since
         starttime corresponding to the samples in Trace.
 
-        :rtype: :class:`~numpy.ndarray` or :class:`~numpy.ma.MaskedArray`
+        :type type: str, optional
+        :param type: Determines the type of the returned time array.
+            ``"relative"`` (default) returns seconds since starttime,
+            ``"timestamp"`` returns POSIX timestamps and ``"utcdatetime"``
+            returns a :class:`~obspy.core.utcdatetime.UTCDateTimeArray`
+            with the absolute time of each sample.
+        :rtype: :class:`~numpy.ndarray`, :class:`~numpy.ma.MaskedArray` or
+            :class:`~obspy.core.utcdatetime.UTCDateTimeArray`
         :returns: An array of time samples in an :class:`~numpy.ndarray` if
             the trace doesn't have any gaps or a :class:`~numpy.ma.MaskedArray`
-            otherwise.
-        """
+            otherwise. Gaps are not masked in an
+            :class:`~obspy.core.utcdatetime.UTCDateTimeArray`.
+
+        .. rubric:: Example
+
+        >>> tr = Trace(data=np.arange(3))
+        >>> tr.stats.sampling_rate = 2.0
+        >>> tr.times().tolist()
+        [0.0, 0.5, 1.0]
+        >>> tr.times("utcdatetime")  # doctest: +NORMALIZE_WHITESPACE
+        UTCDateTimeArray(['1970-01-01T00:00:00.000000Z',
+                          '1970-01-01T00:00:00.500000Z',
+                          '1970-01-01T00:00:01.000000Z'])
+        """
+        if type not in ("relative", "timestamp", "utcdatetime"):
+            msg = "Unknown time array type '%s'." % type
+            raise ValueError(msg)
+        if type == "utcdatetime":
+            starttime = self.stats.starttime
+            times = UTCDateTimeArray([starttime],
+                                     precision=starttime.precision)
+            return times + np.arange(self.stats.npts) * self.stats.delta
         timeArray = np.arange(self.stats.npts)
         timeArray = timeArray / self.stats.sampling_rate
+        if type == "timestamp":
+            timeArray += self.stats.starttime.timestamp
         # Check if the data is a ma.maskedarray
         if isinstance(self.data, np.ma.masked_array):
             timeArray = np.ma.array(timeArray, mask=self.data.mask)
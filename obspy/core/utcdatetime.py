@@ -18,10 +18,77 @@ from future.utils import native_str, PY2
 import datetime
 import time
 import math
+import re
+
+import numpy as np
 
 
 TIMESTAMP0 = datetime.datetime(1970, 1, 1)
 
+# calendar date strings which may be passed directly to NumPy's datetime64
+_ISO8601_CALENDAR = re.compile(
+    r'^\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d{1,9})?)?)?Z?$')
+
+# common date time strings which are parsed without datetime.strptime
+_CALENDAR_STRING = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})'
+    r'(?:([T ])(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?)?Z?$')
+_SEED_STRING = re.compile(
+    r'^(\d{4}),(\d{3})(?:,(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?)?$')
+_ORDINAL0 = TIMESTAMP0.toordinal()
+_ORDINAL_MAX = datetime.date.max.toordinal()
+
+# parsed timestamps of recently used date time strings
+_STRING_CACHE = {}
+_STRING_CACHE_SIZE = 1000
+
+
+def _parseCommonString(value, iso8601=False):
+    """
+    Parses ISO8601 calendar date strings and SEED date strings.
+
+    Returns the timestamp or ``None`` for all other strings which are left to
+    the complete parser of :class:`UTCDateTime`. The timestamp is calculated
+    in the same order of floating point operations as the complete parser.
+    """
+    match = _CALENDAR_STRING.match(value)
+    if match:
+        year, month, day, sep, hour, minute, second, fraction = \
+            match.groups()
+        if sep == ' ' and iso8601:
+            return None
+        try:
+            days = datetime.date(int(year), int(month), int(day)).toordinal()
+        except ValueError:
+            return None
+    elif not iso8601:
+        match = _SEED_STRING.match(value)
+        if not match:
+            return None
+        year, julday, hour, minute, second, fraction = match.groups()
+        julday = int(julday)
+        if not 1 <= julday <= 366:
+            return None
+        try:
+            days = datetime.date(int(year), 1, 1).toordinal() + julday - 1
+        except ValueError:
+            return None
+        if days > _ORDINAL_MAX:
+            return None
+    else:
+        return None
+    days -= _ORDINAL0
+    if hour is None:
+        return float(days * 86400)
+    hour, minute, second = int(hour), int(minute), int(second)
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+    timestamp = float(days * 86400 + hour * 3600 + minute * 60 + second)
+    if fraction:
+        timestamp += float('0.' + fraction)
+    return timestamp
+
+
 # Py3k compat, avoid circular import
 if not PY2:
     unicode = str
@@ -211,17 +278,22 @@ class UTCDateTime(object):
 
     .. _ISO8601:2004: http://en.wikipedia.org/wiki/ISO_8601
     """
-    timestamp = 0.0
+    __slots__ = ('timestamp', '__precision', '__weakref__')
     DEFAULT_PRECISION = 6
 
     def __init__(self, *args, **kwargs):
         """
         Creates a new UTCDateTime object.
         """
-        # set default precision
-        self.precision = kwargs.pop('precision', self.DEFAULT_PRECISION)
-        # iso8601 flag
-        iso8601 = kwargs.pop('iso8601', False) is True
+        if kwargs:
+            # set precision
+            self.__precision = int(kwargs.pop('precision',
+                                              self.DEFAULT_PRECISION))
+            # iso8601 flag
+            iso8601 = kwargs.pop('iso8601', False) is True
+        else:
+            self.__precision = int(self.DEFAULT_PRECISION)
+            iso8601 = False
         # check parameter
         if len(args) == 0 and len(kwargs) == 0:
             # use current time if no time is given
@@ -229,7 +301,21 @@ class UTCDateTime(object):
             return
         elif len(args) == 1 and len(kwargs) == 0:
             value = args[0]
+            # fast path for timestamps and UTCDateTime objects
+            value_type = type(value)
+            if value_type is float or value_type is int:
+                self.timestamp = float(value)
+                return
+            elif value_type is UTCDateTime:
+                self.timestamp = value.timestamp
+                return
             # check types
+            if isinstance(value, np.datetime64):
+                # got a NumPy datetime64 object - has to be handled before
+                # __float__ which returns the value in its own time unit
+                ns = value.astype('datetime64[ns]').astype(np.int64)
+                self.timestamp = float(_nanosecondsToTimestamp(ns))
+                return
             try:
                 # got a timestamp
                 self.timestamp = value.__float__()
@@ -250,63 +336,21 @@ class UTCDateTime(object):
                     value = value.decode()
                 # got a string instance
                 value = value.strip()
-                # check for ISO8601 date string
-                if value.count("T") == 1 or iso8601:
-                    try:
-                        self.timestamp = self._parseISO8601(value).timestamp
-                        return
-                    except:
-                        if iso8601:
-                            raise
-                # try to apply some standard patterns
-                value = value.replace('T', ' ')
-                value = value.replace('_', ' ')
-                value = value.replace('-', ' ')
-                value = value.replace(':', ' ')
-                value = value.replace(',', ' ')
-                value = value.replace('Z', ' ')
-                value = value.replace('W', ' ')
-                # check for ordinal date (julian date)
-                parts = value.split(' ')
-                # check for patterns
-                if len(parts) == 1 and len(value) == 7 and value.isdigit():
-                    # looks like an compact ordinal date string
-                    pattern = "%Y%j"
-                elif len(parts) > 1 and len(parts[1]) == 3 and \
-                        parts[1].isdigit():
-                    # looks like an ordinal date string
-                    value = ''.join(parts)
-                    if len(parts) > 2:
-                        pattern = "%Y%j%H%M%S"
-                    else:
-                        pattern = "%Y%j"
-                else:
-                    # some parts should have 2 digits
-                    for i in range(1, min(len(parts), 6)):
-                        if len(parts[i]) == 1:
-                            parts[i] = '0' + parts[i]
-                    # standard date string
-                    value = ''.join(parts)
-                    if len(value) > 8:
-                        pattern = "%Y%m%d%H%M%S"
-                    else:
-                        pattern = "%Y%m%d"
-                ms = 0
-                if '.' in value:
-                    parts = value.split('.')
-                    value = parts[0].strip()
-                    try:
-                        ms = float('.' + parts[1].strip())
-                    except:
-                        pass
-                # all parts should be digits now - here we filter unknown
-                # patterns and pass it directly to Python's  datetime.datetime
-                if not ''.join(parts).isdigit():
-                    dt = datetime.datetime(*args, **kwargs)
-                    self._fromDateTime(dt)
+                key = (value, iso8601)
+                try:
+                    self.timestamp = _STRING_CACHE[key]
                     return
-                dt = datetime.datetime.strptime(value, pattern)
-                self._fromDateTime(dt, ms)
+                except KeyError:
+                    pass
+                timestamp = _parseCommonString(value, iso8601)
+                if timestamp is None:
+                    self._fromString(value, iso8601)
+                    timestamp = self.timestamp
+                else:
+                    self.timestamp = timestamp
+                if len(_STRING_CACHE) >= _STRING_CACHE_SIZE:
+                    _STRING_CACHE.clear()
+                _STRING_CACHE[key] = timestamp
                 return
         # check for ordinal/julian date kwargs
         if 'julday' in kwargs:
@@ -336,6 +380,73 @@ class UTCDateTime(object):
         dt = datetime.datetime(*args, **kwargs)
         self._fromDateTime(dt)
 
+    def _fromString(self, value, iso8601=False):
+        """
+        Use a date time string to set current time.
+
+        :type value: str
+        :param value: Stripped date time string.
+        :type iso8601: boolean, optional
+        :param iso8601: Enforce ISO8601:2004 detection.
+        """
+        # check for ISO8601 date string
+        if value.count("T") == 1 or iso8601:
+            try:
+                self.timestamp = self._parseISO8601(value).timestamp
+                return
+            except:
+                if iso8601:
+                    raise
+        # try to apply some standard patterns
+        value = value.replace('T', ' ')
+        value = value.replace('_', ' ')
+        value = value.replace('-', ' ')
+        value = value.replace(':', ' ')
+        value = value.replace(',', ' ')
+        value = value.replace('Z', ' ')
+        value = value.replace('W', ' ')
+        # check for ordinal date (julian date)
+        parts = value.split(' ')
+        # check for patterns
+        if len(parts) == 1 and len(value) == 7 and value.isdigit():
+            # looks like an compact ordinal date string
+            pattern = "%Y%j"
+        elif len(parts) > 1 and len(parts[1]) == 3 and \
+                parts[1].isdigit():
+            # looks like an ordinal date string
+            value = ''.join(parts)
+            if len(parts) > 2:
+                pattern = "%Y%j%H%M%S"
+            else:
+                pattern = "%Y%j"
+        else:
+            # some parts should have 2 digits
+            for i in range(1, min(len(parts), 6)):
+                if len(parts[i]) == 1:
+                    parts[i] = '0' + parts[i]
+            # standard date string
+            value = ''.join(parts)
+            if len(value) > 8:
+                pattern = "%Y%m%d%H%M%S"
+            else:
+                pattern = "%Y%m%d"
+        ms = 0
+        if '.' in value:
+            parts = value.split('.')
+            value = parts[0].strip()
+            try:
+                ms = float('.' + parts[1].strip())
+            except:
+                pass
+        # all parts should be digits now - here we filter unknown
+        # patterns and pass it directly to Python's  datetime.datetime
+        if not ''.join(parts).isdigit():
+            dt = datetime.datetime(value)
+            self._fromDateTime(dt)
+            return
+        dt = datetime.datetime.strptime(value, pattern)
+        self._fromDateTime(dt, ms)
+
     def _set(self, **kwargs):
         """
         Sets current timestamp using kwargs.
@@ -890,6 +1001,8 @@ class UTCDateTime(object):
         """
         if isinstance(value, UTCDateTime):
             return round(self.timestamp - value.timestamp, self.__precision)
+        elif isinstance(value, UTCDateTimeArray):
+            return value.__rsub__(self)
         elif isinstance(value, datetime.timedelta):
             # see datetime.timedelta.total_seconds
             value = (value.microseconds + (value.seconds + value.days *
@@ -908,8 +1021,9 @@ class UTCDateTime(object):
         >>> str(dt)
         '2008-10-01T12:30:35.045020Z'
         """
+        ms_pattern = "%%0.%df" % self.__precision
         return "%s%sZ" % (self.strftime('%Y-%m-%dT%H:%M:%S'),
-                          (self.__ms_pattern % (abs(self.timestamp % 1)))[1:])
+                          (ms_pattern % (abs(self.timestamp % 1)))[1:])
 
     def __unicode__(self):
         """
@@ -925,6 +1039,24 @@ class UTCDateTime(object):
         """
         return str(self.__str__())
 
+    def _roundedDiff(self, other):
+        """
+        Returns the difference to other in seconds as used by the rich
+        comparison operators.
+
+        Differences of at least one unit of the precision keep their sign and
+        stay non-zero when rounded to the precision, so the rather expensive
+        rounding is only done for smaller differences.
+        """
+        if type(other) is UTCDateTime:
+            diff = self.timestamp - other.timestamp
+        else:
+            diff = self.timestamp - float(other)
+        limit = 10.0 ** -self.__precision
+        if -limit < diff < limit:
+            return round(diff, self.__precision)
+        return diff
+
     def __eq__(self, other):
         """
         Rich comparison operator '=='.
@@ -951,7 +1083,7 @@ class UTCDateTime(object):
         False
         """
         try:
-            return round(self.timestamp - float(other), self.__precision) == 0
+            return self._roundedDiff(other) == 0
         except (TypeError, ValueError):
             return False
 
@@ -1008,7 +1140,7 @@ class UTCDateTime(object):
         True
         """
         try:
-            return round(self.timestamp - float(other), self.__precision) < 0
+            return self._roundedDiff(other) < 0
         except (TypeError, ValueError):
             return False
 
@@ -1038,7 +1170,7 @@ class UTCDateTime(object):
         False
         """
         try:
-            return round(self.timestamp - float(other), self.__precision) <= 0
+            return self._roundedDiff(other) <= 0
         except (TypeError, ValueError):
             return False
 
@@ -1068,7 +1200,7 @@ class UTCDateTime(object):
         True
         """
         try:
-            return round(self.timestamp - float(other), self.__precision) > 0
+            return self._roundedDiff(other) > 0
         except (TypeError, ValueError):
             return False
 
@@ -1098,7 +1230,7 @@ class UTCDateTime(object):
         False
         """
         try:
-            return round(self.timestamp - float(other), self.__precision) >= 0
+            return self._roundedDiff(other) >= 0
         except (TypeError, ValueError):
             return False
 
@@ -1126,6 +1258,17 @@ class UTCDateTime(object):
         # explicitly flag it as unhashable
         return None
 
+    def __getstate__(self):
+        return self.timestamp, self.__precision
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # objects pickled before UTCDateTime used __slots__
+            state = (state['timestamp'],
+                     state.get('_UTCDateTime__precision',
+                               self.DEFAULT_PRECISION))
+        self.timestamp, self.__precision = state
+
     def strftime(self, format):
         """
         Return a string representing the date and time, controlled by an
@@ -1416,7 +1559,6 @@ class UTCDateTime(object):
             12
         """
         self.__precision = int(value)
-        self.__ms_pattern = "%%0.%df" % (self.__precision)
 
     precision = property(_getPrecision, _setPrecision)
 
@@ -1451,6 +1593,308 @@ class UTCDateTime(object):
         return UTCDateTime()
 
 
+def _roundNanoseconds(ns, precision):
+    """
+    Rounds integer nanoseconds to the given number of decimal digits of a
+    second using round half to even, like Python's built-in round().
+    """
+    if precision >= 9:
+        return ns
+    unit = 10 ** (9 - precision)
+    quotient, remainder = np.divmod(ns, unit)
+    up = (2 * remainder > unit) | ((2 * remainder == unit) &
+                                   (quotient % 2 == 1))
+    return (quotient + up) * unit
+
+
+# POSIX timestamps representable as int64 nanoseconds, about 1677-09-21 to
+# 2262-04-11
+_NANOSECOND_RANGE = (-9223372036, 9223372036)
+
+
+def _checkNanosecondRange(timestamp):
+    """
+    Raises a ValueError if any POSIX timestamp can not be represented as
+    int64 nanoseconds.
+    """
+    timestamp = np.asarray(timestamp)
+    if not np.all((timestamp >= _NANOSECOND_RANGE[0]) &
+                  (timestamp < _NANOSECOND_RANGE[1])):
+        msg = "UTCDateTimeArray only supports times between 1677-09-21 " + \
+              "and 2262-04-11 (int64 nanoseconds since 1970-01-01)."
+        raise ValueError(msg)
+
+
+def _timestampToNanoseconds(timestamp):
+    """
+    Converts POSIX timestamps in seconds into int64 nanoseconds.
+
+    Integer and fractional seconds are converted separately - a single float
+    multiplication would lose the sub-microsecond digits for recent dates.
+    Raises a ValueError for times outside the int64 nanosecond range.
+    """
+    timestamp = np.asarray(timestamp, dtype=np.float64)
+    _checkNanosecondRange(timestamp)
+    seconds = np.floor(timestamp)
+    fraction = np.round((timestamp - seconds) * 1e9)
+    return seconds.astype(np.int64) * 1000000000 + fraction.astype(np.int64)
+
+
+def _datetime64ToNanoseconds(values):
+    """
+    Converts a NumPy datetime64 array of any unit into int64 nanoseconds.
+
+    NumPy silently wraps around on overflow, so the range is checked on the
+    full seconds first.
+    """
+    _checkNanosecondRange(values.astype('datetime64[s]').astype(np.int64))
+    return values.astype('datetime64[ns]').astype(np.int64)
+
+
+def _nanosecondsToTimestamp(ns):
+    """
+    Converts int64 nanoseconds into POSIX timestamps in seconds.
+    """
+    seconds, fraction = np.divmod(ns, 1000000000)
+    return seconds.astype(np.float64) + fraction / 1e9
+
+
+class UTCDateTimeArray(object):
+    """
+    An array of UTC-based points in time.
+
+    Stores the times as NumPy array of int64 nanoseconds since
+    1970-01-01T00:00:00 UTC so that parsing, arithmetic and comparisons of
+    many time stamps are performed vectorized instead of creating a
+    :class:`~obspy.core.utcdatetime.UTCDateTime` object for each single value.
+
+    :type values: list or :class:`numpy.ndarray`
+    :param values: Sequence of :class:`~obspy.core.utcdatetime.UTCDateTime`
+        objects, POSIX timestamps, :class:`datetime.datetime` objects or
+        strings or a NumPy ``datetime64`` array. Calendar date strings like
+        ``"2009-08-24T00:20:03.5Z"`` are parsed by NumPy directly, all other
+        strings are passed on to
+        :class:`~obspy.core.utcdatetime.UTCDateTime`.
+    :type precision: int, optional
+    :param precision: Sets the precision used by the rich comparison operators
+        and the subtraction of two arrays. Defaults to
+        :attr:`UTCDateTime.DEFAULT_PRECISION`.
+
+    .. rubric:: Example
+
+    >>> times = UTCDateTimeArray(["2009-08-24T00:20:03",
+    ...                           "2009-08-24T00:20:07.5Z"])
+    >>> times  # doctest: +NORMALIZE_WHITESPACE
+    UTCDateTimeArray(['2009-08-24T00:20:03.000000Z',
+                      '2009-08-24T00:20:07.500000Z'])
+    >>> times[1]
+    UTCDateTime(2009, 8, 24, 0, 20, 7, 500000)
+    >>> times + 0.5  # doctest: +NORMALIZE_WHITESPACE
+    UTCDateTimeArray(['2009-08-24T00:20:03.500000Z',
+                      '2009-08-24T00:20:08.000000Z'])
+    >>> (times - UTCDateTime("2009-08-24T00:20:00")).tolist()
+    [3.0, 7.5]
+    >>> (times > UTCDateTime("2009-08-24T00:20:05")).tolist()
+    [False, True]
+    """
+    def __init__(self, values=None, precision=None):
+        if precision is None:
+            precision = UTCDateTime.DEFAULT_PRECISION
+        self.precision = int(precision)
+        if values is None:
+            values = []
+        if isinstance(values, UTCDateTimeArray):
+            self.ns = values.ns.copy()
+            return
+        if isinstance(values, np.ndarray) and values.dtype.kind == 'M':
+            self.ns = _datetime64ToNanoseconds(values)
+            return
+        if isinstance(values, np.ndarray) and values.dtype.kind in 'iuf':
+            self.ns = _timestampToNanoseconds(values)
+            return
+        values = list(values)
+        if values and all(isinstance(_i, (str, native_str))
+                          for _i in values) and \
+                all(_ISO8601_CALENDAR.match(_i) for _i in values):
+            values = np.array([_i.rstrip('Z') for _i in values],
+                              dtype='datetime64')
+            self.ns = _datetime64ToNanoseconds(values)
+            return
+        timestamps = []
+        for value in values:
+            if not isinstance(value, UTCDateTime):
+                value = UTCDateTime(value)
+            timestamps.append(value.timestamp)
+        self.ns = _timestampToNanoseconds(timestamps)
+
+    @classmethod
+    def fromNanoseconds(cls, ns, precision=None):
+        """
+        Creates a new UTCDateTimeArray from integer nanoseconds since
+        1970-01-01T00:00:00 UTC.
+
+        >>> UTCDateTimeArray.fromNanoseconds([0, 1500000000])
+        UTCDateTimeArray(['1970-01-01T00:00:00.000000Z', \
+'1970-01-01T00:00:01.500000Z'])
+        """
+        times = cls(precision=precision)
+        times.ns = np.array(ns, dtype=np.int64)
+        return times
+
+    def _getTimeStamps(self):
+        """
+        Returns POSIX timestamps of all times as float array.
+
+        >>> times = UTCDateTimeArray([UTCDateTime(0.5), UTCDateTime(10)])
+        >>> times.timestamp.tolist()
+        [0.5, 10.0]
+        """
+        return _nanosecondsToTimestamp(self.ns)
+
+    timestamp = property(_getTimeStamps)
+
+    def _getDateTime64(self):
+        """
+        Returns all times as NumPy ``datetime64[ns]`` array.
+        """
+        return self.ns.astype('datetime64[ns]')
+
+    datetime64 = property(_getDateTime64)
+
+    def toUTCDateTimes(self):
+        """
+        Returns all times as list of
+        :class:`~obspy.core.utcdatetime.UTCDateTime` objects.
+        """
+        return [UTCDateTime(_i, precision=self.precision)
+                for _i in self.timestamp.tolist()]
+
+    def round(self, precision=None):
+        """
+        Returns a new UTCDateTimeArray rounded to the given number of decimal
+        digits of a second.
+
+        :type precision: int, optional
+        :param precision: Number of decimal digits. Defaults to
+            :attr:`~UTCDateTimeArray.precision`.
+
+        >>> times = UTCDateTimeArray([UTCDateTime(0.1234567)])
+        >>> times.round(3)
+        UTCDateTimeArray(['1970-01-01T00:00:00.123000Z'])
+        """
+        if precision is None:
+            precision = self.precision
+        return self.fromNanoseconds(_roundNanoseconds(self.ns, precision),
+                                    precision=self.precision)
+
+    def _toNanoseconds(self, other):
+        """
+        Returns nanoseconds of a UTCDateTimeArray, UTCDateTime or timestamps.
+        """
+        if isinstance(other, UTCDateTimeArray):
+            return other.ns
+        if isinstance(other, UTCDateTime):
+            return _timestampToNanoseconds(other.timestamp)
+        if isinstance(other, np.ndarray) and other.dtype.kind == 'M':
+            return _datetime64ToNanoseconds(other)
+        return _timestampToNanoseconds(other)
+
+    def __len__(self):
+        return len(self.ns)
+
+    def __getitem__(self, index):
+        """
+        Returns a single :class:`~obspy.core.utcdatetime.UTCDateTime` for an
+        integer index and a new UTCDateTimeArray for slices and index arrays.
+        """
+        ns = self.ns[index]
+        if isinstance(ns, np.ndarray):
+            return self.fromNanoseconds(ns, precision=self.precision)
+        return UTCDateTime(float(_nanosecondsToTimestamp(ns)),
+                           precision=self.precision)
+
+    def __iter__(self):
+        return iter(self.toUTCDateTimes())
+
+    def __add__(self, value):
+        """
+        Adds seconds given as float or float array to all times.
+        """
+        if isinstance(value, (UTCDateTime, UTCDateTimeArray)):
+            raise TypeError
+        value = np.round(np.asarray(value, dtype=np.float64) * 1e9)
+        return self.fromNanoseconds(self.ns + value.astype(np.int64),
+                                    precision=self.precision)
+
+    __radd__ = __add__
+
+    def __sub__(self, value):
+        """
+        Subtracting two points in time results in a float array of seconds
+        rounded to :attr:`~UTCDateTimeArray.precision`, subtracting seconds
+        results in a new UTCDateTimeArray.
+        """
+        if isinstance(value, (UTCDateTime, UTCDateTimeArray)) or \
+                (isinstance(value, np.ndarray) and value.dtype.kind == 'M'):
+            diff = (self.ns - self._toNanoseconds(value)) / 1e9
+            return np.round(diff, self.precision)
+        return self + -np.asarray(value, dtype=np.float64)
+
+    def __rsub__(self, value):
+        if isinstance(value, UTCDateTime):
+            diff = (self._toNanoseconds(value) - self.ns) / 1e9
+            return np.round(diff, self.precision)
+        raise TypeError
+
+    def _compare(self, other):
+        """
+        Returns the differences to other rounded to precision as int array.
+        """
+        return _roundNanoseconds(self.ns - self._toNanoseconds(other),
+                                 self.precision)
+
+    def __eq__(self, other):
+        """
+        Rich comparison operator '==' of all times, using
+        :attr:`~UTCDateTimeArray.precision` like
+        :meth:`UTCDateTime.__eq__`.
+        """
+        try:
+            return self._compare(other) == 0
+        except (TypeError, ValueError):
+            return np.zeros(len(self), dtype=bool)
+
+    def __ne__(self, other):
+        return ~self.__eq__(other)
+
+    def __lt__(self, other):
+        return self._compare(other) < 0
+
+    def __le__(self, other):
+        return self._compare(other) <= 0
+
+    def __gt__(self, other):
+        return self._compare(other) > 0
+
+    def __ge__(self, other):
+        return self._compare(other) >= 0
+
+    # an array with element-wise comparison operators is not hashable
+    __hash__ = None
+
+    def __repr__(self):
+        times = ", ".join("'%s'" % _i for _i in self.toUTCDateTimes())
+        return "UTCDateTimeArray([%s])" % times
+
+    def _getPrecision(self):
+        return self.__precision
+
+    def _setPrecision(self, value=6):
+        self.__precision = int(value)
+
+    precision = property(_getPrecision, _setPrecision)
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod(exclude_empty=True)
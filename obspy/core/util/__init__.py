@@ -26,15 +26,32 @@ from obspy.core.util.base import NamedTemporaryFile, \
     ALL_MODULES, DEFAULT_MODULES, NATIVE_BYTEORDER, \
     createEmptyDataChunk, getExampleFile, getMatplotlibVersion, \
     NETWORK_MODULES, _readFromPlugin, getScriptDirName
-from obspy.core.util.testing import add_doctests, add_unittests
 from obspy.core.util.decorator import deprecated, deprecated_keywords, \
     skip, skipIf, uncompressFile
 from obspy.core.util.geodetics import FlinnEngdahl
 from obspy.core.util.geodetics import calcVincentyInverse, gps2DistAzimuth, \
     kilometer2degrees, locations2degrees
 from obspy.core.util.misc import BAND_CODE, complexifyString, guessDelta, \
-    scoreatpercentile, toIntOrZero, loadtxt, CatchOutput
+    scoreatpercentile, toIntOrZero, loadtxt, CatchOutput, worker_pool
 from obspy.core.util.obspy_types import OrderedDict, Enum, \
     ComplexWithUncertainties, FloatWithUncertainties
 from obspy.core.util.xmlwrapper import XMLParser, tostring, register_namespace
 from obspy.core.util.version import get_git_version as _getVersionString
+
+
+# obspy.core.util.testing imports matplotlib, which takes a while. It is
+# therefore only imported when the test suites get assembled.
+def add_doctests(testsuite, module_name):
+    """
+    See :func:`obspy.core.util.testing.add_doctests`.
+    """
+    from obspy.core.util.testing import add_doctests
+    return add_doctests(testsuite, module_name)
+
+
+def add_unittests(testsuite, module_name):
+    """
+    See :func:`obspy.core.util.testing.add_unittests`.
+    """
+    from obspy.core.util.testing import add_unittests
+    return add_unittests(testsuite, module_name)
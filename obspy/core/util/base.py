@@ -12,14 +12,18 @@ from __future__ import unicode_literals
 from __future__ import print_function
 from future.builtins import map
 from future.builtins import range
+from future.builtins import str
 from future.utils import native_str
 from obspy.core.util.misc import toIntOrZero
 from obspy.core.util.obspy_types import OrderedDict
-from pkg_resources import iter_entry_points, load_entry_point
-import doctest
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
 import inspect
 import numpy as np
 import os
+import struct
 import sys
 import tempfile
 
@@ -187,6 +191,7 @@ def _getEntryPoints(group, subgroup=None):
     >>> _getEntryPoints('obspy.plugin.waveform')  # doctest: +ELLIPSIS
     {...'SLIST': EntryPoint.parse('SLIST = obspy.core.ascii')...}
     """
+    from pkg_resources import iter_entry_points
     features = {}
     for ep in iter_entry_points(group):
         if subgroup:
@@ -217,24 +222,79 @@ def _getOrderedEntryPoints(group, subgroup=None, order_list=[]):
     return entry_points
 
 
-ENTRY_POINTS = {
-    'trigger': _getEntryPoints('obspy.plugin.trigger'),
-    'filter': _getEntryPoints('obspy.plugin.filter'),
-    'rotate': _getEntryPoints('obspy.plugin.rotate'),
-    'detrend': _getEntryPoints('obspy.plugin.detrend'),
-    'integrate': _getEntryPoints('obspy.plugin.integrate'),
-    'differentiate': _getEntryPoints('obspy.plugin.differentiate'),
-    'waveform': _getOrderedEntryPoints('obspy.plugin.waveform',
-                                       'readFormat', WAVEFORM_PREFERRED_ORDER),
-    'waveform_write': _getOrderedEntryPoints(
-        'obspy.plugin.waveform', 'writeFormat', WAVEFORM_PREFERRED_ORDER),
-    'event': _getEntryPoints('obspy.plugin.event', 'readFormat'),
-    'event_write': _getEntryPoints('obspy.plugin.event', 'writeFormat'),
-    'taper': _getEntryPoints('obspy.plugin.taper'),
-    'inventory': _getEntryPoints('obspy.plugin.inventory', 'readFormat'),
-    'inventory_write': _getEntryPoints('obspy.plugin.inventory',
-                                       'writeFormat'),
-}
+class _LazyEntryPoints(Mapping):
+    """
+    Read-only mapping of the entry points of all plug-in groups.
+
+    Scanning the installed packages for entry points is rather slow, so every
+    group is only scanned on first access.
+    """
+    def __init__(self, groups):
+        self._groups = groups
+        self._entry_points = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._entry_points[key]
+        except KeyError:
+            func, args = self._groups[key]
+            value = self._entry_points[key] = func(*args)
+            return value
+
+    def __contains__(self, key):
+        # does not need to scan the group
+        return key in self._groups
+
+    def __iter__(self):
+        return iter(self._groups)
+
+    def __len__(self):
+        return len(self._groups)
+
+    def copy(self):
+        return dict(self.items())
+
+
+class _LazyEntryPointGroup(Mapping):
+    """
+    Read-only view of a single group of :class:`_LazyEntryPoints`, scanned
+    on first access.
+    """
+    def __init__(self, entry_points, group):
+        self._entry_points = entry_points
+        self._group = group
+
+    def __getitem__(self, key):
+        return self._entry_points[self._group][key]
+
+    def __iter__(self):
+        return iter(self._entry_points[self._group])
+
+    def __len__(self):
+        return len(self._entry_points[self._group])
+
+    def copy(self):
+        return self._entry_points[self._group].copy()
+
+
+ENTRY_POINTS = _LazyEntryPoints({
+    'trigger': (_getEntryPoints, ('obspy.plugin.trigger', )),
+    'filter': (_getEntryPoints, ('obspy.plugin.filter', )),
+    'rotate': (_getEntryPoints, ('obspy.plugin.rotate', )),
+    'detrend': (_getEntryPoints, ('obspy.plugin.detrend', )),
+    'integrate': (_getEntryPoints, ('obspy.plugin.integrate', )),
+    'differentiate': (_getEntryPoints, ('obspy.plugin.differentiate', )),
+    'waveform': (_getOrderedEntryPoints, (
+        'obspy.plugin.waveform', 'readFormat', WAVEFORM_PREFERRED_ORDER)),
+    'waveform_write': (_getOrderedEntryPoints, (
+        'obspy.plugin.waveform', 'writeFormat', WAVEFORM_PREFERRED_ORDER)),
+    'event': (_getEntryPoints, ('obspy.plugin.event', 'readFormat')),
+    'event_write': (_getEntryPoints, ('obspy.plugin.event', 'writeFormat')),
+    'taper': (_getEntryPoints, ('obspy.plugin.taper', )),
+    'inventory': (_getEntryPoints, ('obspy.plugin.inventory', 'readFormat')),
+    'inventory_write': (_getEntryPoints, (
+        'obspy.plugin.inventory', 'writeFormat')),
+})
 
 
 def _getFunctionFromEntryPoint(group, type):
@@ -275,8 +335,15 @@ def _getFunctionFromEntryPoint(group, type):
     # import function point
     # any issue during import of entry point should be raised, so the user has
     # a chance to correct the problem
+    key = (group, entry_point.name, None)
+    try:
+        return _PLUGIN_FUNCTIONS[key]
+    except KeyError:
+        pass
+    from pkg_resources import load_entry_point
     func = load_entry_point(entry_point.dist.key, 'obspy.plugin.%s' % (group),
                             entry_point.name)
+    _PLUGIN_FUNCTIONS[key] = func
     return func
 
 
@@ -302,26 +369,189 @@ def getMatplotlibVersion():
     return version
 
 
+# Number of bytes read from the beginning of a file for the quick format checks
+# in _FORMAT_CHECKS.
+_HEADER_SIZE = 4096
+
+
+def _checkMSEED(header):
+    # same as the first checks of obspy.mseed.core.isMSEED
+    if len(header) < 7:
+        return False
+    seqnr = header[0:6].replace(b'\x00', b' ').strip()
+    if not seqnr.isdigit() and seqnr != b'':
+        return False
+    if header[6:7] in (b'D', b'R', b'Q', b'M'):
+        return True
+    if header[6:7] == b'V':
+        # full SEED volume, needs to be checked for data records
+        return None
+    return False
+
+
+def _checkSAC(header):
+    # header version number, see obspy.sac.core.isSAC
+    if len(header) < 436:
+        return False
+    nvhdr = struct.unpack(native_str('<i'), header[304:308])[0]
+    if nvhdr < 0 or nvhdr > 20:
+        nvhdr = struct.unpack(native_str('>i'), header[304:308])[0]
+    if nvhdr < 1 or nvhdr > 20:
+        return False
+    return None
+
+
+def _checkSEGY(header):
+    # data sample format code in the binary file header
+    if len(header) < 3226:
+        return False
+    for fmt in ('>h', '<h'):
+        if 1 <= struct.unpack(native_str(fmt), header[3224:3226])[0] <= 8:
+            return None
+    return False
+
+
+def _checkSU(header):
+    # whole file is a multiple of 4 bytes long
+    if len(header) < 244:
+        return False
+    if len(header) < _HEADER_SIZE and len(header) % 4:
+        return False
+    return None
+
+
+def _checkCSS(header):
+    # fixed line length and two epochal times
+    if len(header) < 283 or header[26:27] != b'.' or header[71:72] != b'.':
+        return False
+    return None
+
+
+def _checkMagic(*magic, **kwargs):
+    """
+    Returns a check for files starting with one of the given byte strings.
+
+    Unless ``sure=False`` is given, a file starting with the given bytes is
+    known to be of that format without calling isFormat.
+    """
+    result = True if kwargs.get('sure', True) else None
+
+    def check(header):
+        if header.startswith(magic):
+            return result
+        return False
+    return check
+
+
+# Quick checks of the first bytes of a file used by _readFromPlugin to skip
+# formats that can not match without calling (and opening the file in) their
+# isFormat function. A check returns False if the file can not be in this
+# format, True if it certainly is and None if isFormat has to decide.
+_FORMAT_CHECKS = {
+    'waveform': {
+        'MSEED': _checkMSEED,
+        'SAC': _checkSAC,
+        'GSE2': _checkMagic(b'WID2'),
+        'SEISAN': lambda header: None if len(header) >= 960 else False,
+        'SACXY': lambda header: False if b'\0' in header[:512] else None,
+        'GSE1': _checkMagic(b'WID1', b'XW01'),
+        'Q': _checkMagic(b'43981'),
+        'SH_ASC': _checkMagic(b'DELTA:'),
+        'SLIST': _checkMagic(b'TIMESERIES', sure=False),
+        'TSPAIR': _checkMagic(b'TIMESERIES', sure=False),
+        'Y': _checkMagic(b'I\x1f', b'M\x1f', sure=False),
+        'SEGY': _checkSEGY,
+        'SU': _checkSU,
+        'SEG2': _checkMagic(b'\x55\x3a\x01\x00', b'\x3a\x55\x00\x01'),
+        'WAV': _checkMagic(b'RIFF', sure=False),
+        'PICKLE': _checkMagic(b'\x80', b'c', b'(', sure=False),
+        'DATAMARK': lambda header: None if len(header) >= 18 else False,
+        'CSS': _checkCSS,
+    },
+}
+
+# cache of the isFormat/readFormat functions of all plug-ins
+_PLUGIN_FUNCTIONS = {}
+
+# last detected format per plug-in type and directory
+_FORMAT_HINTS = {}
+_FORMAT_HINTS_SIZE = 1000
+
+
+def _getPluginFunction(plugin_type, format_ep, method):
+    """
+    Returns the (cached) function of a plug-in, e.g. its isFormat function.
+    """
+    key = (plugin_type, format_ep.name, method)
+    try:
+        return _PLUGIN_FUNCTIONS[key]
+    except KeyError:
+        pass
+    from pkg_resources import load_entry_point
+    func = load_entry_point(
+        format_ep.dist.key,
+        'obspy.plugin.%s.%s' % (plugin_type, format_ep.name), method)
+    _PLUGIN_FUNCTIONS[key] = func
+    return func
+
+
+def _detectFormat(plugin_type, filename):
+    """
+    Returns the entry point of the format of the given file.
+
+    The formats are checked in the order of ``ENTRY_POINTS[plugin_type]`` with
+    two shortcuts for files given by name:
+
+    * The format detected last for a file in the same directory is checked
+      first.
+    * The first bytes of the file are read once and the checks in
+      ``_FORMAT_CHECKS`` skip all formats which can not match. The isFormat
+      functions are only called for the remaining formats.
+    """
+    EPS = ENTRY_POINTS[plugin_type]
+    hint_key = hint = header = None
+    if isinstance(filename, (str, native_str)):
+        hint_key = (plugin_type, os.path.dirname(filename))
+        hint = _FORMAT_HINTS.get(hint_key)
+        if hint in EPS:
+            isFormat = _getPluginFunction(plugin_type, EPS[hint], 'isFormat')
+            if isFormat(filename):
+                return EPS[hint]
+        try:
+            with open(filename, 'rb') as fh:
+                header = fh.read(_HEADER_SIZE)
+        except Exception:
+            header = None
+    checks = _FORMAT_CHECKS.get(plugin_type, {})
+    for name, format_ep in EPS.items():
+        if name == hint:
+            continue
+        result = None
+        if header is not None and name in checks:
+            result = checks[name](header)
+            if result is False:
+                continue
+        if result is None:
+            isFormat = _getPluginFunction(plugin_type, format_ep, 'isFormat')
+            if not isFormat(filename):
+                continue
+        if hint_key is not None:
+            if len(_FORMAT_HINTS) >= _FORMAT_HINTS_SIZE:
+                _FORMAT_HINTS.clear()
+            _FORMAT_HINTS[hint_key] = name
+        return format_ep
+    raise TypeError('Unknown format for file %s' % filename)
+
+
 def _readFromPlugin(plugin_type, filename, format=None, **kwargs):
     """
     Reads a single file from a plug-in's readFormat function.
     """
     EPS = ENTRY_POINTS[plugin_type]
     # get format entry point
-    format_ep = None
     if not format:
-        # auto detect format - go through all known formats in given sort order
-        for format_ep in list(EPS.values()):
-            # search isFormat for given entry point
-            isFormat = load_entry_point(
-                format_ep.dist.key,
-                'obspy.plugin.%s.%s' % (plugin_type, format_ep.name),
-                'isFormat')
-            # check format
-            if isFormat(filename):
-                break
-        else:
-            raise TypeError('Unknown format for file %s' % filename)
+        # auto detect format
+        format_ep = _detectFormat(plugin_type, filename)
     else:
         # format given via argument
         format = format.upper()
@@ -333,9 +563,7 @@ def _readFromPlugin(plugin_type, filename, format=None, **kwargs):
     # file format should be known by now
     try:
         # search readFormat for given entry point
-        readFormat = load_entry_point(
-            format_ep.dist.key,
-            'obspy.plugin.%s.%s' % (plugin_type, format_ep.name), 'readFormat')
+        readFormat = _getPluginFunction(plugin_type, format_ep, 'readFormat')
     except ImportError:
         msg = "Format \"%s\" is not supported. Supported types: %s"
         raise TypeError(msg % (format_ep.name, ', '.join(EPS)))
@@ -384,15 +612,21 @@ def make_format_plugin_table(group="waveform", method="read", numspaces=4,
     if method not in ("read", "write"):
         raise ValueError("no valid type: %s" % method)
 
+    from pkg_resources import iter_entry_points
+    key = group if method == "read" else group + "_write"
+    if key in ENTRY_POINTS:
+        eps = ENTRY_POINTS[key]
+    else:
+        eps = _getEntryPoints("obspy.plugin.%s" % group, method + "Format")
     method += "Format"
-    eps = _getOrderedEntryPoints("obspy.plugin.%s" % group, method,
-                                 WAVEFORM_PREFERRED_ORDER)
     mod_list = []
     for name, ep in eps.items():
         module_short = ":mod:`%s`" % ".".join(ep.module_name.split(".")[:2])
-        func = load_entry_point(ep.dist.key,
-                                "obspy.plugin.%s.%s" % (group, name), method)
-        func_str = ':func:`%s`' % ".".join((ep.module_name, func.__name__))
+        # the name of the function is taken from the entry point itself to
+        # avoid importing all plug-ins
+        func_ep = next(iter_entry_points("obspy.plugin.%s.%s" % (group, name),
+                                         method))
+        func_str = ':func:`%s`' % ".".join((ep.module_name, func_ep.attrs[-1]))
         mod_list.append((name, module_short, func_str))
 
     mod_list = sorted(mod_list)
@@ -429,4 +663,5 @@ class ComparingObject(object):
 
 
 if __name__ == '__main__':
+    import doctest
     doctest.testmod(exclude_empty=True)
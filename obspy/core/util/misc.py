@@ -446,6 +446,62 @@ def CatchOutput():
             pass
 
 
+def _check_parallel(parallel):
+    """
+    Raises a ValueError for invalid values of the ``parallel`` option of
+    :func:`worker_pool`, also accepting ``False`` and ``None`` (no pool).
+    """
+    if parallel in (False, None, True, "thread", "process") or \
+            hasattr(parallel, "map"):
+        return
+    msg = "parallel must be 'thread', 'process', True or an object " + \
+          "with a map method, not %s" % repr(parallel)
+    raise ValueError(msg)
+
+
+@contextmanager
+def worker_pool(parallel=True, workers=None):
+    """
+    A context manager providing a pool of workers with a ``map`` method.
+
+    Pools created here are closed and joined when leaving the context. A
+    pool-like object handed in is yielded unchanged and left open, so it can
+    be reused by the caller.
+
+    :type parallel: bool, str or pool-like object
+    :param parallel: ``"thread"`` for a thread pool, ``"process"`` or
+        ``True`` for a process pool. Any object with a ``map`` method (e.g. a
+        :class:`multiprocessing.pool.Pool` or a ``concurrent.futures``
+        executor) is used as is.
+    :type workers: int, optional
+    :param workers: Number of workers of a newly created pool. Defaults to
+        the number of CPUs.
+
+    >>> with worker_pool("thread", workers=2) as pool:
+    ...     print(list(pool.map(abs, [-1, -2, 3])))
+    [1, 2, 3]
+    """
+    _check_parallel(parallel)
+    if hasattr(parallel, "map"):
+        yield parallel
+        return
+    if parallel == "thread":
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(workers)
+    else:
+        from multiprocessing import Pool
+        pool = Pool(workers)
+    try:
+        yield pool
+    except BaseException:
+        pool.terminate()
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+
+
 def factorize_int(x):
     """
     Calculate prime factorization of integer.
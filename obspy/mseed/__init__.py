@@ -63,6 +63,16 @@ of each trace.
 >>> print(st[0].data)
 [2787 2776 2774 ..., 2850 2853 2853]
 
+Files too large to be read at once can be processed chunk by chunk with
+:func:`~obspy.mseed.core.iterMSEED`, which keeps only a given number of
+records in memory:
+
+>>> from obspy.mseed.core import iterMSEED
+>>> for tr in iterMSEED("/path/to/test.mseed"):  # doctest: +ELLIPSIS
+...     print(tr)
+NL.HGN.00.BHZ | 2003-05-29T02:13:22.043400Z - ... | 40.0 Hz, 5980 samples
+NL.HGN.00.BHZ | 2003-05-29T02:15:51.543400Z - ... | 40.0 Hz, 5967 samples
+
 Writing
 -------
 You may export the data to the file system using the
@@ -13,14 +13,17 @@ from future.builtins import str
 from future.utils import native_str
 
 from obspy.mseed.headers import clibmseed, ENCODINGS, HPTMODULUS, \
-    SAMPLETYPE, DATATYPES, \
+    SAMPLETYPE, DATATYPES, SAMPLESIZES, ENDIAN, \
     VALID_RECORD_LENGTHS, HPTERROR, SelectTime, Selections, blkt_1001_s, \
-    VALID_CONTROL_HEADERS, SEED_CONTROL_HEADERS, blkt_100_s
+    VALID_CONTROL_HEADERS, SEED_CONTROL_HEADERS, MINI_SEED_CONTROL_HEADERS, \
+    blkt_100_s
 from obspy.mseed import util
 
 from obspy import Stream, Trace, UTCDateTime
-from obspy.core.util import NATIVE_BYTEORDER
+from obspy.core import compatibility
+from obspy.core.util import NATIVE_BYTEORDER, OrderedDict
 import ctypes as C
+import fnmatch
 import numpy as np
 import os
 import warnings
@@ -107,7 +110,8 @@ def isMSEED(filename):
 
 def readMSEED(mseed_object, starttime=None, endtime=None, headonly=False,
               sourcename=None, reclen=None, recinfo=True, details=False,
-              header_byteorder=None, verbose=None, **kwargs):
+              header_byteorder=None, verbose=None, mmap=False, use_index=True,
+              **kwargs):
     """
     Reads a Mini-SEED file and returns a Stream object.
 
@@ -156,6 +160,20 @@ def readMSEED(mseed_object, starttime=None, endtime=None, headonly=False,
         little-endian, ``1`` or ``'>'`` for MBF or big-endian. ``'='`` is the
         native byteorder. Used to enforce the header byteorder. Useful in some
         rare cases where the automatic byte order detection fails.
+    :type mmap: bool, optional
+    :param mmap: If ``True``, files consisting only of uncompressed INT32,
+        FLOAT32 or FLOAT64 encoded data records with a constant record length
+        are accessed through a memory map instead of reading them into memory
+        first. Traces contained in a single record with native byteorder are
+        returned as (copy-on-write) views into the mapped file, the data of
+        all other traces is copied once from the map. Files not meeting
+        these criteria as well as file-like objects and the ``details``
+        option are silently handled the usual way. Defaults to ``False``.
+    :type use_index: bool, optional
+    :param use_index: If ``True`` and a time window or source name is given,
+        only the records of interest are read from files with an up-to-date
+        record index, see :func:`~obspy.mseed.util.buildRecordIndex`.
+        Defaults to ``True``.
 
     .. rubric:: Example
 
@@ -223,12 +241,35 @@ def readMSEED(mseed_object, starttime=None, endtime=None, headonly=False,
                 'byteorder': info['byteorder'],
                 'number_of_records': info['number_of_records']}
 
-    # If its a filename just read it.
-    if isinstance(mseed_object, (str, native_str)):
-        # Read to NumPy array which is used as a buffer.
-        buffer = np.fromfile(mseed_object, dtype='b')
-    elif hasattr(mseed_object, 'read'):
-        buffer = np.fromstring(mseed_object.read(), dtype='b')
+    if mmap and not details and isinstance(mseed_object, (str, native_str)):
+        segments = _readMSEEDMmap(mseed_object, starttime, endtime, headonly,
+                                  sourcename, header_byteorder)
+        if segments is not None:
+            traces = []
+            for header, data in segments:
+                trace = Trace(header=header, data=data)
+                if recinfo:
+                    for key, value in info.items():
+                        setattr(trace.stats.mseed, key, value)
+                traces.append(trace)
+            return Stream(traces=traces)
+
+    # Only read the records of interest if the file has a record index.
+    buffer = None
+    if use_index and isinstance(mseed_object, (str, native_str)) and not \
+            (starttime is None and endtime is None and sourcename is None):
+        buffer = _readIndexedRecords(mseed_object, starttime, endtime,
+                                     sourcename)
+        if buffer is not None and not len(buffer):
+            return Stream()
+
+    if buffer is None:
+        # If its a filename just read it.
+        if isinstance(mseed_object, (str, native_str)):
+            # Read to NumPy array which is used as a buffer.
+            buffer = np.fromfile(mseed_object, dtype='b')
+        elif hasattr(mseed_object, 'read'):
+            buffer = np.fromstring(mseed_object.read(), dtype='b')
 
     # Get the record length
     try:
@@ -404,6 +445,337 @@ def readMSEED(mseed_object, starttime=None, endtime=None, headonly=False,
     return Stream(traces=traces)
 
 
+def _selectRecords(headers, starttime=None, endtime=None, sourcename=None):
+    """
+    Selects records by time window and source name like ``ms_matchselect()``
+    of libmseed.
+
+    :param headers: Dictionary of per record arrays as returned by
+        :func:`~obspy.mseed.util._getRecordHeaders`.
+    :return: Boolean array of selected records and list of
+        ``(network, station, location, channel, dataquality)`` tuples.
+    """
+    selected = np.ones(len(headers['offset']), dtype=np.bool_)
+    if starttime is not None:
+        selected &= headers['endtime'] >= \
+            util._convertDatetimeToMSTime(starttime)
+    if endtime is not None:
+        selected &= headers['starttime'] <= \
+            util._convertDatetimeToMSTime(endtime)
+    ids = [tuple(_i.replace(b' ', b'').decode() for _i in key) for key in
+           zip(headers['network'], headers['station'], headers['location'],
+               headers['channel'], headers['dataquality'])]
+    if sourcename is not None:
+        pattern = sourcename.replace('.', '_') + '_*'
+        matches = {}
+        for i in np.nonzero(selected)[0]:
+            if ids[i] not in matches:
+                matches[ids[i]] = fnmatch.fnmatchcase('_'.join(ids[i]),
+                                                      pattern)
+            selected[i] = matches[ids[i]]
+    return selected, ids
+
+
+def _readIndexedRecords(filename, starttime=None, endtime=None,
+                        sourcename=None):
+    """
+    Reads only the records of interest using the record index of a file.
+
+    :return: Buffer with the selected records in file order or ``None`` if
+        the file has no up-to-date record index.
+    """
+    for value in (starttime, endtime):
+        if value is not None and not isinstance(value, UTCDateTime):
+            # leave raising the error to the caller
+            return None
+    if sourcename is not None and not isinstance(sourcename,
+                                                 (str, native_str)):
+        return None
+    index = util.readRecordIndex(filename)
+    if index is None:
+        return None
+    selected, _ = _selectRecords(index, starttime, endtime, sourcename)
+    offsets = index['offset'][selected]
+    reclen = index['record_length']
+    buffer = np.empty(len(offsets) * reclen, dtype='b')
+    # read runs of adjacent records at once
+    runs = np.split(offsets, np.nonzero(np.diff(offsets) != reclen)[0] + 1)
+    pos = 0
+    with open(filename, 'rb') as fh:
+        for run in runs:
+            if not len(run):
+                continue
+            size = len(run) * reclen
+            fh.seek(int(run[0]), 0)
+            buffer[pos:pos + size] = np.frombuffer(fh.read(size), dtype='b')
+            pos += size
+    return buffer
+
+
+def _readMSEEDMmap(filename, starttime=None, endtime=None, headonly=False,
+                   sourcename=None, header_byteorder=-1):
+    """
+    Reads uncompressed data records of a file through a memory map.
+
+    Records are selected and combined into continuous segments exactly as in
+    ``readMSEEDBuffer()`` of the libmseed wrapper.
+
+    :return: List of ``(header, data)`` tuples or ``None`` if the file can not
+        be handled that way.
+    """
+    import mmap
+    with open(filename, 'rb') as fh:
+        try:
+            info = util._getRecordInformation(fh)
+        except Exception:
+            return None
+        if info['excess_bytes'] or not info['filesize']:
+            return None
+        reclen = info['record_length']
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_COPY)
+    endian = ENDIAN.get(header_byteorder)
+    headers = util._getRecordHeaders(mm, reclen, endian=endian)
+    if headers is None or \
+            not np.all(np.in1d(headers['encoding'], [3, 4, 5])) or \
+            not np.all(np.in1d(headers['byteorder'], [0, 1])):
+        # only INT32, FLOAT32 and FLOAT64 encodings can be mapped directly
+        return None
+    # records must not exceed their bounds
+    sampletype = [ENCODINGS[_i][1] for _i in headers['encoding']]
+    itemsize = np.array([SAMPLESIZES[_i] for _i in sampletype])
+    if np.any(headers['data_offset'] + headers['samplecnt'] * itemsize >
+              reclen):
+        return None
+    selected, ids = _selectRecords(headers, starttime, endtime, sourcename)
+    # combine records to segments, see readMSEEDBuffer()
+    segments = OrderedDict()
+    start = headers['starttime'].tolist()
+    end = headers['endtime'].tolist()
+    samprate = headers['samprate'].tolist()
+    for i in np.nonzero(selected)[0].tolist():
+        id_segments = segments.setdefault(ids[i], [])
+        if id_segments:
+            seg = id_segments[-1]
+            hptimetol = int(0.5 * seg['hpdelta'])
+            lastgap = start[i] - seg['endtime'] - seg['hpdelta']
+            if seg['sampletype'] == sampletype[i] and samprate[i] and \
+                    abs(1.0 - seg['samprate'] / samprate[i]) < 0.0001 and \
+                    -hptimetol <= lastgap <= hptimetol:
+                seg['records'].append(i)
+                seg['endtime'] = end[i]
+                continue
+        id_segments.append({
+            'records': [i], 'starttime': start[i], 'endtime': end[i],
+            'samprate': samprate[i], 'sampletype': sampletype[i],
+            'hpdelta': int(HPTMODULUS / samprate[i]) if samprate[i] else 0})
+    # assemble the data
+    result = []
+    for (net, sta, loc, cha, quality), id_segments in segments.items():
+        for seg in id_segments:
+            recs = np.array(seg['records'])
+            npts = int(headers['samplecnt'][recs].sum())
+            header = {'network': net, 'station': sta, 'location': loc,
+                      'channel': cha, 'mseed': {'dataquality': quality},
+                      'sampling_rate': seg['samprate'],
+                      'starttime': util._convertMSTimeToDatetime(
+                          seg['starttime'])}
+            if headonly:
+                header['npts'] = npts
+                data = np.array([])
+            else:
+                data = _mmapSegmentData(mm, headers, recs, seg['sampletype'])
+            result.append((header, data))
+    return result
+
+
+def _mmapSegmentData(mm, headers, recs, sampletype):
+    """
+    Returns the samples of the given records of a memory mapped file.
+
+    A single record in native byteorder results in a view into the map,
+    otherwise the samples are copied into a new array.
+    """
+    dtype = np.dtype(DATATYPES[sampletype.encode()])
+    file_dtype = dtype.newbyteorder(ENDIAN[headers['byteorder'][recs[0]]])
+    counts = headers['samplecnt'][recs]
+    offsets = headers['offset'][recs] + headers['data_offset'][recs]
+    if len(recs) == 1 and file_dtype == dtype:
+        return np.ndarray(int(counts[0]), dtype=dtype, buffer=mm,
+                          offset=int(offsets[0]))
+    data = np.empty(int(counts.sum()), dtype=dtype)
+    raw = np.frombuffer(mm, dtype=np.uint8)
+    steps = np.diff(offsets)
+    byteorders = headers['byteorder'][recs]
+    if np.all(counts == counts[0]) and len(set(steps.tolist())) <= 1 and \
+            np.all(byteorders == byteorders[0]):
+        # evenly spaced records, e.g. a single channel file: one strided copy
+        step = int(steps[0]) if len(steps) else 0
+        view = np.ndarray((len(recs), int(counts[0])), dtype=file_dtype,
+                          buffer=raw, offset=int(offsets[0]),
+                          strides=(step, file_dtype.itemsize))
+        data.reshape(len(recs), int(counts[0]))[:] = view
+        return data
+    pos = 0
+    for count, offset, bo in zip(counts, offsets, byteorders):
+        count = int(count)
+        data[pos:pos + count] = np.ndarray(
+            count, dtype=dtype.newbyteorder(ENDIAN[bo]), buffer=raw,
+            offset=int(offset))
+        pos += count
+    return data
+
+
+def iterMSEED(mseed_object, chunksize=1, **kwargs):
+    """
+    Reads a Mini-SEED file chunk by chunk and yields the contained traces.
+
+    In contrast to :func:`readMSEED` only ``chunksize`` records are held in
+    memory at any time, thus arbitrarily large files or continuous data
+    streams can be processed with bounded memory usage.
+
+    :param mseed_object: Filename or open file like object that contains the
+        binary Mini-SEED data. Only a read() method is required, so e.g. the
+        file object of a socket works, too.
+    :type chunksize: int, optional
+    :param chunksize: Number of consecutive records decoded at once. The
+        records of a chunk are merged into continuous traces just like in
+        :func:`readMSEED`, traces of different chunks are never merged.
+        Defaults to ``1``, i.e. one trace per record.
+    :param kwargs: Passed on to :func:`readMSEED`, e.g. ``starttime``,
+        ``endtime``, ``sourcename``, ``headonly`` or ``details``.
+    :return: Generator of :class:`~obspy.core.trace.Trace` objects. The
+        encoding, byteorder and record length of the first record of each
+        chunk are stored in the ``stats.mseed`` AttribDict.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.util import getExampleFile
+    >>> filename = getExampleFile("BW.BGLD.__.EHE.D.2008.001.first_10_records")
+    >>> for tr in iterMSEED(filename, chunksize=4):
+    ...     print(tr)  # doctest: +ELLIPSIS
+    BW.BGLD..EHE | 2007-12-31T23:59:59.915000Z - ... | 200.0 Hz, 1648 samples
+    BW.BGLD..EHE | 2008-01-01T00:00:08.155000Z - ... | 200.0 Hz, 1648 samples
+    BW.BGLD..EHE | 2008-01-01T00:00:16.395000Z - ... | 200.0 Hz, 824 samples
+    """
+    if isinstance(mseed_object, (str, native_str)):
+        with open(mseed_object, 'rb') as fh:
+            for trace in iterMSEED(fh, chunksize, **kwargs):
+                yield trace
+        return
+    if chunksize < 1:
+        msg = 'chunksize must be a positive integer'
+        raise ValueError(msg)
+    kwargs['recinfo'] = False
+    records = []
+    while True:
+        record = _readRecord(mseed_object)
+        if record is not None:
+            records.append(record)
+        if records and (record is None or len(records) == chunksize):
+            buffer = compatibility.BytesIO(b''.join(_i[0] for _i in records))
+            info = records[0][1]
+            for trace in readMSEED(buffer, **kwargs):
+                trace.stats.mseed.encoding = ENCODINGS[info['encoding']][0]
+                trace.stats.mseed.byteorder = info['byteorder']
+                trace.stats.mseed.record_length = info['record_length']
+                yield trace
+            records = []
+        if record is None:
+            break
+
+
+def _readRecord(file_object):
+    """
+    Reads the next data record of a file like object.
+
+    :return: Tuple of the record and its information as returned by
+        :func:`~obspy.mseed.util.getRecordInformation` or ``None`` at the end
+        of the file.
+    """
+    # the first bytes of the smallest possible record contain blockette 1000
+    min_reclen = VALID_RECORD_LENGTHS[0]
+    record = _readExactly(file_object, min_reclen)
+    if not record:
+        return None
+    if len(record) < min_reclen or \
+            ord(record[6:7]) not in MINI_SEED_CONTROL_HEADERS:
+        msg = 'Not a valid Mini-SEED record'
+        raise ValueError(msg)
+    try:
+        info = util._getRecordInformation(compatibility.BytesIO(record))
+    except Exception:
+        msg = 'Not a valid Mini-SEED record'
+        raise ValueError(msg)
+    record += _readExactly(file_object, info['record_length'] - min_reclen)
+    if len(record) < info['record_length']:
+        msg = 'Incomplete last record of %i bytes skipped.' % len(record)
+        warnings.warn(msg)
+        return None
+    return record, info
+
+
+def _readExactly(file_object, size):
+    """
+    Reads up to size bytes, repeating short reads e.g. of sockets.
+    """
+    chunks = []
+    while size > 0:
+        chunk = file_object.read(size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def _createRecordTemplate(trace, dataquality, use_blkt_1001=False,
+                          use_blkt_100=False):
+    """
+    Creates the libmseed record template used for packing the data of a
+    trace.
+
+    The caller has to free the returned record with ``msr_free``.
+    """
+    msr = clibmseed.msr_init(None)
+    msr.contents.network = trace.stats.network.encode('ascii', 'strict')
+    msr.contents.station = trace.stats.station.encode('ascii', 'strict')
+    msr.contents.location = trace.stats.location.encode('ascii', 'strict')
+    msr.contents.channel = trace.stats.channel.encode('ascii', 'strict')
+    msr.contents.dataquality = dataquality.encode('ascii', 'strict')
+
+    # Only use Blockette 1001 if necessary.
+    if use_blkt_1001:
+        size = C.sizeof(blkt_1001_s)
+        blkt1001 = C.c_char(b' ')
+        C.memset(C.pointer(blkt1001), 0, size)
+        ret_val = clibmseed.msr_addblockette(msr, C.pointer(blkt1001),
+                                             size, 1001, 0)
+        # Usually returns a pointer to the added blockette in the
+        # blockette link chain and a NULL pointer if it fails.
+        # NULL pointers have a false boolean value according to the
+        # ctypes manual.
+        if bool(ret_val) is False:
+            clibmseed.msr_free(C.pointer(msr))
+            del msr
+            raise Exception('Error in msr_addblockette')
+    # Only use Blockette 100 if necessary.
+    if use_blkt_100:
+        size = C.sizeof(blkt_100_s)
+        blkt100 = C.c_char(b' ')
+        C.memset(C.pointer(blkt100), 0, size)
+        ret_val = clibmseed.msr_addblockette(
+            msr, C.pointer(blkt100), size, 100, 0)  # NOQA
+        # Usually returns a pointer to the added blockette in the
+        # blockette link chain and a NULL pointer if it fails.
+        # NULL pointers have a false boolean value according to the
+        # ctypes manual.
+        if bool(ret_val) is False:
+            clibmseed.msr_free(C.pointer(msr))  # NOQA
+            del msr  # NOQA
+            raise Exception('Error in msr_addblockette')
+    return msr
+
+
 def writeMSEED(stream, filename, encoding=None, reclen=None, byteorder=None,
                flush=1, verbose=0, **_kwargs):
     """
@@ -691,44 +1063,8 @@ def writeMSEED(stream, filename, encoding=None, reclen=None, byteorder=None,
 
         # Fill up msr record structure, this is already contained in
         # mstg, however if blk1001 is set we need it anyway
-        msr = clibmseed.msr_init(None)
-        msr.contents.network = trace.stats.network.encode('ascii', 'strict')
-        msr.contents.station = trace.stats.station.encode('ascii', 'strict')
-        msr.contents.location = trace.stats.location.encode('ascii', 'strict')
-        msr.contents.channel = trace.stats.channel.encode('ascii', 'strict')
-        msr.contents.dataquality = trace_attr['dataquality'].\
-            encode('ascii', 'strict')
-
-        # Only use Blockette 1001 if necessary.
-        if use_blkt_1001:
-            size = C.sizeof(blkt_1001_s)
-            blkt1001 = C.c_char(b' ')
-            C.memset(C.pointer(blkt1001), 0, size)
-            ret_val = clibmseed.msr_addblockette(msr, C.pointer(blkt1001),
-                                                 size, 1001, 0)
-            # Usually returns a pointer to the added blockette in the
-            # blockette link chain and a NULL pointer if it fails.
-            # NULL pointers have a false boolean value according to the
-            # ctypes manual.
-            if bool(ret_val) is False:
-                clibmseed.msr_free(C.pointer(msr))
-                del msr
-                raise Exception('Error in msr_addblockette')
-        # Only use Blockette 100 if necessary.
-        if use_blkt_100:
-            size = C.sizeof(blkt_100_s)
-            blkt100 = C.c_char(b' ')
-            C.memset(C.pointer(blkt100), 0, size)
-            ret_val = clibmseed.msr_addblockette(
-                msr, C.pointer(blkt100), size, 100, 0)  # NOQA
-            # Usually returns a pointer to the added blockette in the
-            # blockette link chain and a NULL pointer if it fails.
-            # NULL pointers have a false boolean value according to the
-            # ctypes manual.
-            if bool(ret_val) is False:
-                clibmseed.msr_free(C.pointer(msr))  # NOQA
-                del msr  # NOQA
-                raise Exception('Error in msr_addblockette')
+        msr = _createRecordTemplate(trace, trace_attr['dataquality'],
+                                    use_blkt_1001, use_blkt_100)
 
         # Pack mstg into a MSEED file using the callback record_handler as
         # write method.
@@ -753,6 +1089,231 @@ def writeMSEED(stream, filename, encoding=None, reclen=None, byteorder=None,
         f.close()
 
 
+class MSEEDWriter(object):
+    """
+    Writes a Mini-SEED file incrementally from consecutive chunks of data.
+
+    Traces passed to :meth:`append` are packed into records as soon as there
+    are enough samples for a complete record. The remaining samples of each
+    channel are kept until more data is appended, thus a long trace can be
+    written chunk by chunk without ever holding all of it in memory. Record
+    sequence numbers and the Steim compression history continue across
+    appends, so appending contiguous chunks results in the same file as
+    writing the merged traces with :func:`writeMSEED` (except for INT16
+    encoded data, for which libmseed may pack partially filled records in
+    between). A chunk not continuing the pending data of its channel (gap,
+    overlap or changed sampling rate) starts a new segment after the pending
+    samples have been written.
+
+    :param filename: Name of the output file or open file like object.
+    :type encoding: int or str, optional
+    :param encoding: Mini-SEED data encoding, see :func:`writeMSEED`.
+        Defaults to an encoding suitable for the dtype of the data.
+    :type reclen: int, optional
+    :param reclen: Record length in bytes. Defaults to ``4096``.
+    :type byteorder: [``0`` or ``'<'`` | ``1`` or ``'>'`` | ``'='``], optional
+    :param byteorder: Byteorder of the records. Defaults to big endian.
+    :type verbose: int, optional
+    :param verbose: Controls verbosity of libmseed.
+
+    .. rubric:: Example
+
+    >>> from obspy import read
+    >>> from obspy.core import compatibility
+    >>> st = read()
+    >>> t = st[0].stats.starttime
+    >>> buf = compatibility.BytesIO()
+    >>> with MSEEDWriter(buf, reclen=512) as writer:
+    ...     for i in range(3):
+    ...         writer.append(st.slice(t + i * 10, t + i * 10 + 9.99))
+    >>> _ = buf.seek(0)
+    >>> print(read(buf))  # doctest: +ELLIPSIS
+    3 Trace(s) in Stream:
+    BW.RJOB..EHZ | 2009-08-24T00:20:03.000000Z - ... | 100.0 Hz, 3000 samples
+    BW.RJOB..EHN | 2009-08-24T00:20:03.000000Z - ... | 100.0 Hz, 3000 samples
+    BW.RJOB..EHE | 2009-08-24T00:20:03.000000Z - ... | 100.0 Hz, 3000 samples
+    """
+    def __init__(self, filename, encoding=None, reclen=4096, byteorder=1,
+                 verbose=0):
+        if reclen not in VALID_RECORD_LENGTHS:
+            msg = 'Invalid record length. The record length must be a ' + \
+                'value\nof 2 to the power of X where 8 <= X <= 20.'
+            raise ValueError(msg)
+        if byteorder == '=':
+            byteorder = NATIVE_BYTEORDER
+        byteorder = {'<': 0, '>': 1}.get(byteorder, byteorder)
+        if byteorder not in [0, 1]:
+            msg = "Invalid byteorder. It must be either '<', '>', '=', " + \
+                  "0 or 1"
+            raise ValueError(msg)
+        encoding_strings = dict([(v[0], k) for (k, v) in ENCODINGS.items()])
+        if encoding is not None and encoding not in ENCODINGS:
+            if encoding not in encoding_strings:
+                msg = 'Invalid encoding %s. Valid encodings: %s'
+                raise ValueError(msg % (encoding, encoding_strings))
+            encoding = encoding_strings[encoding]
+        self.encoding = encoding
+        self.reclen = reclen
+        self.byteorder = byteorder
+        self.verbose = verbose
+        # state of every channel, see append()
+        self._streams = OrderedDict()
+        if hasattr(filename, 'write'):
+            self._file = filename
+            self._close_file = False
+        else:
+            self._file = open(filename, 'wb')
+            self._close_file = True
+
+        def record_handler(record, reclen, _stream):
+            self._file.write(record[0:reclen])
+        self._record_handler = C.CFUNCTYPE(
+            C.c_void_p, C.POINTER(C.c_char), C.c_int,
+            C.c_void_p)(record_handler)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
+        self.close()
+
+    def append(self, data):
+        """
+        Appends a trace or all traces of a stream.
+
+        All complete records are written immediately.
+        """
+        if self._file is None:
+            msg = 'I/O operation on closed MSEEDWriter'
+            raise ValueError(msg)
+        if isinstance(data, Stream):
+            for trace in data:
+                self.append(trace)
+            return
+        trace = data
+        if not len(trace.data):
+            return
+        try:
+            dataquality = trace.stats['mseed']['dataquality'].upper()
+        except:
+            dataquality = 'D'
+        if dataquality not in ['D', 'R', 'Q', 'M']:
+            msg = 'Invalid dataquality %s. The dataquality for Mini-SEED ' + \
+                'must be either D, R, Q or M.'
+            raise ValueError(msg % dataquality)
+        encoding = self._getEncoding(trace.data)
+        data = trace.data
+        if encoding == 1:
+            # INT16 needs INT32 data type
+            data = data.astype(np.int32)
+        # libmseed expects contiguous data in the native byteorder
+        data = np.require(data, dtype=data.dtype.newbyteorder(native_str('=')),
+                          requirements=[native_str('C_CONTIGUOUS')])
+        sampling_rate = trace.stats.sampling_rate
+        starttime = util._convertDatetimeToMSTime(trace.stats.starttime)
+        use_blkt_1001 = starttime % 100 != 0 or \
+            (1.0 / sampling_rate * HPTMODULUS) % 100 != 0
+
+        key = (trace.id, dataquality)
+        state = self._streams.get(key)
+        if state is not None and state['mst'] is not None:
+            hpdelta = HPTMODULUS / sampling_rate
+            if state['encoding'] != encoding or \
+                    state['sampling_rate'] != sampling_rate or \
+                    abs(starttime - state['endtime'] - hpdelta) > \
+                    0.5 * hpdelta:
+                # not contiguous, write the pending samples first
+                self._pack(state, flush=1)
+                state['mst'] = None
+        if state is None or (state['mst'] is None and use_blkt_1001 and
+                             not state['use_blkt_1001']):
+            msr = _createRecordTemplate(
+                trace, dataquality, use_blkt_1001,
+                sampling_rate >= 32727.0 or sampling_rate <= 1.0 / 32727.0)
+            if state is not None:
+                # keep on counting the records
+                msr.contents.sequence_number = \
+                    state['msr'].contents.sequence_number
+                clibmseed.msr_free(C.pointer(state['msr']))
+            state = {'msr': msr, 'mst': None, 'use_blkt_1001': use_blkt_1001}
+            self._streams[key] = state
+        if state['mst'] is None:
+            state['mst'] = MST(trace, data, dataquality)
+            state['encoding'] = encoding
+            state['sampling_rate'] = sampling_rate
+        else:
+            errcode = clibmseed.mst_addspan(
+                state['mst'].mst, starttime,
+                util._convertDatetimeToMSTime(trace.stats.endtime),
+                data.ctypes.data, len(data),
+                SAMPLETYPE[data.dtype.type].encode('ascii', 'strict'), 1)
+            if errcode != 0:
+                raise Exception('Error in mst_addspan')
+        state['endtime'] = util._convertDatetimeToMSTime(trace.stats.endtime)
+        self._pack(state, flush=0)
+
+    def flush(self):
+        """
+        Writes all pending samples, filling up the last record of each
+        channel only partially.
+        """
+        for state in self._streams.values():
+            if state['mst'] is not None:
+                self._pack(state, flush=1)
+        if hasattr(self._file, 'flush'):
+            self._file.flush()
+
+    def close(self):
+        """
+        Writes all pending samples and closes the writer.
+        """
+        if self._file is None:
+            return
+        try:
+            self.flush()
+        finally:
+            for state in self._streams.values():
+                state['mst'] = None
+                clibmseed.msr_free(C.pointer(state['msr']))
+            self._streams.clear()
+            if self._close_file:
+                self._file.close()
+            self._file = None
+
+    def _getEncoding(self, data):
+        """
+        Returns the encoding for the given data.
+        """
+        if not isinstance(data, np.ndarray):
+            msg = "Unsupported data type %s" % type(data)
+            raise ValueError(msg)
+        if self.encoding is not None:
+            if data.dtype.type != ENCODINGS[self.encoding][2]:
+                msg = 'Wrong dtype %s of data for encoding %s.' % (
+                    data.dtype, ENCODINGS[self.encoding][0])
+                raise ValueError(msg)
+            return self.encoding
+        for encoding in [11, 4, 5, 1, 0]:
+            if data.dtype.type == ENCODINGS[encoding][2]:
+                return encoding
+        msg = "Unsupported data type %s" % data.dtype
+        raise ValueError(msg)
+
+    def _pack(self, state, flush):
+        """
+        Packs the pending samples of a channel into records.
+        """
+        if not state['mst'].mst.contents.numsamples:
+            return
+        packedsamples = C.c_int64()
+        errcode = clibmseed.mst_pack(
+            state['mst'].mst, self._record_handler, None, self.reclen,
+            state['encoding'], self.byteorder, C.byref(packedsamples), flush,
+            self.verbose, state['msr'])
+        if errcode == -1:
+            raise Exception('Error in mst_pack')
+
+
 class MST(object):
     """
     Class that transforms a ObsPy Trace object to a libmseed internal MSTrace
@@ -141,6 +141,36 @@ class fsdh_s(C.Structure):
     ]
 
 
+# Fixed section data of header as NumPy dtype for vectorized parsing of many
+# records at once. Use newbyteorder() to set the header byteorder.
+FIXED_HEADER_DTYPE = np.dtype([
+    (native_str(name), native_str(fmt)) for name, fmt in [
+        ('sequence_number', 'S6'),
+        ('dataquality', 'S1'),
+        ('reserved', 'S1'),
+        ('station', 'S5'),
+        ('location', 'S2'),
+        ('channel', 'S3'),
+        ('network', 'S2'),
+        ('year', 'u2'),
+        ('day', 'u2'),
+        ('hour', 'u1'),
+        ('min', 'u1'),
+        ('sec', 'u1'),
+        ('unused', 'u1'),
+        ('fract', 'u2'),
+        ('numsamples', 'u2'),
+        ('samprate_fact', 'i2'),
+        ('samprate_mult', 'i2'),
+        ('act_flags', 'u1'),
+        ('io_flags', 'u1'),
+        ('dq_flags', 'u1'),
+        ('numblockettes', 'u1'),
+        ('time_correct', 'i4'),
+        ('data_offset', 'u2'),
+        ('blockette_offset', 'u2')]])
+
+
 # Blockette 100, Sample Rate (without header)
 class blkt_100_s(C.Structure):
     _fields_ = [
@@ -476,6 +506,11 @@ clibmseed.mst_initgroup.restype = C.POINTER(MSTraceGroup)
 clibmseed.mst_freegroup.argtypes = [C.POINTER(C.POINTER(MSTraceGroup))]
 clibmseed.mst_freegroup.restype = C.c_void_p
 
+clibmseed.mst_addspan.argtypes = [
+    C.POINTER(MSTrace), C.c_int64, C.c_int64, C.c_void_p, C.c_int64,
+    C.c_char, C.c_int8]
+clibmseed.mst_addspan.restype = C.c_int
+
 clibmseed.msr_init.argtypes = [C.POINTER(MSRecord)]
 clibmseed.msr_init.restype = C.POINTER(MSRecord)
 
@@ -523,6 +558,36 @@ clibmseed.msr_unpack_steim1.argtypes = [
     C.POINTER(C.c_int32), C.POINTER(C.c_int32), C.c_int, C.c_int]
 clibmseed.msr_unpack_steim2.restype = C.c_int
 
+clibmseed.unpackSteimRecords.argtypes = [
+    np.ctypeslib.ndpointer(dtype=np.uint8, ndim=1,
+                           flags=native_str('C_CONTIGUOUS')),
+    C.c_int,
+    np.ctypeslib.ndpointer(dtype=np.int64, ndim=1,
+                           flags=native_str('C_CONTIGUOUS')),
+    np.ctypeslib.ndpointer(dtype=np.int32, ndim=1,
+                           flags=native_str('C_CONTIGUOUS')),
+    np.ctypeslib.ndpointer(dtype=np.int32, ndim=1,
+                           flags=native_str('C_CONTIGUOUS')),
+    np.ctypeslib.ndpointer(dtype=np.int8, ndim=1,
+                           flags=native_str('C_CONTIGUOUS')),
+    np.ctypeslib.ndpointer(dtype=np.int8, ndim=1,
+                           flags=native_str('C_CONTIGUOUS')),
+    np.ctypeslib.ndpointer(dtype=np.int32, ndim=1,
+                           flags=native_str('C_CONTIGUOUS')),
+    C.c_int8]
+clibmseed.unpackSteimRecords.restype = C.c_int
+
+clibmseed.packSteimRecords.argtypes = [
+    np.ctypeslib.ndpointer(dtype=np.int32, ndim=1,
+                           flags=native_str('C_CONTIGUOUS')),
+    C.c_int64, C.c_int32, C.c_int, C.c_int, C.c_int8,
+    np.ctypeslib.ndpointer(dtype=np.uint8, ndim=2,
+                           flags=native_str('C_CONTIGUOUS')),
+    C.c_int,
+    np.ctypeslib.ndpointer(dtype=np.int64, ndim=1,
+                           flags=native_str('C_CONTIGUOUS'))]
+clibmseed.packSteimRecords.restype = C.c_int
+
 # tricky, C.POINTER(C.c_char) is a pointer to single character fields
 # this is completely different to C.c_char_p which is a string
 clibmseed.mst_packgroup.argtypes = [
@@ -180,6 +180,12 @@ lil_free(LinkedIDList * lil)
 void empty_print(char *string) {}
 
 
+// Global logging parameters of libmseed. The callbacks passed to
+// readMSEEDBuffer() are only valid during the call, so the previous
+// parameters are restored before returning.
+extern MSLogParam gMSLogParam;
+
+
 // Function that reads from a MiniSEED binary file from a char buffer and
 // returns a LinkedIDList.
 LinkedIDList *
@@ -219,6 +225,7 @@ readMSEEDBuffer (char *mseed, int buflen, Selections *selections, flag
     LinkedRecordList *recordCurrent = NULL;
     int datasize;
     int record_count = 0;
+    MSLogParam logp = gMSLogParam;
 
     // A negative verbosity suppressed as much as possible.
     if (verbose < 0) {
@@ -249,6 +256,7 @@ readMSEEDBuffer (char *mseed, int buflen, Selections *selections, flag
         msr = msr_init(NULL);
         if ( msr == NULL ) {
             ms_log (2, "readMSEEDBuffer(): Error initializing msr\n");
+            gMSLogParam = logp;
             return -1;
         }
         if (verbose > 1) {
@@ -357,6 +365,7 @@ readMSEEDBuffer (char *mseed, int buflen, Selections *selections, flag
     // Return empty id list if no records could be found.
     if (record_count == 0) {
         idListHead = lil_init();
+        gMSLogParam = logp;
         return idListHead;
     }
 
@@ -524,5 +533,6 @@ readMSEEDBuffer (char *mseed, int buflen, Selections *selections, flag
         }
         idListCurrent = idListCurrent->next;
     }
+    gMSLogParam = logp;
     return idListHead;
 }
@@ -0,0 +1,145 @@
+/***************************************************************************
+ * obspy-steim.c:
+ *
+ * Decodes and encodes the Steim-1 and Steim-2 compressed data sections of
+ * many records in a single call.
+ *
+ * Uses the frame routines of unpackdata.c and packdata.c from libmseed by
+ * Chad Trabant.
+ ***************************************************************************/
+
+#include <stdlib.h>
+
+#include "libmseed/libmseed.h"
+#include "libmseed/unpackdata.h"
+#include "libmseed/packdata.h"
+
+
+// Global logging parameters of libmseed used by the frame routines.
+extern MSLogParam gMSLogParam;
+
+
+// Print function that does nothing. The log output is suppressed while
+// decoding and encoding, afterwards the previous logging parameters are
+// restored as they are shared by the whole process.
+static void
+silent_print(char *string) {}
+
+
+// Decodes the data sections of nrecords records into one output array.
+//
+// The data section of record i starts at buffer + offsets[i], is nbytes[i]
+// bytes long and contains npts[i] samples which are written consecutively
+// to output. encodings[i] is either DE_STEIM1 or DE_STEIM2 and swapflags[i]
+// is set if the byteorder of the record differs from the host byteorder.
+//
+// Returns the number of decoded records, which is less than nrecords if a
+// record could not be decoded, or -1 if no memory could be allocated.
+int
+unpackSteimRecords(char *buffer, int nrecords, int64_t *offsets,
+                   int32_t *nbytes, int32_t *npts, int8_t *encodings,
+                   int8_t *swapflags, int32_t *output, int8_t verbose)
+{
+    int i;
+    int nsamples;
+    int32_t x0, xn;
+    int32_t maxnpts = 1;
+    int32_t *diffbuff;
+    MSLogParam logp = gMSLogParam;
+
+    for (i = 0; i < nrecords; i++) {
+        if (npts[i] > maxnpts) {
+            maxnpts = npts[i];
+        }
+    }
+    diffbuff = (int32_t *) malloc (maxnpts * sizeof(int32_t));
+    if ( diffbuff == NULL ) {
+        return -1;
+    }
+    ms_loginit(&silent_print, NULL, &silent_print, NULL);
+
+    for (i = 0; i < nrecords; i++) {
+        if (encodings[i] == DE_STEIM1) {
+            nsamples = msr_unpack_steim1((FRAME *)(buffer + offsets[i]),
+                                         nbytes[i], npts[i], npts[i],
+                                         output, diffbuff, &x0, &xn,
+                                         swapflags[i], verbose);
+        }
+        else if (encodings[i] == DE_STEIM2) {
+            nsamples = msr_unpack_steim2((FRAME *)(buffer + offsets[i]),
+                                         nbytes[i], npts[i], npts[i],
+                                         output, diffbuff, &x0, &xn,
+                                         swapflags[i], verbose);
+        }
+        else {
+            break;
+        }
+        if (nsamples != npts[i]) {
+            break;
+        }
+        output += npts[i];
+    }
+
+    free(diffbuff);
+    gMSLogParam = logp;
+    return i;
+}
+
+
+// Encodes npts samples into consecutive data sections of nframes Steim
+// frames each.
+//
+// d0 is the first difference of the first record, i.e. 0 for a cold start
+// or the first sample minus the preceding sample to continue the
+// compression history. The data section of record i is written to
+// output + i * nframes * 64 and sample_offsets[i] is set to the index of its
+// first sample.
+//
+// Returns the number of records, -1 if the data can not be represented
+// with the given encoding or -2 if more than maxrecords records are needed.
+int
+packSteimRecords(int32_t *data, int64_t npts, int32_t d0, int encoding,
+                 int nframes, int8_t swapflag, char *output, int maxrecords,
+                 int64_t *sample_offsets)
+{
+    int retval;
+    int nrecords = 0;
+    int packed_frames, packed_samples, nsamples;
+    int64_t pos = 0;
+    // upper limit of samples fitting into a data section
+    int64_t maxsamples = (int64_t) nframes * STEIM2_FRAME_MAX_SAMPLES;
+    MSLogParam logp = gMSLogParam;
+
+    ms_loginit(&silent_print, NULL, &silent_print, NULL);
+    while (pos < npts) {
+        if (nrecords >= maxrecords) {
+            gMSLogParam = logp;
+            return -2;
+        }
+        nsamples = (int)((npts - pos < maxsamples) ? npts - pos : maxsamples);
+        if (encoding == DE_STEIM1) {
+            retval = msr_pack_steim1(
+                (DFRAMES *)(output + (int64_t) nrecords * nframes * 64),
+                data + pos, d0, nsamples, nframes, 1, &packed_frames,
+                &packed_samples, swapflag);
+        }
+        else {
+            retval = msr_pack_steim2(
+                (DFRAMES *)(output + (int64_t) nrecords * nframes * 64),
+                data + pos, d0, nsamples, nframes, 1, &packed_frames,
+                &packed_samples, swapflag);
+        }
+        if (retval != 0 || packed_samples <= 0) {
+            gMSLogParam = logp;
+            return -1;
+        }
+        sample_offsets[nrecords] = pos;
+        pos += packed_samples;
+        nrecords++;
+        if (pos < npts) {
+            d0 = data[pos] - data[pos - 1];
+        }
+    }
+    gMSLogParam = logp;
+    return nrecords;
+}
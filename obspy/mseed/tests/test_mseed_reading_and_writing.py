@@ -11,7 +11,8 @@ from obspy import UTCDateTime, Stream, Trace, read
 from obspy.core import AttribDict, compatibility
 from obspy.core.util import NamedTemporaryFile
 from obspy.mseed import util
-from obspy.mseed.core import readMSEED, writeMSEED, isMSEED
+from obspy.mseed.core import readMSEED, writeMSEED, isMSEED, iterMSEED, \
+    MSEEDWriter
 from obspy.mseed.headers import clibmseed, ENCODINGS
 from obspy.mseed.msstruct import _MSStruct
 import copy
@@ -892,6 +893,133 @@ class MSEEDReadingAndWritingTestCase(unittest.TestCase):
                 self.assertEqual(ms.msr.contents.encoding, encoding)
                 del ms  # for valgrind
 
+    def test_readViaMmap(self):
+        """
+        Reading uncompressed files through a memory map gives the same
+        result as reading them via libmseed.
+        """
+        np.random.seed(815)
+        t = UTCDateTime(2012, 1, 1, 0, 0, 0, 123456)
+        # two channels, a gap and an overlap
+        headers = [('HHZ', t), ('HHN', t), ('HHZ', t + 200),
+                   ('HHZ', t + 100.002)]
+        for dtype, encoding in [('int32', 'INT32'), ('float32', 'FLOAT32'),
+                                ('float64', 'FLOAT64'), ('int32', 'STEIM2')]:
+            st = Stream()
+            for channel, starttime in headers:
+                data = np.random.randint(-1000, 1000, 5000).astype(dtype)
+                st.append(Trace(data=data, header={
+                    'network': 'XX', 'station': 'ABC', 'channel': channel,
+                    'sampling_rate': 100.0, 'starttime': starttime}))
+            for byteorder in ('<', '>'):
+                with NamedTemporaryFile() as tf:
+                    st.write(tf.name, format='MSEED', encoding=encoding,
+                             byteorder=byteorder, reclen=512)
+                    for kwargs in [{}, {'headonly': True},
+                                   {'starttime': t + 30, 'endtime': t + 130},
+                                   {'sourcename': 'XX.ABC.*.HHN'}]:
+                        st1 = read(tf.name, **kwargs)
+                        st2 = read(tf.name, mmap=True, **kwargs)
+                        self.assertEqual(st1, st2)
+                        for tr1, tr2 in zip(st1, st2):
+                            self.assertEqual(tr1.data.dtype, tr2.data.dtype)
+        # single record traces in native byteorder are views into the file
+        filename = os.path.join(self.path, 'data', 'encoding',
+                                'float32_Float32_littleEndian.mseed')
+        st1 = read(filename)
+        st2 = read(filename, mmap=True)
+        self.assertEqual(st1, st2)
+        if sys.byteorder == 'little':
+            self.assertFalse(st2[0].data.flags.owndata)
+        # changes are not written back to the file
+        st2[0].data[:] = 0
+        self.assertEqual(read(filename), st1)
+
+    def test_iterMSEED(self):
+        """
+        Iterating over chunks of records yields the same data as reading the
+        whole file at once.
+        """
+        filename = os.path.join(self.path, 'data',
+                                'BW.BGLD.__.EHE.D.2008.001.first_10_records')
+        st = read(filename)
+        traces = list(iterMSEED(filename))
+        self.assertEqual(len(traces), 10)
+        self.assertEqual([tr.stats.npts for tr in traces], [412] * 10)
+        self.assertEqual(traces[0].stats.mseed.encoding, 'STEIM1')
+        self.assertEqual(traces[0].stats.mseed.record_length, 512)
+        merged = Stream(traces=traces).merge()
+        np.testing.assert_array_equal(merged[0].data, st[0].data)
+        self.assertEqual(merged[0].stats.starttime, st[0].stats.starttime)
+
+        # a socket like object returning short reads
+        class ShortReads(object):
+            def __init__(self, data):
+                self.io = compatibility.BytesIO(data)
+
+            def read(self, size):
+                return self.io.read(min(size, 100))
+
+        with open(filename, 'rb') as fh:
+            data = fh.read()
+        traces = list(iterMSEED(ShortReads(data), chunksize=3))
+        self.assertEqual([tr.stats.npts for tr in traces],
+                         [1236, 1236, 1236, 412])
+        # keyword arguments are passed on to readMSEED
+        traces = list(iterMSEED(filename, chunksize=100, headonly=True,
+                                starttime=st[0].stats.starttime + 10))
+        self.assertEqual(len(traces), 1)
+        self.assertEqual(len(traces[0].data), 0)
+        # incomplete last records are skipped with a warning
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            traces = list(iterMSEED(compatibility.BytesIO(data[:-100])))
+        self.assertEqual(len(traces), 9)
+        self.assertTrue(any('Incomplete last record' in str(_i.message)
+                            for _i in w))
+
+    def test_MSEEDWriter(self):
+        """
+        Writing contiguous chunks incrementally results in the same file as
+        writing the whole trace at once.
+        """
+        np.random.seed(815)
+        t = UTCDateTime(2012, 1, 1, 0, 0, 0, 123456)
+        data = np.cumsum(np.random.randint(-100, 100, 20000))
+        for dtype, encoding in [('int32', 'STEIM1'), ('int32', 'STEIM2'),
+                                ('float32', 'FLOAT32')]:
+            tr = Trace(data=data.astype(dtype), header={
+                'network': 'XX', 'station': 'ABC', 'sampling_rate': 200.0,
+                'starttime': t})
+            with NamedTemporaryFile() as tf1:
+                with NamedTemporaryFile() as tf2:
+                    tr.write(tf1.name, format='MSEED', encoding=encoding,
+                             reclen=512)
+                    with MSEEDWriter(tf2.name, encoding=encoding,
+                                     reclen=512) as writer:
+                        for i in range(0, 20000, 777):
+                            writer.append(tr.slice(t + i / 200.0,
+                                                   t + (i + 776) / 200.0))
+                    with open(tf1.name, 'rb') as fh1:
+                        with open(tf2.name, 'rb') as fh2:
+                            self.assertEqual(fh1.read(), fh2.read())
+        # gaps start new segments, channels are kept apart
+        st = read()
+        t = st[0].stats.starttime
+        buf = compatibility.BytesIO()
+        writer = MSEEDWriter(buf, reclen=512)
+        writer.append(st.slice(t, t + 5))
+        writer.append(st.slice(t + 10, t + 20))
+        writer.append(st[0].slice(t + 20.01, t + 25))
+        writer.close()
+        self.assertRaises(ValueError, writer.append, st)
+        buf.seek(0)
+        st2 = read(buf)
+        self.assertEqual(len(st2), 6)
+        self.assertEqual(st2.select(channel='EHZ')[1].stats.npts, 1501)
+        np.testing.assert_array_equal(st2.select(channel='EHZ')[1].data,
+                                      st[0].slice(t + 10, t + 25).data)
+
     def test_issue376(self):
         """
         Tests writing Traces containing 1 or 2 samples only.
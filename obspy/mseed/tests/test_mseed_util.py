@@ -2,7 +2,7 @@
 from __future__ import unicode_literals
 from future import standard_library  # NOQA
 from future.builtins import open
-from obspy import UTCDateTime
+from obspy import UTCDateTime, Trace
 from obspy.mseed import util
 from obspy.mseed.core import readMSEED
 from obspy.core.util import NamedTemporaryFile
@@ -140,6 +140,72 @@ class MSEEDUtilTestCase(unittest.TestCase):
             self.assertEqual(start, stream[0].stats.starttime)
             self.assertEqual(end, stream[0].stats.endtime)
 
+    def test_recordIndex(self):
+        """
+        Tests building and using the sidecar record index of a file.
+        """
+        filename = os.path.join(self.path, 'data',
+                                'BW.BGLD.__.EHE.D.2008.001.first_10_records')
+        with NamedTemporaryFile() as tf:
+            with open(filename, 'rb') as fh:
+                tf.write(fh.read())
+            tf.flush()
+            index_filename = tf.name + util.INDEX_SUFFIX
+            try:
+                self.assertEqual(util.readRecordIndex(tf.name), None)
+                self.assertEqual(util.buildRecordIndex([tf.name]), [tf.name])
+                self.assertTrue(os.path.exists(index_filename))
+                # up-to-date indices are only rebuilt on demand
+                self.assertEqual(util.buildRecordIndex([tf.name]), [])
+                self.assertEqual(
+                    util.buildRecordIndex([tf.name], force=True), [tf.name])
+                index = util.readRecordIndex(tf.name)
+                np.testing.assert_array_equal(index['offset'],
+                                              np.arange(10) * 512)
+                self.assertEqual(util.getStartAndEndTime(tf.name),
+                                 util.getStartAndEndTime(filename))
+                # time windows read via the index match a full scan
+                start = UTCDateTime(2008, 1, 1, 0, 0, 5)
+                for kwargs in [{'starttime': start, 'endtime': start + 3},
+                               {'starttime': start + 10},
+                               {'endtime': start - 4},
+                               {'starttime': start + 60}]:
+                    st1 = readMSEED(tf.name, **kwargs)
+                    st2 = readMSEED(tf.name, use_index=False, **kwargs)
+                    self.assertEqual(st1, st2)
+                # modifying the file invalidates the index
+                tf.write(b'\x00' * 512)
+                tf.flush()
+                self.assertEqual(util.readRecordIndex(tf.name), None)
+            finally:
+                if os.path.exists(index_filename):
+                    os.remove(index_filename)
+
+    def test_recordIndexNotWritable(self):
+        """
+        Files whose index can not be written are skipped with a warning.
+        """
+        filename = os.path.join(self.path, 'data',
+                                'BW.BGLD.__.EHE.D.2008.001.first_10_records')
+        with NamedTemporaryFile() as tf:
+            with open(filename, 'rb') as fh:
+                tf.write(fh.read())
+            tf.flush()
+            # a directory in place of the index file can not be written,
+            # not even by the super user
+            index_filename = tf.name + util.INDEX_SUFFIX
+            os.mkdir(index_filename)
+            try:
+                with warnings.catch_warnings(record=True) as w:
+                    warnings.simplefilter('always')
+                    self.assertEqual(util.buildRecordIndex([tf.name]), [])
+                self.assertEqual(len(w), 1)
+                self.assertTrue('Could not write record index' in
+                                str(w[0].message))
+                self.assertEqual(util.readRecordIndex(tf.name), None)
+            finally:
+                os.rmdir(index_filename)
+
     def test_getTimingQuality(self):
         """
         This test reads a self-made Mini-SEED file with Timing Quality
@@ -202,6 +268,84 @@ class MSEEDUtilTestCase(unittest.TestCase):
         data_record = readMSEED(steim2_file)[0].data
         np.testing.assert_array_equal(data, data_record)
 
+    def test_SteimRecords(self):
+        """
+        Tests the batch Steim codec against files written and read by
+        libmseed.
+        """
+        np.random.seed(123)
+        data = np.cumsum(np.random.randint(-2000, 2000, 10000))
+        data = data.astype(np.int32)
+        for encoding in ['STEIM1', 'STEIM2']:
+            for byteorder in ['>', '<']:
+                with NamedTemporaryFile() as tf:
+                    Trace(data=data).write(tf.name, format='MSEED',
+                                           encoding=encoding, reclen=512,
+                                           byteorder=byteorder)
+                    raw = np.fromfile(tf.name, dtype=np.uint8)
+                # decoding into a preallocated array
+                out = np.zeros(len(data) + 10, dtype=np.int32)
+                result, sample_offsets = util.unpackSteimRecords(raw, 512,
+                                                                 out=out)
+                self.assertTrue(result is out)
+                np.testing.assert_array_equal(out[:len(data)], data)
+                self.assertEqual(sample_offsets[-1], len(data))
+                # encoding results in the data sections written by libmseed
+                frames, sample_offsets2 = util.packSteimRecords(
+                    data, encoding, 512, byteorder=byteorder)
+                np.testing.assert_array_equal(sample_offsets2,
+                                              sample_offsets)
+                np.testing.assert_array_equal(frames,
+                                              raw.reshape(-1, 512)[:, 64:])
+                # partial re-encoding continues the compression history
+                start = sample_offsets[3]
+                frames2, _ = util.packSteimRecords(
+                    data[start:], encoding, 512, byteorder=byteorder,
+                    previous=data[start - 1])
+                np.testing.assert_array_equal(frames2, frames[3:])
+        # invalid input
+        self.assertRaises(ValueError, util.packSteimRecords,
+                          data.astype(np.float32))
+        self.assertRaises(ValueError, util.packSteimRecords, data, 'INT32')
+        self.assertRaises(ValueError, util.packSteimRecords,
+                          np.array([0, 2 ** 31 - 1, -2 ** 31], np.int32),
+                          'STEIM2')
+        filename = os.path.join(self.path, 'data', 'encoding',
+                                'int32_INT32_littleEndian.mseed')
+        self.assertRaises(ValueError, util.unpackSteimRecords,
+                          np.fromfile(filename, dtype=np.uint8), 256)
+
+    def test_SteimRecordsLogging(self):
+        """
+        The batch Steim codec and reading restore the logging parameters of
+        libmseed, which are global to the process.
+        """
+        import ctypes as C
+        from obspy.mseed.headers import clibmseed
+        params = (C.c_void_p * 4).in_dll(clibmseed, 'gMSLogParam')
+        saved = params[:]
+        messages = []
+        callback = C.CFUNCTYPE(None, C.c_char_p)(messages.append)
+        clibmseed.ms_loginit(callback, None, callback, None)
+        try:
+            expected = params[:]
+            data = np.arange(1000, dtype=np.int32)
+            util.packSteimRecords(data, 'STEIM2', 512)
+            self.assertEqual(params[:], expected)
+            with NamedTemporaryFile() as tf:
+                Trace(data=data).write(tf.name, format='MSEED',
+                                       encoding='STEIM2', reclen=512)
+                raw = np.fromfile(tf.name, dtype=np.uint8)
+                self.assertEqual(params[:], expected)
+                readMSEED(tf.name, verbose=-1)
+                self.assertEqual(params[:], expected)
+            util.unpackSteimRecords(raw, 512)
+            self.assertEqual(params[:], expected)
+            clibmseed.ms_log(2, b"message\n")
+            self.assertEqual(len(messages), 1)
+        finally:
+            params[:] = saved
+
     def test_time_shifting(self):
         """
         Tests the shiftTimeOfFile() function.
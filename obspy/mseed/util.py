@@ -11,10 +11,12 @@ from future.builtins import open
 from future.builtins import str
 from future.utils import native_str
 from obspy.mseed.headers import HPTMODULUS, clibmseed, FRAME, SAMPLESIZES, \
-    ENDIAN
+    ENDIAN, FIXED_HEADER_DTYPE, ENCODINGS
 from obspy import UTCDateTime
-from obspy.core.util import scoreatpercentile
+from obspy.core.util import scoreatpercentile, worker_pool
+from glob import glob
 from struct import unpack
+import os
 import sys
 import ctypes as C
 import numpy as np
@@ -79,6 +81,12 @@ def getStartAndEndTime(file_or_file_object):
         UTCDateTime(2008, 1, 1, 0, 0, 20, 510000))
     >>> f.close()
     """
+    # Use the record index of the file if available.
+    if isinstance(file_or_file_object, (str, native_str)):
+        index = readRecordIndex(file_or_file_object)
+        if index is not None:
+            return (_convertMSTimeToDatetime(index['starttime'][0]),
+                    _convertMSTimeToDatetime(index['endtime'][-1]))
     # Get the starttime of the first record.
     info = getRecordInformation(file_or_file_object)
     starttime = info['starttime']
@@ -467,6 +475,263 @@ def _getRecordInformation(file_object, offset=0, endian=None):
     return info
 
 
+def _getRecordHeaders(buffer, record_length, offset=0, endian=None):
+    """
+    Parses the headers of all data records in a buffer at once.
+
+    The buffer is expected to consist of data records of the given record
+    length starting at ``offset``. Only the fixed section of the data header
+    and the blockettes 100, 1000 and 1001 are evaluated, in the same way
+    libmseed does it. Any excess bytes at the end of the buffer are ignored.
+
+    :param buffer: Any object supporting the buffer interface, e.g. a
+        :class:`mmap.mmap` object or a NumPy array.
+    :type record_length: int
+    :param record_length: Record length in bytes.
+    :type offset: int
+    :param offset: Position of the first record in the buffer.
+    :param endian: If given, the header byteorder will be enforced. Can be
+        either "<" or ">". If None, it will be determined automatically.
+    :return: Dictionary of NumPy arrays with one item per record or ``None``
+        if the records contain anything not handled here (non data records,
+        missing blockette 1000, varying record length or header byteorder),
+        so that the caller may fall back to libmseed.
+        Keys are ``offset``, ``network``, ``station``, ``location``,
+        ``channel``, ``dataquality``, ``starttime`` and ``endtime`` (high
+        precision epoch time, see :const:`~obspy.mseed.headers.HPTMODULUS`),
+        ``samprate``, ``samplecnt``, ``encoding``, ``byteorder`` (``0`` for
+        little-endian, ``1`` for big-endian data) and ``data_offset``.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.util import getExampleFile
+    >>> filename = getExampleFile("BW.BGLD.__.EHE.D.2008.001.first_10_records")
+    >>> headers = _getRecordHeaders(np.fromfile(filename, dtype='u1'), 512)
+    >>> print(headers['offset'][:3])
+    [   0  512 1024]
+    >>> print(headers['samplecnt'][:3])
+    [412 412 412]
+    >>> print(_convertMSTimeToDatetime(headers['starttime'][1]))
+    2008-01-01T00:00:01.975000Z
+    """
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    count = (len(raw) - offset) // record_length
+    if count <= 0 or record_length < FIXED_HEADER_DTYPE.itemsize:
+        return None
+    # detect the header byteorder with the same sanity check as libmseed
+    for bo in ([endian] if endian else ['>', '<']):
+        header = np.ndarray((count,), FIXED_HEADER_DTYPE.newbyteorder(bo),
+                            buffer=raw, offset=offset,
+                            strides=(record_length,))
+        if np.all((header['year'] >= 1900) & (header['year'] <= 2100) &
+                  (header['day'] >= 1) & (header['day'] <= 366)):
+            break
+    else:
+        return None
+    if not np.all(np.in1d(header['dataquality'], [b'D', b'R', b'Q', b'M'])):
+        return None
+    record_start = offset + np.arange(count, dtype=np.int64) * record_length
+
+    def uint16(pos):
+        hi, lo = (pos, pos + 1) if bo == '>' else (pos + 1, pos)
+        return raw[hi].astype(np.int64) << 8 | raw[lo]
+
+    # walk the blockette chains of all records in parallel
+    blkt_100 = np.zeros(count, dtype=np.int64)
+    blkt_1000 = np.zeros(count, dtype=np.int64)
+    blkt_1001 = np.zeros(count, dtype=np.int64)
+    blkt = header['blockette_offset'].astype(np.int64)
+    for _i in range(64):
+        todo = np.nonzero(blkt)[0]
+        if not len(todo):
+            break
+        current = blkt[todo]
+        if np.any(current + 8 > record_length):
+            return None
+        blkt_type = uint16(record_start[todo] + current)
+        blkt_100[todo[blkt_type == 100]] = current[blkt_type == 100]
+        blkt_1000[todo[blkt_type == 1000]] = current[blkt_type == 1000]
+        blkt_1001[todo[blkt_type == 1001]] = current[blkt_type == 1001]
+        following = uint16(record_start[todo] + current + 2)
+        # blockettes are chained front to back, anything else ends the walk
+        following[following <= current] = 0
+        blkt[todo] = following
+    if np.any(blkt) or not np.all(blkt_1000):
+        return None
+    pos = record_start + blkt_1000
+    if np.any(2 ** raw[pos + 6].astype(np.int64) != record_length):
+        return None
+    headers = {
+        'offset': record_start,
+        'network': header['network'],
+        'station': header['station'],
+        'location': header['location'],
+        'channel': header['channel'],
+        'dataquality': header['dataquality'],
+        'samplecnt': header['numsamples'].astype(np.int64),
+        'encoding': raw[pos + 4].astype(np.int64),
+        'byteorder': raw[pos + 5].astype(np.int64),
+        'data_offset': header['data_offset'].astype(np.int64)}
+    # start time, see ms_btime2hptime() and msr_starttime() of libmseed
+    days = (header['year'].astype(np.int64) - 1970).astype('datetime64[Y]')
+    days = days.astype('datetime64[D]').astype(np.int64) + header['day'] - 1
+    seconds = ((days * 24 + header['hour']) * 60 + header['min']) * 60 + \
+        header['sec']
+    starttime = seconds * int(HPTMODULUS) + \
+        header['fract'].astype(np.int64) * int(HPTMODULUS // 10000)
+    not_applied = (header['act_flags'] & 0x02) == 0
+    starttime += np.where(not_applied, header['time_correct'], 0) * \
+        int(HPTMODULUS // 10000)
+    usec = raw[record_start + blkt_1001 + 5].astype(np.int8)
+    starttime += np.where(blkt_1001 > 0, usec, 0)
+    headers['starttime'] = starttime
+    # nominal sample rate, see ms_nomsamprate() of libmseed
+    factor = header['samprate_fact'].astype(np.float64)
+    multiplier = header['samprate_mult'].astype(np.float64)
+    with np.errstate(divide='ignore'):
+        samprate = np.where(factor > 0, factor,
+                            np.where(factor < 0, -1.0 / factor, 0.0))
+        samprate = np.where(multiplier > 0, samprate * multiplier,
+                            np.where(multiplier < 0, -samprate / multiplier,
+                                     samprate))
+    # actual sample rate, see msr_unpack() of libmseed
+    if np.any(blkt_100):
+        pos = (record_start + blkt_100 + 4)[blkt_100 > 0]
+        value = raw[pos[:, None] + np.arange(4)].copy()
+        samprate[blkt_100 > 0] = value.view(native_str(bo + 'f4'))[:, 0]
+    headers['samprate'] = samprate
+    # end time, see msr_endtime() of libmseed
+    valid = (samprate > 0) & (headers['samplecnt'] > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        span = np.where(valid, (headers['samplecnt'] - 1) / samprate *
+                        HPTMODULUS + 0.5, 0).astype(np.int64)
+    span -= np.where(header['act_flags'] & 0x10, int(HPTMODULUS), 0)
+    headers['endtime'] = starttime + span
+    return headers
+
+
+# Suffix of the sidecar record index file, see buildRecordIndex().
+INDEX_SUFFIX = '.msidx'
+INDEX_VERSION = 1
+# Per record information stored in the record index.
+INDEX_KEYS = ['offset', 'network', 'station', 'location', 'channel',
+              'dataquality', 'starttime', 'endtime', 'samplecnt']
+
+
+def buildRecordIndex(filenames, force=False, parallel=False, workers=None):
+    """
+    Builds or refreshes the sidecar record index of Mini-SEED files.
+
+    The index is stored next to each file (file name plus
+    :const:`INDEX_SUFFIX`) and contains the offset, start and end time,
+    network, station, location and channel code, data quality and number of
+    samples of every record. It is used by
+    :func:`~obspy.mseed.core.readMSEED` to read only the records overlapping
+    the requested time window and by :func:`getStartAndEndTime`. An index
+    gets ignored as soon as the size or modification time of its file
+    changes.
+
+    Only files consisting of data records with blockette 1000 and a constant
+    record length and header byteorder are indexed, full SEED files are
+    skipped. Files whose index can not be written (e.g. in a read-only
+    directory) are skipped with a warning.
+
+    :type filenames: str or list of str
+    :param filenames: File name, wildcard pattern or list of file names.
+    :type force: bool, optional
+    :param force: If ``True``, existing up-to-date indices are rebuilt, too.
+    :type parallel: bool or str, optional
+    :param parallel: Distributes the files over a pool of workers, see
+        :func:`~obspy.core.util.misc.worker_pool`. Defaults to ``False``.
+    :type workers: int, optional
+    :param workers: Number of workers. Defaults to the number of CPUs.
+    :return: List of file names for which the index has been written.
+
+    .. rubric:: Example
+
+    >>> import os, shutil, tempfile
+    >>> from obspy.core.util import getExampleFile
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'test.mseed')
+    >>> _ = shutil.copy(getExampleFile('test.mseed'), filename)
+    >>> buildRecordIndex(filename) == [filename]
+    True
+    >>> print(readRecordIndex(filename)['offset'])
+    [   0 4096]
+    >>> buildRecordIndex(filename)
+    []
+    >>> shutil.rmtree(os.path.dirname(filename))
+    """
+    if isinstance(filenames, (str, native_str)):
+        filenames = sorted(glob(filenames))
+    if not force:
+        filenames = [f for f in filenames if readRecordIndex(f) is None]
+    if not parallel or len(filenames) < 2:
+        written = [_writeRecordIndex(f) for f in filenames]
+    else:
+        with worker_pool(parallel, workers) as pool:
+            written = list(pool.map(_writeRecordIndex, filenames))
+    return [f for f in written if f is not None]
+
+
+def readRecordIndex(filename):
+    """
+    Returns the sidecar record index of a Mini-SEED file.
+
+    :type filename: str
+    :param filename: Mini-SEED file name (not the name of the index file).
+    :return: Dictionary of NumPy arrays with one item per record (see
+        :const:`INDEX_KEYS`, times are high precision epoch times) plus the
+        ``record_length``, or ``None`` if no up-to-date index exists.
+    """
+    try:
+        stat = os.stat(filename)
+        npz = np.load(filename + INDEX_SUFFIX)
+    except Exception:
+        return None
+    try:
+        if int(npz['version']) != INDEX_VERSION or \
+                int(npz['filesize']) != stat.st_size or \
+                float(npz['mtime']) != stat.st_mtime:
+            return None
+        index = dict((key, npz[key]) for key in INDEX_KEYS)
+        index['record_length'] = int(npz['record_length'])
+    except Exception:
+        return None
+    finally:
+        npz.close()
+    return index
+
+
+def _writeRecordIndex(filename):
+    """
+    Writes the record index of a single file.
+
+    :return: The file name or ``None`` if the file can not be indexed or
+        the index can not be written.
+    """
+    stat = os.stat(filename)
+    try:
+        info = getRecordInformation(filename)
+        data = np.memmap(filename, dtype=np.uint8, mode='r')
+    except Exception:
+        return None
+    headers = _getRecordHeaders(data, info['record_length'])
+    if headers is None:
+        return None
+    index = dict((key, headers[key]) for key in INDEX_KEYS)
+    del data
+    try:
+        with open(filename + INDEX_SUFFIX, 'wb') as fh:
+            np.savez(fh, version=INDEX_VERSION, filesize=stat.st_size,
+                     mtime=stat.st_mtime, record_length=info['record_length'],
+                     **index)
+    except (IOError, OSError) as e:
+        msg = "Could not write record index of %s: %s" % (filename, e)
+        warnings.warn(msg, UserWarning)
+        return None
+    return filename
+
+
 def _ctypesArray2NumpyArray(buffer, buffer_elements, sampletype):
     """
     Takes a Ctypes array and its length and type and returns it as a
@@ -520,6 +785,160 @@ def _convertMSTimeToDatetime(timestring):
     return UTCDateTime(timestring / HPTMODULUS)
 
 
+def unpackSteimRecords(buffer, record_length, offset=0, out=None):
+    """
+    Decodes the Steim-1/Steim-2 compressed data of many records at once.
+
+    All records are decoded in a single call to the underlying C library
+    into one array. Each record is decoded on its own, regardless of its
+    channel or any gaps, i.e. the result contains the samples of all records
+    in the order of the buffer.
+
+    :param buffer: Any object supporting the buffer interface, e.g. a
+        :class:`mmap.mmap` object or a NumPy array, consisting of Steim-1
+        and/or Steim-2 encoded data records.
+    :type record_length: int
+    :param record_length: Record length in bytes.
+    :type offset: int
+    :param offset: Position of the first record in the buffer.
+    :type out: :class:`numpy.ndarray`, optional
+    :param out: Preallocated contiguous int32 array to store the samples in.
+        Needs to be large enough to hold all samples.
+    :return: Tuple of the int32 array of samples and an array with the index
+        of the first sample of each record in it, followed by the total
+        number of samples.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.util import getExampleFile
+    >>> filename = getExampleFile("BW.BGLD.__.EHE.D.2008.001.first_10_records")
+    >>> data, sample_offsets = unpackSteimRecords(
+    ...     np.fromfile(filename, dtype=np.uint8), 512)
+    >>> print(data[:5])
+    [-363 -382 -388 -420 -417]
+    >>> print(sample_offsets)
+    [   0  412  824 1236 1648 2060 2472 2884 3296 3708 4120]
+    """
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    headers = _getRecordHeaders(raw, record_length, offset)
+    if headers is None or \
+            not np.all(np.in1d(headers['encoding'], [10, 11])):
+        msg = 'Buffer does not consist of Steim encoded data records'
+        raise ValueError(msg)
+    npts = headers['samplecnt']
+    sample_offsets = np.concatenate([[0], np.cumsum(npts)])
+    if out is None:
+        out = np.empty(sample_offsets[-1], dtype=np.int32)
+    elif out.dtype != np.int32 or not out.flags.c_contiguous or \
+            len(out) < sample_offsets[-1]:
+        msg = 'out must be a contiguous int32 array of at least %i samples'
+        raise ValueError(msg % sample_offsets[-1])
+    host_byteorder = 1 if sys.byteorder == 'big' else 0
+    count = clibmseed.unpackSteimRecords(
+        np.ascontiguousarray(raw), len(npts),
+        headers['offset'] + headers['data_offset'],
+        (record_length - headers['data_offset']).astype(np.int32),
+        npts.astype(np.int32), headers['encoding'].astype(np.int8),
+        (headers['byteorder'] != host_byteorder).astype(np.int8), out, 0)
+    if count < 0:
+        raise MemoryError
+    if count != len(npts):
+        msg = 'Error in unpacking Steim data of record %i' % count
+        raise Exception(msg)
+    return out, sample_offsets
+
+
+def packSteimRecords(data, encoding='STEIM2', record_length=4096,
+                     data_offset=64, byteorder='>', previous=None):
+    """
+    Encodes samples into the Steim-1/Steim-2 compressed data sections of as
+    many records as needed in a single call.
+
+    Only the data sections are created, the fixed header and blockettes of
+    each record are left to the caller. The returned sample offsets allow to
+    re-encode the data starting with any record: passing the preceding
+    sample as ``previous`` continues the compression history, resulting in
+    identical data sections.
+
+    :type data: :class:`numpy.ndarray`
+    :param data: int32 samples.
+    :type encoding: str or int
+    :param encoding: ``'STEIM1'`` (``10``) or ``'STEIM2'`` (``11``).
+    :type record_length: int
+    :param record_length: Record length in bytes.
+    :type data_offset: int
+    :param data_offset: Offset of the data section within each record, a
+        multiple of 64 bytes.
+    :type byteorder: str or int
+    :param byteorder: Byteorder of the data sections, either ``'>'`` or
+        ``1`` for big-endian (as defined by the SEED manual) or ``'<'`` or
+        ``0`` for little-endian.
+    :type previous: int, optional
+    :param previous: The sample preceding the data, used to compute the
+        first difference. Defaults to a cold start with a first difference
+        of zero, like Mini-SEED files written by ObsPy.
+    :return: Tuple of a uint8 array with one data section of
+        ``record_length - data_offset`` bytes per row and an array with the
+        index of the first sample of each record, followed by the total
+        number of samples.
+
+    .. rubric:: Example
+
+    >>> data = np.arange(5000, dtype=np.int32) ** 2 % 1000
+    >>> frames, sample_offsets = packSteimRecords(data, record_length=512)
+    >>> print(frames.shape)
+    (21, 448)
+    >>> print(sample_offsets[:4])
+    [  0 248 492 743]
+
+    Re-encoding the data starting with the third record:
+
+    >>> frames2, _ = packSteimRecords(data[492:], record_length=512,
+    ...                               previous=data[491])
+    >>> print((frames2 == frames[2:]).all())
+    True
+    """
+    if isinstance(encoding, (str, native_str)):
+        encoding = dict((v[0], k) for k, v in ENCODINGS.items()).get(
+            encoding.upper())
+    if encoding not in (10, 11):
+        msg = 'Only STEIM1 and STEIM2 encodings are supported'
+        raise ValueError(msg)
+    if not isinstance(data, np.ndarray) or data.dtype != np.int32:
+        msg = 'Steim compression requires int32 data'
+        raise ValueError(msg)
+    if data_offset % 64 or record_length - data_offset < 64:
+        msg = 'Invalid record length or data offset'
+        raise ValueError(msg)
+    if byteorder in (0, '<'):
+        byteorder = 0
+    elif byteorder in (1, '>'):
+        byteorder = 1
+    else:
+        msg = 'Invalid byteorder'
+        raise ValueError(msg)
+    data = np.ascontiguousarray(data)
+    nframes = (record_length - data_offset) // 64
+    # at least one sample per data word, the first frame holds two
+    # integration constants
+    maxrecords = -(-len(data) // (nframes * 15 - 2))
+    frames = np.zeros((maxrecords, nframes * 64), dtype=np.uint8)
+    sample_offsets = np.empty(maxrecords + 1, dtype=np.int64)
+    if previous is None or not len(data):
+        d0 = 0
+    else:
+        d0 = int(data[0]) - int(previous)
+    host_byteorder = 1 if sys.byteorder == 'big' else 0
+    count = clibmseed.packSteimRecords(
+        data, len(data), d0, encoding, nframes,
+        byteorder != host_byteorder, frames, maxrecords, sample_offsets)
+    if count < 0:
+        msg = 'Data can not be represented with the given encoding'
+        raise ValueError(msg)
+    sample_offsets[count] = len(data)
+    return frames[:count], sample_offsets[:count + 1]
+
+
 def _unpackSteim1(data_string, npts, swapflag=0, verbose=0):
     """
     Unpack steim1 compressed data given as string.
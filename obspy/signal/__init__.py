@@ -182,7 +182,13 @@ But it also means that the trace's built-in methods can be used.
 For more examples check out the `trigger`_ in the `Tutorial`_. For
 network coincidence refer to :func:`obspy.signal.trigger.coincidenceTrigger`
 and the same page in the `Tutorial`_. For automated use see the following
-`stalta`_ example scripts.
+`stalta`_ example scripts. Continuous data arriving in consecutive chunks (e.g.
+from a SeedLink server) can be triggered with the stateful
+:class:`~obspy.signal.trigger.RecSTALTA`,
+:class:`~obspy.signal.trigger.ClassicSTALTA`,
+:class:`~obspy.signal.trigger.DelayedSTALTA`,
+:class:`~obspy.signal.trigger.CarlSTATrig` and
+:class:`~obspy.signal.trigger.TriggerOnset` objects.
 
 .. _`trigger`: http://tutorial.obspy.org/code_snippets/trigger_tutorial.html
 .. _`Tutorial`: http://tutorial.obspy.org
@@ -199,7 +205,8 @@ from obspy.signal.invsim import cosTaper, cornFreq2Paz, pazToFreqResp, \
     seisSim, specInv, estimateMagnitude
 from obspy.signal.cpxtrace import normEnvelope, centroid, instFreq, instBwith
 from obspy.signal.util import utlGeoKm, utlLonLat
-from obspy.signal.cross_correlation import xcorr, xcorr_3C, xcorrPickCorrection
+from obspy.signal.cross_correlation import xcorr, xcorr_3C, \
+    xcorrPickCorrection, xcorrTemplates
 from obspy.signal.freqattributes import cfrequency, bwith, domperiod, logcep
 from obspy.signal.hoctavbands import sonogram
 from obspy.signal.polarization import eigval
@@ -207,7 +214,8 @@ from obspy.signal.spectral_estimation import psd, PPSD
 from obspy.signal.konnoohmachismoothing import konnoOhmachiSmoothing
 from obspy.signal.trigger import recSTALTA, recSTALTAPy, carlSTATrig, \
     classicSTALTA, delayedSTALTA, zDetect, triggerOnset, pkBaer, arPick, \
-    coincidenceTrigger, classicSTALTAPy
+    coincidenceTrigger, classicSTALTAPy, RecSTALTA, ClassicSTALTA, \
+    DelayedSTALTA, CarlSTATrig, TriggerOnset
 
 
 if __name__ == '__main__':
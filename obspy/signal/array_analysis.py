@@ -24,12 +24,14 @@ from future.builtins import range
 from future.builtins import str
 
 import math
+import multiprocessing
+from multiprocessing.pool import Pool, ThreadPool
 import warnings
 import numpy as np
 from obspy.signal.util import utlGeoKm, nextpow2
 from obspy.signal.headers import clibsignal
 from obspy.core import Stream
-from scipy.integrate import cumtrapz
+from obspy.core.util.misc import worker_pool
 from obspy.signal.invsim import cosTaper
 
 
@@ -747,18 +749,13 @@ def array_transff_wavenumber(coords, klim, kstep, coordsys='lonlat'):
     else:
         raise TypeError('klim must either be a float or a tuple of length 4')
 
-    nkx = int(np.ceil((kxmax + kstep / 10. - kxmin) / kstep))
-    nky = int(np.ceil((kymax + kstep / 10. - kymin) / kstep))
+    kx = np.arange(kxmin, kxmax + kstep / 10., kstep)
+    ky = np.arange(kymin, kymax + kstep / 10., kstep)
 
-    transff = np.empty((nkx, nky))
-
-    for i, kx in enumerate(np.arange(kxmin, kxmax + kstep / 10., kstep)):
-        for j, ky in enumerate(np.arange(kymin, kymax + kstep / 10., kstep)):
-            _sum = 0j
-            for k in range(len(coords)):
-                _sum += np.exp(complex(0.,
-                               coords[k, 0] * kx + coords[k, 1] * ky))
-            transff[i, j] = abs(_sum) ** 2
+    # exp(i (x kx + y ky)) factorizes into an x and a y part, the sum over
+    # stations for all grid points is a single matrix product
+    transff = np.abs(np.dot(np.exp(1j * np.outer(kx, coords[:, 0])),
+                            np.exp(1j * np.outer(coords[:, 1], ky)))) ** 2
 
     transff /= transff.max()
     return transff
@@ -800,23 +797,22 @@ def array_transff_freqslowness(coords, slim, sstep, fmin, fmax, fstep,
     else:
         raise TypeError('slim must either be a float or a tuple of length 4')
 
-    nsx = int(np.ceil((sxmax + sstep / 10. - sxmin) / sstep))
-    nsy = int(np.ceil((symax + sstep / 10. - symin) / sstep))
-    nf = int(np.ceil((fmax + fstep / 10. - fmin) / fstep))
-
-    transff = np.empty((nsx, nsy))
-    buff = np.zeros(nf)
-
-    for i, sx in enumerate(np.arange(sxmin, sxmax + sstep / 10., sstep)):
-        for j, sy in enumerate(np.arange(symin, symax + sstep / 10., sstep)):
-            for k, f in enumerate(np.arange(fmin, fmax + fstep / 10., fstep)):
-                _sum = 0j
-                for l in np.arange(len(coords)):
-                    _sum += np.exp(
-                        complex(0., (coords[l, 0] * sx + coords[l, 1] * sy) *
-                                2 * np.pi * f))
-                buff[k] = abs(_sum) ** 2
-            transff[i, j] = cumtrapz(buff, dx=fstep)[-1]
+    sx = np.arange(sxmin, sxmax + sstep / 10., sstep)
+    sy = np.arange(symin, symax + sstep / 10., sstep)
+    freqs = np.arange(fmin, fmax + fstep / 10., fstep)
+
+    # trapezoidal integration over frequency, one slowness grid at a time so
+    # that memory does not grow with the number of frequencies. For each
+    # frequency the sum over stations factorizes into an x and a y part and
+    # is computed for all grid points as a single matrix product.
+    weights = np.empty(len(freqs))
+    weights.fill(fstep)
+    weights[[0, -1]] /= 2.
+    transff = np.zeros((len(sx), len(sy)))
+    for f, weight in zip(freqs, weights):
+        transff += weight * np.abs(np.dot(
+            np.exp(2j * np.pi * f * np.outer(sx, coords[:, 0])),
+            np.exp(2j * np.pi * f * np.outer(coords[:, 1], sy)))) ** 2
 
     transff /= transff.max()
     return transff
@@ -831,10 +827,117 @@ def dump(pow_map, apow_map, i):
     np.savez('apow_map_%d.npz' % i, apow_map)
 
 
+# steering vectors of the last call in this process, so that they are
+# computed only once per worker process, see _steering_vectors()
+_STEER_CACHE = {}
+
+
+def _steering_vectors(nf, nlow, deltaf, time_shift_table):
+    """
+    Returns the steering vectors for the given frequencies and time shift
+    table, reusing those of the previous call if nothing changed.
+    """
+    key = (nf, nlow, deltaf, time_shift_table.shape,
+           time_shift_table.tobytes())
+    # key and steering vectors are stored and looked up as one item, so
+    # threads sharing the cache always see a matching pair
+    cached = _STEER_CACHE.get('steer')
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    nstat, grdpts_x, grdpts_y = time_shift_table.shape
+    steer = np.empty((nf, grdpts_x, grdpts_y, nstat), dtype='c16')
+    clibsignal.calcSteer(nstat, grdpts_x, grdpts_y, nf, nlow,
+                         deltaf, time_shift_table, steer)
+    _STEER_CACHE['steer'] = (key, steer)
+    return steer
+
+
+def _array_processing_worker(args):
+    """
+    Beamforming of consecutive windows of the data of all stations, used by
+    :func:`~obspy.signal.array_analysis.array_processing`.
+
+    The data of each station starts with the first window, ``offsets`` are
+    the sample offsets of the windows relative to it. The windows are
+    processed in batches of ``batch`` windows, each batch with one FFT call
+    per station and the cross spectral density matrices of all its windows
+    and frequencies at once. If no steering vectors are given, those cached
+    in the worker process are used or computed from the time shift table.
+
+    :return: relative and absolute power and grid indices of the maximum of
+        each window, and the power maps of all windows if ``return_maps`` is
+        set (``None`` otherwise)
+    """
+    CAPON = 1  # method 0 is bf
+    (data, offsets, nsamp, nfft, nlow, nf, deltaf, time_shift_table, steer,
+     prewhiten, method, batch, return_maps) = args
+    nstat = len(data)
+    grdpts_x, grdpts_y = time_shift_table.shape[1:]
+    if steer is None:
+        steer = _steering_vectors(nf, nlow, deltaf, time_shift_table)
+    tap = cosTaper(nsamp, p=0.22)  # 0.22 matches 0.2 of historical C bbfk.c
+    nwin = len(offsets)
+    relpow = np.empty(nwin)
+    abspow = np.empty(nwin)
+    ix = np.empty(nwin, dtype='int64')
+    iy = np.empty(nwin, dtype='int64')
+    if return_maps:
+        relpow_maps = np.empty((nwin, grdpts_x, grdpts_y))
+        abspow_maps = np.empty((nwin, grdpts_x, grdpts_y))
+    else:
+        relpow_maps = abspow_maps = None
+    for start in range(0, nwin, batch):
+        end = min(start + batch, nwin)
+        idx = offsets[start:end, np.newaxis] + np.arange(nsamp)
+        ft = np.empty((end - start, nstat, nf), dtype='c16')
+        for i, dat in enumerate(data):
+            dat = dat[idx]
+            dat = (dat - dat.mean(axis=1)[:, np.newaxis]) * tap
+            ft[:, i, :] = np.fft.rfft(dat, nfft, axis=1)[:, nlow:nlow + nf]
+        # computing the covariances of the signal at different receivers,
+        # frequencies last for the sums over frequencies
+        R = np.einsum('wif,wjf->wijf', ft, ft.conj())
+        if method == CAPON:
+            R /= np.abs(R.sum(axis=3))[:, :, :, np.newaxis]
+        dpow = np.zeros(end - start)
+        for i in range(nstat):
+            dpow += np.abs(R[:, i, i, :].sum(axis=1))
+        dpow *= nstat
+        R = np.ascontiguousarray(R.transpose(0, 3, 1, 2))
+        if method == CAPON:
+            # P(f) = 1/(e.H R(f)^-1 e)
+            for w in range(end - start):
+                for n in range(nf):
+                    R[w, n] = np.linalg.pinv(R[w, n], rcond=1e-6)
+        if return_maps:
+            relpow_map = relpow_maps[start:end]
+            abspow_map = abspow_maps[start:end]
+        else:
+            relpow_map = np.empty((end - start, grdpts_x, grdpts_y))
+            abspow_map = np.empty((end - start, grdpts_x, grdpts_y))
+        relpow_map.fill(0.)
+        abspow_map.fill(0.)
+        for w in range(end - start):
+            errcode = clibsignal.generalizedBeamformer(
+                relpow_map[w], abspow_map[w], steer, R[w], nsamp, nstat,
+                prewhiten, grdpts_x, grdpts_y, nfft, nf, dpow[w], method)
+            if errcode != 0:
+                msg = 'generalizedBeamforming exited with error %d'
+                raise Exception(msg % errcode)
+        imax = relpow_map.reshape(end - start, -1).argmax(axis=1)
+        ix[start:end], iy[start:end] = np.unravel_index(
+            imax, (grdpts_x, grdpts_y))
+        w = np.arange(end - start)
+        relpow[start:end] = relpow_map[w, ix[start:end], iy[start:end]]
+        abspow[start:end] = abspow_map[w, ix[start:end], iy[start:end]]
+    return relpow, abspow, ix, iy, relpow_maps, abspow_maps
+
+
 def array_processing(stream, win_len, win_frac, sll_x, slm_x, sll_y, slm_y,
                      sl_s, semb_thres, vel_thres, frqlow, frqhigh, stime,
                      etime, prewhiten, verbose=False, coordsys='lonlat',
-                     timestamp='mlabday', method=0, store=None):
+                     timestamp='mlabday', method=0, store=None,
+                     parallel=False, workers=None):
     """
     Method for Seismic-Array-Beamforming/FK-Analysis/Capon
 
@@ -886,12 +989,19 @@ def array_processing(stream, win_len, win_frac, sll_x, slm_x, sll_y, slm_y,
         second arguments and the iteration number as third argument. Useful for
         storing or plotting the map for each iteration. For this purpose the
         dump function of this module can be used.
+    :type parallel: bool, str or pool-like object
+    :param parallel: Processes the windows in a pool of workers, see
+        :func:`~obspy.core.util.misc.worker_pool`. The result and the calls
+        to ``store`` are the same as without a pool. With ``store`` the
+        windows are handed out in smaller portions so that the power maps
+        passed back from the workers do not pile up in memory.
+    :type workers: int, optional
+    :param workers: Number of workers of a newly created pool. The windows
+        are split into this many parts (default: number of CPUs).
     :return: numpy.ndarray of timestamp, relative relpow, absolute relpow,
         backazimut, slowness
     """
-    _BF, CAPON = 0, 1
     res = []
-    eotr = True
 
     # check that sampling rates do not vary
     fs = stream[0].stats.sampling_rate
@@ -931,75 +1041,87 @@ def array_processing(stream, win_len, win_frac, sll_x, slm_x, sll_y, slm_y,
     nlow = max(1, nlow)  # avoid using the offset
     nhigh = min(nfft // 2 - 1, nhigh)  # avoid using nyquist
     nf = nhigh - nlow + 1  # include upper and lower frequency
-    # to spead up the routine a bit we estimate all steering vectors in advance
-    steer = np.empty((nf, grdpts_x, grdpts_y, nstat), dtype='c16')
-    clibsignal.calcSteer(nstat, grdpts_x, grdpts_y, nf, nlow,
-                         deltaf, time_shift_table, steer)
-    R = np.empty((nf, nstat, nstat), dtype='c16')
-    ft = np.empty((nstat, nf), dtype='c16')
-    newstart = stime
-    tap = cosTaper(nsamp, p=0.22)  # 0.22 matches 0.2 of historical C bbfk.c
-    offset = 0
-    relpow_map = np.empty((grdpts_x, grdpts_y), dtype='f8')
-    abspow_map = np.empty((grdpts_x, grdpts_y), dtype='f8')
-    while eotr:
-        try:
-            for i, tr in enumerate(stream):
-                dat = tr.data[spoint[i] + offset:
-                              spoint[i] + offset + nsamp]
-                dat = (dat - dat.mean()) * tap
-                ft[i, :] = np.fft.rfft(dat, nfft)[nlow:nlow + nf]
-        except IndexError:
-            break
-        ft = np.require(ft, 'c16', ['C_CONTIGUOUS'])
-        relpow_map.fill(0.)
-        abspow_map.fill(0.)
-        # computing the covariances of the signal at different receivers
-        dpow = 0.
-        for i in range(nstat):
-            for j in range(i, nstat):
-                R[:, i, j] = ft[i, :] * ft[j, :].conj()
-                if method == CAPON:
-                    R[:, i, j] /= np.abs(R[:, i, j].sum())
-                if i != j:
-                    R[:, j, i] = R[:, i, j].conjugate()
-                else:
-                    dpow += np.abs(R[:, i, j].sum())
-        dpow *= nstat
-        if method == CAPON:
-            # P(f) = 1/(e.H R(f)^-1 e)
-            for n in range(nf):
-                R[n, :, :] = np.linalg.pinv(R[n, :, :], rcond=1e-6)
-
-        errcode = clibsignal.generalizedBeamformer(
-            relpow_map, abspow_map, steer, R, nsamp, nstat, prewhiten,
-            grdpts_x, grdpts_y, nfft, nf, dpow, method)
-        if errcode != 0:
-            msg = 'generalizedBeamforming exited with error %d'
-            raise Exception(msg % errcode)
-        ix, iy = np.unravel_index(relpow_map.argmax(), relpow_map.shape)
-        relpow, abspow = relpow_map[ix, iy], abspow_map[ix, iy]
+    # to spead up the routine a bit we estimate all steering vectors in
+    # advance, worker processes compute them once on their own instead of
+    # getting them pickled with every job (other pools, e.g. thread pools
+    # passed in, get them precomputed as well)
+    in_processes = parallel is True or parallel == "process" or (
+        isinstance(parallel, Pool) and not isinstance(parallel, ThreadPool))
+    if in_processes:
+        steer = None
+    else:
+        steer = np.empty((nf, grdpts_x, grdpts_y, nstat), dtype='c16')
+        clibsignal.calcSteer(nstat, grdpts_x, grdpts_y, nf, nlow,
+                             deltaf, time_shift_table, steer)
+    # start times of all windows, stepping on until the next window would
+    # exceed etime
+    newstarts = [stime]
+    while newstarts[-1] + (nsamp + nstep) / fs <= etime:
+        newstarts.append(newstarts[-1] + nstep / fs)
+    # only use windows that are covered by the data of all traces
+    nwin = len(newstarts)
+    for i, tr in enumerate(stream):
+        nfit = len(tr.data) - spoint[i] - nsamp
+        if nfit < 0:
+            nwin = 0
+        elif nstep > 0:
+            nwin = min(nwin, nfit // nstep + 1)
+    offsets = nstep * np.arange(nwin)
+    # windows are beamformed in batches bounding the size of the data
+    # windows and spectra, cross spectral density matrices and power maps
+    # held in memory at a time
+    batch = max(1, 2 ** 22 // max(nf * nstat * nstat, grdpts_x * grdpts_y,
+                                  nstat * nfft))
+    if parallel:
+        nparts = workers or multiprocessing.cpu_count()
+        size = max(1, -(-len(offsets) // nparts))
         if store is not None:
-            store(relpow_map, abspow_map, offset)
-        # here we compute baz, slow
-        slow_x = sll_x + ix * sl_s
-        slow_y = sll_y + iy * sl_s
-
-        slow = np.sqrt(slow_x ** 2 + slow_y ** 2)
-        if slow < 1e-8:
-            slow = 1e-8
-        azimut = 180 * math.atan2(slow_x, slow_y) / math.pi
-        baz = azimut % -360 + 180
-        if relpow > semb_thres and 1. / slow > vel_thres:
-            res.append(np.array([newstart.timestamp, relpow, abspow, baz,
-                                 slow]))
-            if verbose:
-                print((newstart, (newstart + (nsamp / fs)), res[-1][1:]))
-        if (newstart + (nsamp + nstep) / fs) > etime:
-            eotr = False
-        offset += nstep
-
-        newstart += nstep / fs
+            size = min(size, batch)
+    else:
+        nparts, size = 1, batch
+    bounds = list(range(0, len(offsets), size)) + [len(offsets)]
+
+    def _process(mapper):
+        for k in range(0, len(bounds) - 1, nparts):
+            firsts = bounds[k:k + nparts + 1]
+            jobs = []
+            for first, last in zip(firsts[:-1], firsts[1:]):
+                data = [tr.data[spoint[i] + offsets[first]:
+                                spoint[i] + offsets[last - 1] + nsamp]
+                        for i, tr in enumerate(stream)]
+                jobs.append((data, offsets[first:last] - offsets[first],
+                             nsamp, nfft, nlow, nf, deltaf, time_shift_table,
+                             steer, prewhiten, method, batch,
+                             store is not None))
+            results = mapper(_array_processing_worker, jobs)
+            for first, result in zip(firsts, results):
+                relpow, abspow, ix, iy, relpow_maps, abspow_maps = result
+                for w in range(len(relpow)):
+                    if store is not None:
+                        store(relpow_maps[w], abspow_maps[w],
+                              int(offsets[first + w]))
+                    # here we compute baz, slow
+                    slow_x = sll_x + ix[w] * sl_s
+                    slow_y = sll_y + iy[w] * sl_s
+
+                    slow = np.sqrt(slow_x ** 2 + slow_y ** 2)
+                    if slow < 1e-8:
+                        slow = 1e-8
+                    azimut = 180 * math.atan2(slow_x, slow_y) / math.pi
+                    baz = azimut % -360 + 180
+                    if relpow[w] > semb_thres and 1. / slow > vel_thres:
+                        newstart = newstarts[first + w]
+                        res.append(np.array([newstart.timestamp, relpow[w],
+                                             abspow[w], baz, slow]))
+                        if verbose:
+                            print((newstart, (newstart + (nsamp / fs)),
+                                   res[-1][1:]))
+
+    if parallel:
+        with worker_pool(parallel, workers) as pool:
+            _process(pool.map)
+    else:
+        _process(map)
     res = np.array(res)
     if timestamp == 'julsec':
         pass
@@ -20,13 +20,16 @@ from __future__ import division
 from __future__ import unicode_literals
 from future.utils import native_str
 
+import multiprocessing
 import warnings
 import numpy as np
 import ctypes as C
 import scipy
 from obspy import Trace, Stream
+from obspy.core.util.misc import worker_pool
 from obspy.signal.headers import clibsignal
 from obspy.signal import cosTaper
+from obspy.signal.util import nextpow2
 
 
 def xcorr(tr1, tr2, shift_len, full_xcorr=False):
@@ -531,6 +534,176 @@ def templatesMaxSimilarity(st, time, streams_templates):
         return 0
 
 
+def _xcorrTemplatesWorker(args):
+    """
+    Overlap-save correlation of one part of the continuous data with the
+    template spectra, see :func:`xcorrTemplates`.
+
+    ``data`` has to include the ``offsets.max() + nt - 1`` samples following
+    the ``npts`` output samples.
+    """
+    data, spectra, offsets, nt, nfft, npts = args
+    ntemplates, nchannels = offsets.shape
+    max_offset = offsets.max()
+    step = nfft - nt + 1 - max_offset
+    # templates are correlated in groups to limit the memory usage
+    group = max(1, 2 ** 22 // (nchannels * nfft))
+    cc_sum = np.zeros((ntemplates, npts), dtype=np.float64)
+    for start in range(0, npts, step):
+        n = min(step, npts - start)
+        nlags = n + max_offset
+        seg = data[:, start:start + nlags + nt - 1]
+        # the correlation coefficient does not depend on the mean, removing
+        # it keeps the running sums below accurate
+        seg = seg - seg.mean(axis=1)[:, np.newaxis]
+        spectrum = np.fft.rfft(seg, nfft)
+        # running normalization: sum and sum of squares of the data in the
+        # window of every lag from cumulative sums
+        cumsum = np.zeros((nchannels, seg.shape[1] + 1), dtype=np.float64)
+        np.cumsum(seg, axis=1, out=cumsum[:, 1:])
+        cumsum2 = np.zeros_like(cumsum)
+        np.cumsum(seg ** 2, axis=1, out=cumsum2[:, 1:])
+        sum1 = cumsum[:, nt:nt + nlags] - cumsum[:, :nlags]
+        sum2 = cumsum2[:, nt:nt + nlags] - cumsum2[:, :nlags]
+        var = sum2 - sum1 ** 2 / nt
+        # the running sums carry the rounding errors of all preceding
+        # samples, e.g. of a large event. Windows with a variance that is not
+        # well above these errors are computed directly.
+        rows, cols = np.nonzero(var <= 1e-4 * cumsum2[:, nt:nt + nlags])
+        chunk = max(1, 2 ** 20 // nt)
+        for first in range(0, len(rows), chunk):
+            row = rows[first:first + chunk]
+            col = cols[first:first + chunk]
+            window = seg[row[:, np.newaxis],
+                         col[:, np.newaxis] + np.arange(nt)]
+            sum2[row, col] = (window ** 2).sum(axis=1)
+            window -= window.mean(axis=1)[:, np.newaxis]
+            var[row, col] = (window ** 2).sum(axis=1)
+        # windows without signal (e.g. zero filled gaps or constant data)
+        # correlate with 0
+        flat = var <= 1e-12 * sum2
+        var[flat] = 1.0
+        norm = 1.0 / np.sqrt(var)
+        norm[flat] = 0.0
+        for first in range(0, ntemplates, group):
+            last = min(first + group, ntemplates)
+            cc = np.fft.irfft(spectrum * spectra[first:last], nfft)
+            if not offsets[first:last].any():
+                cc_sum[first:last, start:start + n] = \
+                    (cc[:, :, :n] * norm[:, :n]).sum(axis=1)
+                continue
+            for _i in range(first, last):
+                for channel, offset in enumerate(offsets[_i]):
+                    cc_sum[_i, start:start + n] += \
+                        cc[_i - first, channel, offset:offset + n] * \
+                        norm[channel, offset:offset + n]
+    return cc_sum
+
+
+def xcorrTemplates(data, templates, offsets=None, nfft=None, parallel=False,
+                   workers=None):
+    """
+    Normalized cross correlation of many templates with long continuous
+    multi-channel data (matched filter).
+
+    All templates are correlated with the data in one pass in the frequency
+    domain (overlap-save method). The data windows are normalized with
+    running sums, so the result at every lag is the correlation coefficient
+    of template and data, summed up over all channels.
+
+    :type data: :class:`~numpy.ndarray`
+    :param data: Continuous data, one row of ``npts`` samples per channel
+        (shape ``(nchannels, npts)``) or a single channel. All channels have
+        to share the same start time and sampling rate.
+    :type templates: :class:`~numpy.ndarray`
+    :param templates: Templates with ``nt`` samples for every channel of the
+        data (shape ``(ntemplates, nchannels, nt)``), single channel
+        templates may be given with shape ``(ntemplates, nt)``.
+    :type offsets: :class:`~numpy.ndarray` of int, optional
+    :param offsets: Start of every channel of the templates (shape
+        ``(ntemplates, nchannels)``) in samples after the template start,
+        e.g. to account for the moveout across a network. Defaults to 0.
+    :type nfft: int, optional
+    :param nfft: Length of the FFT blocks. Defaults to a power of 2 of at
+        least eight times the template length plus the largest offset.
+    :type parallel: bool, str or pool-like object, optional
+    :param parallel: Correlates parts of the data in a pool of workers,
+        either ``"thread"``, ``"process"`` or a pool-like object, see
+        :func:`~obspy.core.util.misc.worker_pool`. The result is the same as
+        with serial processing.
+    :type workers: int, optional
+    :param workers: Number of workers used if a new pool is created. The data
+        is split into this many parts (default: number of CPUs).
+    :rtype: :class:`~numpy.ndarray`
+    :returns: Correlation coefficients summed up over all channels, one row
+        of ``npts - nt + 1 - offsets.max()`` values per template. Value ``i``
+        belongs to the template starting at sample ``i`` of the data.
+        Correlations with data windows without any variance are 0.
+
+    .. rubric:: Example
+
+    >>> np.random.seed(42)
+    >>> data = np.random.randn(3, 10000)
+    >>> templates = np.array([data[:, 2000:2200], data[:, 7000:7200]])
+    >>> cc_sum = xcorrTemplates(data, templates)
+    >>> cc_sum.shape
+    (2, 9801)
+    >>> cc_sum.argmax(axis=1).tolist()
+    [2000, 7000]
+    >>> np.allclose(cc_sum.max(axis=1), 3.0)
+    True
+    """
+    data = np.atleast_2d(np.require(data, np.float64))
+    templates = np.require(templates, np.float64)
+    if templates.ndim == 2:
+        templates = templates[:, np.newaxis, :]
+    ntemplates, nchannels, nt = templates.shape
+    if nchannels != data.shape[0]:
+        msg = "Templates have %i channels, data has %i channels."
+        raise ValueError(msg % (nchannels, data.shape[0]))
+    if offsets is None:
+        offsets = np.zeros((ntemplates, nchannels), dtype=np.int64)
+    offsets = np.require(offsets, np.int64)
+    if offsets.shape != (ntemplates, nchannels) or offsets.min() < 0:
+        msg = "Offsets have to be non-negative, one per template and channel."
+        raise ValueError(msg)
+    max_offset = offsets.max()
+    npts = data.shape[1] - nt + 1 - max_offset
+    if npts < 1:
+        msg = "Data has to be longer than templates including offsets."
+        raise ValueError(msg)
+    if nfft is None:
+        nfft = max(nextpow2(8 * (nt + max_offset)), 1024)
+    if nfft < nt + max_offset:
+        msg = "nfft has to be at least template length plus largest offset."
+        raise ValueError(msg)
+    # demeaned templates with unit norm, flat template channels contribute 0
+    templates = templates - templates.mean(axis=2)[:, :, np.newaxis]
+    norm = np.sqrt((templates ** 2).sum(axis=2))
+    norm[norm == 0] = np.inf
+    templates /= norm[:, :, np.newaxis]
+    spectra = np.conj(np.fft.rfft(templates, nfft))
+    # parts of the data start at multiples of the block length to get
+    # exactly the same blocks as with serial processing
+    step = nfft - nt + 1 - max_offset
+    if parallel:
+        nparts = workers or multiprocessing.cpu_count()
+    else:
+        nparts = 1
+    nblocks = -(-npts // step)
+    bounds = [min(npts, (nblocks * _i // nparts) * step)
+              for _i in range(nparts + 1)]
+    jobs = [(data[:, start:stop + nt - 1 + max_offset], spectra, offsets,
+             nt, nfft, stop - start)
+            for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+    if parallel:
+        with worker_pool(parallel, workers) as pool:
+            results = list(pool.map(_xcorrTemplatesWorker, jobs))
+    else:
+        results = [_xcorrTemplatesWorker(job) for job in jobs]
+    return np.concatenate(results, axis=1)
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod(exclude_empty=True)
@@ -33,7 +33,8 @@ def bandpass(data, freqmin, freqmax, df, corners=4, zerophase=False):
 
     Filter data from ``freqmin`` to ``freqmax`` using ``corners`` corners.
 
-    :param data: Data to filter, type numpy.ndarray.
+    :param data: Data to filter, type numpy.ndarray. Multidimensional arrays
+        are filtered along the last axis.
     :param freqmin: Pass band low corner frequency.
     :param freqmax: Pass band high corner frequency.
     :param df: Sampling rate in Hz.
@@ -59,7 +60,7 @@ def bandpass(data, freqmin, freqmax, df, corners=4, zerophase=False):
                        ftype='butter', output='ba')
     if zerophase:
         firstpass = lfilter(b, a, data)
-        return lfilter(b, a, firstpass[::-1])[::-1]
+        return lfilter(b, a, firstpass[..., ::-1])[..., ::-1]
     else:
         return lfilter(b, a, data)
 
@@ -71,7 +72,8 @@ def bandstop(data, freqmin, freqmax, df, corners=4, zerophase=False):
     Filter data removing data between frequencies ``freqmin`` and ``freqmax``
     using ``corners`` corners.
 
-    :param data: Data to filter, type numpy.ndarray.
+    :param data: Data to filter, type numpy.ndarray. Multidimensional arrays
+        are filtered along the last axis.
     :param freqmin: Stop band low corner frequency.
     :param freqmax: Stop band high corner frequency.
     :param df: Sampling rate in Hz.
@@ -97,7 +99,7 @@ def bandstop(data, freqmin, freqmax, df, corners=4, zerophase=False):
                        btype='bandstop', ftype='butter', output='ba')
     if zerophase:
         firstpass = lfilter(b, a, data)
-        return lfilter(b, a, firstpass[::-1])[::-1]
+        return lfilter(b, a, firstpass[..., ::-1])[..., ::-1]
     else:
         return lfilter(b, a, data)
 
@@ -109,7 +111,8 @@ def lowpass(data, freq, df, corners=4, zerophase=False):
     Filter data removing data over certain frequency ``freq`` using ``corners``
     corners.
 
-    :param data: Data to filter, type numpy.ndarray.
+    :param data: Data to filter, type numpy.ndarray. Multidimensional arrays
+        are filtered along the last axis.
     :param freq: Filter corner frequency.
     :param df: Sampling rate in Hz.
     :param corners: Filter corners / orders.
@@ -130,7 +133,7 @@ def lowpass(data, freq, df, corners=4, zerophase=False):
                        output='ba')
     if zerophase:
         firstpass = lfilter(b, a, data)
-        return lfilter(b, a, firstpass[::-1])[::-1]
+        return lfilter(b, a, firstpass[..., ::-1])[..., ::-1]
     else:
         return lfilter(b, a, data)
 
@@ -142,7 +145,8 @@ def highpass(data, freq, df, corners=4, zerophase=False):
     Filter data removing data below certain frequency ``freq`` using
     ``corners`` corners.
 
-    :param data: Data to filter, type numpy.ndarray.
+    :param data: Data to filter, type numpy.ndarray. Multidimensional arrays
+        are filtered along the last axis.
     :param freq: Filter corner frequency.
     :param df: Sampling rate in Hz.
     :param corners: Filter corners / orders.
@@ -161,7 +165,7 @@ def highpass(data, freq, df, corners=4, zerophase=False):
                        output='ba')
     if zerophase:
         firstpass = lfilter(b, a, data)
-        return lfilter(b, a, firstpass[::-1])[::-1]
+        return lfilter(b, a, firstpass[..., ::-1])[..., ::-1]
     else:
         return lfilter(b, a, data)
 
@@ -331,7 +335,8 @@ def lowpassCheby2(data, freq, df, maxorder=12, ba=False,
     band frequency is determined dynamically, such that the
     values above the stop band frequency are lower than -96dB.
 
-    :param data: Data to filter, type numpy.ndarray.
+    :param data: Data to filter, type numpy.ndarray. Multidimensional arrays
+        are filtered along the last axis.
     :param freq: The frequency above which signals are attenuated
         with 95 dB
     :param df: Sampling rate in Hz.
@@ -365,7 +365,8 @@ def seisSim(data, samp_rate, paz_remove=None, paz_simulate=None,
     Simulate/Correct seismometer.
 
     :type data: NumPy ndarray
-    :param data: Seismogram, detrend before hand (e.g. zero mean)
+    :param data: Seismogram, detrend before hand (e.g. zero mean). The rows
+        of a 2D array are treated as separate seismograms.
     :type samp_rate: Float
     :param samp_rate: Sample Rate of Seismogram
     :type paz_remove: Dictionary, None
@@ -460,10 +461,10 @@ def seisSim(data, samp_rate, paz_remove=None, paz_simulate=None,
     # Translated from PITSA: spr_resg.c
     delta = 1.0 / samp_rate
     #
-    ndat = len(data)
+    ndat = data.shape[-1]
     data = data.astype("float64")
     if zero_mean:
-        data -= data.mean()
+        data -= data.mean(axis=-1)[..., np.newaxis]
     if taper:
         if sacsim:
             data *= cosTaper(ndat, taper_fraction,
@@ -519,9 +520,12 @@ def seisSim(data, samp_rate, paz_remove=None, paz_simulate=None,
         data *= pazToFreqResp(paz_simulate['poles'], paz_simulate['zeros'],
                               paz_simulate['gain'], delta, nfft)
 
-    data[-1] = abs(data[-1]) + 0.0j
+    # same as abs() of every single value, np.abs() on complex arrays may
+    # differ in the last digit
+    nyquist = data[..., -1]
+    data[..., -1] = np.hypot(nyquist.real, nyquist.imag) + 0.0j
     # transform data back into the time domain
-    data = np.fft.irfft(data)[0:ndat]
+    data = np.fft.irfft(data)[..., 0:ndat]
     if pitsasim:
         # linear detrend
         data = simpleDetrend(data)
@@ -29,10 +29,17 @@ import pickle
 import math
 import bisect
 import bz2
+import copy
+import io
+import zipfile
 import numpy as np
+from scipy import sparse
 from obspy import Trace, Stream
+from obspy.core import Stats
+from obspy.core.utcdatetime import UTCDateTimeArray
 from obspy.core.util import getMatplotlibVersion
-from obspy.signal import cosTaper
+from obspy.core.util.misc import worker_pool
+from obspy.signal import cosTaper, seisSim
 from obspy.signal.util import prevpow2
 
 
@@ -40,6 +47,18 @@ MATPLOTLIB_VERSION = getMatplotlibVersion()
 
 dtiny = np.finfo(0.0).tiny
 
+# number of segments processed at once by PPSD.add(..., batch=True)
+BATCH_SIZE = 16
+
+# version of the layout of files written by PPSD.save_npz()
+NPZ_FORMAT_VERSION = 1
+# setup of a PPSD stored in npz files, all must match when appending
+NPZ_SETUP_KEYS = ('id', 'sampling_rate', 'ppsd_length', 'overlap',
+                  'is_rotational_data', 'merge_method', 'nfft', 'nlap',
+                  'period_bins', 'spec_bins')
+# per segment and time span information stored in chunks in npz files
+NPZ_CHUNK_KEYS = ('times_used', 'binned_psds', 'times_data', 'times_gaps')
+
 
 if MATPLOTLIB_VERSION is None:
     # if matplotlib is not present be silent about it and only raise the
@@ -163,6 +182,45 @@ def psd(x, NFFT=256, Fs=2, detrend=detrend_none, window=window_hanning,
     return Pxx, freqs
 
 
+def _psd_batch(data, NFFT, Fs, noverlap):
+    """
+    Computes the onesided psd of every row of a 2D array like :func:`psd`
+    called with ``detrend=mlab.detrend_linear`` and ``window=fft_taper``.
+
+    All rows are processed at once, with a real FFT and with the linear
+    trend of every window removed by vectorized least squares.
+
+    :type data: :class:`~numpy.ndarray`
+    :param data: 2D array with one time series per row.
+    :returns: 2D array with the psd of every row, NFFT // 2 + 1 values each.
+    """
+    nrows, npts = data.shape
+    step = NFFT - noverlap
+    nwindows = (npts - noverlap) // step
+    window = fft_taper(np.ones(NFFT))
+    x = np.arange(NFFT, dtype=np.float64)
+    x -= x.mean()
+    xx = np.dot(x, x)
+    spec = np.zeros((nrows, NFFT // 2 + 1))
+    for i in range(nwindows):
+        segment = data[:, i * step:i * step + NFFT]
+        slope = np.dot(segment, x) / xx
+        segment = segment - segment.mean(axis=1)[:, np.newaxis]
+        segment -= slope[:, np.newaxis] * x
+        segment *= window
+        fft = np.fft.rfft(segment, axis=1)
+        spec += fft.real ** 2 + fft.imag ** 2
+    spec /= nwindows
+    # onesided density, DC and Nyquist frequency are not doubled
+    if NFFT % 2:
+        spec[:, 1:] *= 2.0
+    else:
+        spec[:, 1:-1] *= 2.0
+    spec /= Fs
+    spec /= (window ** 2).sum()
+    return spec
+
+
 def fft_taper(data):
     """
     Cosine taper, 10 percent at each end (like done by [McNamara2004]_).
@@ -228,6 +286,60 @@ def welch_window(N):
     return taper
 
 
+def _writeNpy(zf, name, array):
+    """
+    Writes an array as ``.npy`` member to an open zip file, the same way as
+    :func:`numpy.savez` does.
+    """
+    fh = io.BytesIO()
+    np.lib.format.write_array(fh, np.asanyarray(array))
+    zf.writestr(name + ".npy", fh.getvalue())
+
+
+def _readNpz(filename):
+    """
+    Reads a file written by
+    :meth:`~obspy.signal.spectral_estimation.PPSD.save_npz`.
+
+    :returns: Dictionary with the setup and list of dictionaries with the
+        arrays of every chunk.
+    """
+    npz = np.load(filename)
+    try:
+        version = int(npz['format_version'])
+        if version > NPZ_FORMAT_VERSION:
+            msg = "Unsupported PPSD npz format version %i in %s" % (
+                version, filename)
+            raise ValueError(msg)
+        setup = dict((key, npz[key]) for key in NPZ_SETUP_KEYS)
+        num_chunks = len([name for name in npz.files
+                          if name.startswith("times_used_")])
+        chunks = [dict((key, npz["%s_%05i" % (key, i)])
+                       for key in NPZ_CHUNK_KEYS)
+                  for i in range(num_chunks)]
+    finally:
+        npz.close()
+    return setup, chunks
+
+
+def _processSegmentWorker(args):
+    """
+    Computes the binned spectrum of a single PPSD segment, used by
+    :meth:`~obspy.signal.spectral_estimation.PPSD.add` with ``parallel``.
+    """
+    ppsd, tr = args
+    return ppsd._process_segment(tr)
+
+
+def _processSegmentsWorker(args):
+    """
+    Computes the binned spectra of a batch of PPSD segments, used by
+    :meth:`~obspy.signal.spectral_estimation.PPSD.add` with ``batch``.
+    """
+    ppsd, traces = args
+    return ppsd._process_segments(traces)
+
+
 class PPSD():
     """
     Class to compile probabilistic power spectral densities for one combination
@@ -280,6 +392,34 @@ class PPSD():
     The :func:`~obspy.signal.spectral_estimation.PPSD.load` method detects
     compression automatically.
 
+    The binned spectra of all segments can also be stored in a compact NumPy
+    ``.npz`` file that new segments can be appended to, e.g. by a daily job.
+    The histogram is computed again when loading, optionally only for a part
+    of the stored time range:
+
+    >>> ppsd.save_npz("myfile.npz", append=True)  # doctest: +SKIP
+    >>> ppsd = PPSD.load_npz("myfile.npz", starttime=t1)  # doctest: +SKIP
+
+    .. rubric:: Parallel Processing and Merging
+
+    The segments of the data handed to
+    :meth:`~obspy.signal.spectral_estimation.PPSD.add` can be processed in a
+    pool of worker threads or processes:
+
+    >>> ppsd.add(st, parallel="process", workers=4)  # doctest: +SKIP
+
+    Long recordings are processed much faster with ``batch=True``, computing
+    the spectra of many segments at once (optionally also in parallel):
+
+    >>> ppsd.add(st, batch=True)  # doctest: +SKIP
+
+    PPSDs of the same channel with the same setup that were built
+    independently, e.g. for different months or on different machines, can
+    be combined with :meth:`~obspy.signal.spectral_estimation.PPSD.merge`
+    or by adding them up:
+
+    >>> ppsd = PPSD.load("jan.pkl") + PPSD.load("feb.pkl")  # doctest: +SKIP
+
     .. note::
 
         While saving the PPSD with compression enabled takes significantly
@@ -402,6 +542,8 @@ class PPSD():
         self.times_data = []
         self.times_gaps = []
         self.hist_stack = None
+        # binned spectrum of every segment in times_used, same order
+        self._binned_psds = []
         self.__setup_bins()
         # set up the binning for the db scale
         num_bins = int((db_bins[1] - db_bins[0]) / db_bins[2])
@@ -466,14 +608,18 @@ class PPSD():
             return False
         return True
 
-    def __insert_used_time(self, utcdatetime):
+    def __insert_used_time(self, utcdatetime, spec_octaves):
         """
         Inserts the given UTCDateTime at the right position in the list keeping
-        the order intact.
+        the order intact and the binned spectrum of that segment at the same
+        position.
 
         :type utcdatetime: :class:`~obspy.core.utcdatetime.UTCDateTime`
         """
-        bisect.insort(self.times_used, utcdatetime)
+        index = bisect.bisect_right(self.times_used, utcdatetime)
+        self.times_used.insert(index, utcdatetime)
+        if self._binned_psds is not None:
+            self._binned_psds.insert(index, spec_octaves)
 
     def __insert_gap_times(self, stream):
         """
@@ -515,7 +661,8 @@ class PPSD():
         """
         Adds ppsd_length and overlap attributes if not existing.
         This ensures compatibility with pickled objects without these
-        attributes.
+        attributes. The binned spectra of the segments of such objects are
+        unknown.
         """
         try:
             self.ppsd_length
@@ -523,8 +670,11 @@ class PPSD():
         except AttributeError:
             self.ppsd_length = 3600.
             self.overlap = 0.5
+        if not hasattr(self, "_binned_psds"):
+            self._binned_psds = None if self.times_used else []
 
-    def add(self, stream, verbose=False):
+    def add(self, stream, verbose=False, parallel=False, workers=None,
+            batch=False):
         """
         Process all traces with compatible information and add their spectral
         estimates to the histogram containg the probabilistic psd.
@@ -534,6 +684,22 @@ class PPSD():
                 :class:`~obspy.core.trace.Trace`
         :param stream: Stream or trace with data that should be added to the
                 probabilistic psd histogram.
+        :type parallel: bool, str or pool-like object (optional)
+        :param parallel: Computes the spectra of the segments in a pool of
+                workers, either ``"thread"``, ``"process"`` or a pool-like
+                object, see :func:`~obspy.core.util.misc.worker_pool`. The
+                spectra are added to the histogram in the same order and with
+                the same result as if processed serially.
+        :type workers: int (optional)
+        :param workers: Number of workers used if a new pool is created.
+        :type batch: bool (optional)
+        :param batch: Computes the spectra of up to ``BATCH_SIZE`` segments
+                at once on a 2D array, the instrument response is evaluated
+                only once per batch. The histogram is the same as with serial
+                processing except for rounding differences in the last
+                digits, which may move single values to neighbouring bins.
+                Combined with ``parallel`` the batches are distributed over
+                the workers.
         :returns: True if appropriate data were found and the ppsd statistics
                 were changed, False otherwise.
         """
@@ -552,6 +718,8 @@ class PPSD():
         # merge depending on skip_on_gaps set during __init__
         stream.merge(self.merge_method, fill_value=0)
 
+        # segments to process in a pool of workers or in batches
+        segments = []
         for tr in stream:
             # the following check should not be necessary due to the select()..
             if not self.__sanity_check(tr):
@@ -562,19 +730,18 @@ class PPSD():
             t2 = tr.stats.endtime
             while t1 + self.ppsd_length <= t2:
                 if self.__check_time_present(t1):
-                    msg = "Already covered time spans detected (e.g. %s), " + \
-                          "skipping these slices."
-                    msg = msg % t1
-                    warnings.warn(msg)
+                    self.__warn_time_present(t1)
+                elif parallel or batch:
+                    segments.append((t1, tr.slice(t1, t1 + self.ppsd_length)))
                 else:
                     # throw warnings if trace length is different
                     # than ppsd_lenth..!?!
                     slice = tr.slice(t1, t1 + self.ppsd_length)
                     # XXX not good, should be working in place somehow
                     # XXX how to do it with the padding, though?
-                    success = self.__process(slice)
-                    if success:
-                        self.__insert_used_time(t1)
+                    spec_octaves = self.__process(slice)
+                    if spec_octaves is not None:
+                        self.__insert_used_time(t1, spec_octaves)
                         if verbose:
                             print(t1)
                         changed = True
@@ -582,8 +749,73 @@ class PPSD():
 
             # enforce time limits, pad zeros if gaps
             #tr.trim(t, t+PPSD_LENGTH, pad=True)
+        if segments:
+            changed = self.__add_segments(segments, parallel, workers, batch,
+                                          verbose) or changed
         return changed
 
+    def __add_segments(self, segments, parallel, workers, batch,
+                       verbose=False):
+        """
+        Computes the spectra of the given segments in a pool of workers
+        and/or in batches and adds them to the histogram in the given order.
+
+        :type segments: list of tuples
+        :param segments: Start times and traces of all segments to process.
+        :returns: True if any segment was added to the histogram.
+        """
+        # the workers only need the setup, not the collected statistics
+        template = copy.copy(self)
+        template.hist_stack = None
+        template.times_used = template.times = []
+        template.times_data = []
+        template.times_gaps = []
+        template._binned_psds = []
+        traces = [tr for _, tr in segments]
+        if batch:
+            jobs = [(template, traces[i:i + BATCH_SIZE])
+                    for i in range(0, len(traces), BATCH_SIZE)]
+            func = _processSegmentsWorker
+        else:
+            jobs = [(template, tr) for tr in traces]
+            func = _processSegmentWorker
+        if parallel:
+            with worker_pool(parallel, workers) as pool:
+                # map keeps the input order, so the result is deterministic
+                results = list(pool.map(func, jobs))
+        else:
+            results = [func(job) for job in jobs]
+        if batch:
+            spectra = [spec for result in results for spec in result]
+        else:
+            spectra = results
+        accepted = []
+        for (t1, _), spec_octaves in zip(segments, spectra):
+            if spec_octaves is None:
+                continue
+            # segments of overlapping traces in one stream are only checked
+            # against each other here
+            if self.__check_time_present(t1):
+                self.__warn_time_present(t1)
+                continue
+            accepted.append(spec_octaves)
+            self.__insert_used_time(t1, spec_octaves)
+            if verbose:
+                print(t1)
+        if not accepted:
+            return False
+        self.__add_to_histogram(np.array(accepted))
+        return True
+
+    def __warn_time_present(self, utcdatetime):
+        """
+        Warns that the segment starting at the given UTCDateTime is skipped.
+        """
+        msg = "Already covered time spans detected (e.g. %s), " + \
+              "skipping these slices."
+        msg = msg % utcdatetime
+        warnings.warn(msg)
+
     def __process(self, tr):
         """
         Processes a segment of data and adds the information to the
@@ -592,8 +824,23 @@ class PPSD():
 
         :type tr: :class:`~obspy.core.trace.Trace`
         :param tr: Compatible Trace with data of one PPSD segment
-        :returns: True if segment was successfully added to histogram, False
-                otherwise.
+        :returns: Binned spectrum of the segment if it was successfully added
+                to histogram, None otherwise.
+        """
+        spec_octaves = self._process_segment(tr)
+        if spec_octaves is not None:
+            self.__add_to_histogram(spec_octaves)
+        return spec_octaves
+
+    def _process_segment(self, tr):
+        """
+        Computes the spectrum of a segment of data averaged over the period
+        bins. Does not change the PPSD histogram.
+
+        :type tr: :class:`~obspy.core.trace.Trace`
+        :param tr: Compatible Trace with data of one PPSD segment
+        :returns: Binned spectrum in dB or None if the segment could not be
+                processed.
         """
         # XXX DIRTY HACK!!
         if len(tr) == self.len + 1:
@@ -603,7 +850,7 @@ class PPSD():
             msg = "Got a piece of data with wrong length. Skipping"
             warnings.warn(msg)
             print(len(tr), self.len)
-            return False
+            return None
         # being paranoid, only necessary if in-place operations would follow
         tr.data = tr.data.astype("float64")
         # if trace has a masked array we fill in zeros
@@ -614,22 +861,9 @@ class PPSD():
         except AttributeError:
             pass
 
-        # get instrument response preferably from parser object
-        try:
-            paz = self.parser.getPAZ(self.id, datetime=tr.stats.starttime)
-        except Exception as e:
-            if self.parser is not None:
-                msg = "Error getting response from parser:\n%s: %s\n" \
-                      "Skipping time segment(s)."
-                msg = msg % (e.__class__.__name__, e.message)
-                warnings.warn(msg)
-                return False
-            paz = self.paz
+        paz = self.__get_paz(tr.stats.starttime)
         if paz is None:
-            msg = "Missing poles and zeros information for response " \
-                  "removal. Skipping time segment(s)."
-            warnings.warn(msg)
-            return False
+            return None
         # restitution:
         # mcnamara apply the correction at the end in freq-domain,
         # does it make a difference?
@@ -674,11 +908,143 @@ class PPSD():
             specs = spec[(per_left <= self.per) & (self.per <= per_right)]
             spec_center = specs.mean()
             spec_octaves.append(spec_center)
-        spec_octaves = np.array(spec_octaves)
+        return np.array(spec_octaves)
 
-        hist, self.xedges, self.yedges = np.histogram2d(
-            self.per_octaves,
-            spec_octaves, bins=(self.period_bins, self.spec_bins))
+    def _process_segments(self, traces):
+        """
+        Computes the spectra of several segments of data averaged over the
+        period bins, see
+        :meth:`~obspy.signal.spectral_estimation.PPSD._process_segment`.
+
+        The segments are stacked into a 2D array and processed at once. The
+        instrument response is evaluated only once for all segments sharing
+        the same poles and zeros.
+
+        :type traces: list of :class:`~obspy.core.trace.Trace`
+        :param traces: Compatible Traces with data of one PPSD segment each
+        :returns: List with the binned spectrum in dB of every segment or
+                None for segments that could not be processed.
+        """
+        result = [None] * len(traces)
+        # group segments by response, as list of (paz, indices) pairs
+        groups = []
+        for i, tr in enumerate(traces):
+            # same as the dirty hack in _process_segment()
+            if len(tr) not in (self.len, self.len + 1):
+                msg = "Got a piece of data with wrong length. Skipping"
+                warnings.warn(msg)
+                print(len(tr), self.len)
+                continue
+            paz = self.__get_paz(tr.stats.starttime)
+            if paz is None:
+                continue
+            for group_paz, indices in groups:
+                if group_paz is paz or group_paz == paz:
+                    indices.append(i)
+                    break
+            else:
+                groups.append((paz, [i]))
+        if not groups:
+            return result
+        octave_matrix, empty_bins = self.__get_octave_matrix()
+        for paz, indices in groups:
+            data = np.empty((len(indices), self.len), dtype=np.float64)
+            for j, i in enumerate(indices):
+                # masked values get replaced by zeros
+                data[j] = np.ma.filled(traces[i].data[:self.len], 0)
+            if self.is_rotational_data:
+                # in case of rotational data just remove sensitivity
+                data /= paz['sensitivity']
+            else:
+                data = seisSim(data, self.sampling_rate, paz_remove=paz,
+                               remove_sensitivity=True, paz_simulate=None,
+                               simulate_sensitivity=False)
+                # go to acceleration, same as np.gradient() of every row
+                gradient = np.empty_like(data)
+                gradient[:, 1:-1] = (data[:, 2:] - data[:, :-2]) / \
+                    (2.0 * self.delta)
+                gradient[:, 0] = (data[:, 1] - data[:, 0]) / self.delta
+                gradient[:, -1] = (data[:, -1] - data[:, -2]) / self.delta
+                data = gradient
+            spec = _psd_batch(data, self.nfft, self.sampling_rate, self.nlap)
+            del data
+            # leave out first entry (offset) and reverse to go by period
+            spec = spec[:, :0:-1]
+            # avoid calculating log of zero
+            spec[spec < dtiny] = dtiny
+            # go to dB
+            spec = np.log10(spec)
+            spec *= 10
+            spec_octaves = octave_matrix.dot(spec.T).T
+            spec_octaves[:, empty_bins] = np.nan
+            for j, i in enumerate(indices):
+                result[i] = spec_octaves[j]
+        return result
+
+    def __get_octave_matrix(self):
+        """
+        Returns a sparse matrix averaging a spectrum over the period bins and
+        a boolean array marking period bins without any spectral value.
+        """
+        # periods are sorted, so every period bin is a contiguous range
+        starts = np.searchsorted(self.per, self.per_octaves_left, side="left")
+        stops = np.searchsorted(self.per, self.per_octaves_right,
+                                side="right")
+        counts = stops - starts
+        rows = np.repeat(np.arange(len(counts)), counts)
+        cols = np.concatenate([np.arange(start, stop) for start, stop
+                               in zip(starts, stops)])
+        weights = np.repeat(1.0 / np.maximum(counts, 1), counts)
+        matrix = sparse.csr_matrix((weights, (rows, cols)),
+                                   shape=(len(counts), len(self.per)))
+        return matrix, counts == 0
+
+    def __get_paz(self, starttime):
+        """
+        Returns the poles and zeros for a segment starting at the given time,
+        preferably from the parser object, or None (with a warning) if no
+        response information is available.
+        """
+        try:
+            paz = self.parser.getPAZ(self.id, datetime=starttime)
+        except Exception as e:
+            if self.parser is not None:
+                msg = "Error getting response from parser:\n%s: %s\n" \
+                      "Skipping time segment(s)."
+                msg = msg % (e.__class__.__name__, e.message)
+                warnings.warn(msg)
+                return None
+            paz = self.paz
+        if paz is None:
+            msg = "Missing poles and zeros information for response " \
+                  "removal. Skipping time segment(s)."
+            warnings.warn(msg)
+        return paz
+
+    def __add_to_histogram(self, spec_octaves):
+        """
+        Adds the binned spectrum of one segment (or a 2D array with one
+        spectrum per row) to the PPSD histogram.
+
+        Same as adding up :func:`numpy.histogram2d` of period bin centers and
+        spectra, but with integer bin indexes computed for all values at once.
+        """
+        spec_octaves = np.atleast_2d(spec_octaves)
+        num_per = len(self.period_bins) - 1
+        num_spec = len(self.spec_bins) - 1
+        # the period bin edges are the period bin centers themselves, the
+        # last center falls on the right edge and so into the last bin
+        per_index = np.minimum(np.arange(spec_octaves.shape[1]), num_per - 1)
+        spec_index = np.searchsorted(self.spec_bins, spec_octaves,
+                                     side="right") - 1
+        spec_index[spec_octaves == self.spec_bins[-1]] = num_spec - 1
+        # values outside of the db range (or NaN) are not counted
+        valid = (spec_index >= 0) & (spec_index < num_spec)
+        index = (per_index * num_spec + spec_index)[valid]
+        hist = np.bincount(index, minlength=num_per * num_spec)
+        hist = hist.reshape((num_per, num_spec)).astype(np.float64)
+        self.xedges = np.array(self.period_bins, dtype=np.float64)
+        self.yedges = np.array(self.spec_bins, dtype=np.float64)
 
         try:
             # we have to make sure manually that the bins are always the same!
@@ -687,7 +1053,113 @@ class PPSD():
         except TypeError:
             # only during first run initialize stack with first histogram
             self.hist_stack = hist
-        return True
+
+    def __add__(self, other):
+        """
+        Combines two PPSDs of the same channel with the same setup into a new
+        PPSD, see :meth:`~obspy.signal.spectral_estimation.PPSD.merge`.
+
+        :type other: :class:`~obspy.signal.spectral_estimation.PPSD`
+        :rtype: :class:`~obspy.signal.spectral_estimation.PPSD`
+        """
+        if not isinstance(other, PPSD):
+            raise TypeError
+        new = copy.deepcopy(self)
+        return new.merge(other)
+
+    def __iadd__(self, other):
+        """
+        Merges another PPSD into this one with ``self += other``.
+        """
+        if not isinstance(other, PPSD):
+            raise TypeError
+        return self.merge(other)
+
+    def merge(self, other):
+        """
+        Adds the histogram and the time information of another PPSD built
+        independently (e.g. for another time range or on another machine) to
+        this PPSD.
+
+        Both PPSDs must share id, sampling rate, segment length and overlap,
+        processing options and binning. Start times of segments of the two
+        PPSDs closer than the segment step are considered to cover the same
+        time span, in this case nothing gets merged.
+
+        :type other: :class:`~obspy.signal.spectral_estimation.PPSD`
+        :param other: PPSD to merge into this one, it does not get changed.
+        :returns: This PPSD.
+        """
+        self.__check_ppsd_length()
+        other.__check_ppsd_length()
+        for key in ('id', 'sampling_rate', 'ppsd_length', 'overlap', 'nfft',
+                    'nlap', 'is_rotational_data', 'merge_method'):
+            if getattr(self, key) != getattr(other, key):
+                msg = "Can not merge PPSDs, %s differs" % key
+                raise TypeError(msg)
+        for key in ('period_bins', 'spec_bins'):
+            if not np.array_equal(getattr(self, key), getattr(other, key)):
+                msg = "Can not merge PPSDs, %s differs" % key
+                raise TypeError(msg)
+        t = self.__find_time_conflict(other.times_used)
+        if t is not None:
+            msg = "Already covered time spans detected (e.g. %s), can not " + \
+                  "merge PPSDs."
+            raise ValueError(msg % t)
+        if other.hist_stack is not None:
+            if self.hist_stack is None:
+                self.hist_stack = other.hist_stack.copy()
+                self.xedges = other.xedges
+                self.yedges = other.yedges
+            else:
+                self.hist_stack += other.hist_stack
+        # change lists in place, self.times refers to self.times_used
+        if self._binned_psds is None or other._binned_psds is None:
+            self.times_used[:] = sorted(self.times_used + other.times_used)
+            self._binned_psds = None
+        else:
+            segments = sorted(
+                zip(self.times_used + other.times_used,
+                    self._binned_psds + other._binned_psds),
+                key=lambda x: x[0])
+            self.times_used[:] = [t for t, _ in segments]
+            self._binned_psds = [spec for _, spec in segments]
+        self.times_data += other.times_data
+        self.times_data.sort()
+        self.times_gaps += other.times_gaps
+        self.times_gaps.sort()
+        return self
+
+    def __find_time_conflict(self, times):
+        """
+        Returns the first of the given segment start times that is closer
+        than the segment step to a start time of this PPSD or None.
+        """
+        if not self.times_used or not times:
+            return None
+        conflicts = np.nonzero(self.__time_conflicts(
+            [t.timestamp for t in self.times_used],
+            [t.timestamp for t in times]))[0]
+        if len(conflicts):
+            return times[conflicts[0]]
+        return None
+
+    def __time_conflicts(self, used, new):
+        """
+        Returns a boolean array marking the segment start times ``new`` that
+        are closer than the segment step to any of the sorted segment start
+        times ``used`` (both as POSIX timestamps).
+        """
+        used = np.asarray(used, dtype=np.float64)
+        new = np.asarray(new, dtype=np.float64)
+        if not len(used):
+            return np.zeros(len(new), dtype=np.bool_)
+        # allow for rounding, start times are on a grid of samples
+        step = (1 - self.overlap) * self.ppsd_length - 0.5 * self.delta
+        index = np.searchsorted(used, new)
+        left = new - used[np.clip(index - 1, 0, len(used) - 1)]
+        right = used[np.clip(index, 0, len(used) - 1)] - new
+        return (np.abs(left) < step) | (np.abs(right) < step)
 
     def get_percentile(self, percentile=50, hist_cum=None):
         """
@@ -792,6 +1264,183 @@ class PPSD():
 
         return ppsd
 
+    def save_npz(self, filename, append=False, compress=False):
+        """
+        Saves the binned spectra and times of all segments of the PPSD in a
+        NumPy ``.npz`` file.
+
+        The file holds the setup of the PPSD (id, sampling rate, segment
+        length, binning, ...) and chunks of columnar arrays with the start
+        times and binned spectra of the used segments and the time spans of
+        available data and gaps. Times are stored as integer nanoseconds.
+        Response information is not stored.
+
+        The file can be restored using
+        :meth:`~obspy.signal.spectral_estimation.PPSD.load_npz`, which
+        computes the histogram from the stored spectra, optionally only for a
+        part of the time range.
+
+        :type filename: str
+        :param filename: Name of output file.
+        :type append: bool (optional)
+        :param append: If the file exists, adds all segments not yet stored
+                in it as a new chunk instead of overwriting it. The existing
+                data is not rewritten, so e.g. a daily job can extend a file
+                with the data of one day. The setup of the PPSD stored in the
+                file must be the same. Segments starting closer than the
+                segment step to a stored one are skipped with a warning.
+        :type compress: bool (optional)
+        :param compress: Enable/disable compression of new chunks.
+        """
+        self.__check_ppsd_length()
+        if self._binned_psds is None:
+            msg = "PPSD was created with an older version of ObsPy and " + \
+                  "does not contain the spectra of its segments."
+            raise ValueError(msg)
+        if compress:
+            compression = zipfile.ZIP_DEFLATED
+        else:
+            compression = zipfile.ZIP_STORED
+        chunk = self.__get_npz_chunk()
+        if not append or not os.path.exists(filename):
+            with zipfile.ZipFile(filename, 'w', compression) as zf:
+                _writeNpy(zf, 'format_version',
+                          np.array(NPZ_FORMAT_VERSION))
+                for key in NPZ_SETUP_KEYS:
+                    _writeNpy(zf, key, np.array(getattr(self, key)))
+                for key in NPZ_CHUNK_KEYS:
+                    _writeNpy(zf, "%s_%05i" % (key, 0), chunk[key])
+            return
+        setup, chunks = _readNpz(filename)
+        for key in NPZ_SETUP_KEYS:
+            if not np.array_equal(setup[key], getattr(self, key)):
+                msg = "Can not append to %s, %s differs" % (filename, key)
+                raise TypeError(msg)
+        # only store what is not in the file yet
+        stored = dict((key, np.concatenate([c[key] for c in chunks]))
+                      for key in NPZ_CHUNK_KEYS)
+        new = ~np.in1d(chunk['times_used'], stored['times_used'])
+        # segments overlapping stored ones would be counted twice on loading
+        stored_times = np.sort(stored['times_used']) / 1e9
+        conflicts = self.__time_conflicts(stored_times,
+                                          chunk['times_used'] / 1e9) & new
+        if conflicts.any():
+            index = np.nonzero(conflicts)[0][0]
+            self.__warn_time_present(self.times_used[index])
+            new &= ~conflicts
+        chunk['times_used'] = chunk['times_used'][new]
+        chunk['binned_psds'] = chunk['binned_psds'][new]
+        for key in ('times_data', 'times_gaps'):
+            known = set(map(tuple, stored[key].tolist()))
+            new = [span not in known for span in map(tuple,
+                                                     chunk[key].tolist())]
+            chunk[key] = chunk[key][np.array(new, dtype=np.bool_)]
+        if not any(len(chunk[key]) for key in NPZ_CHUNK_KEYS):
+            return
+        with zipfile.ZipFile(filename, 'a', compression) as zf:
+            for key in NPZ_CHUNK_KEYS:
+                _writeNpy(zf, "%s_%05i" % (key, len(chunks)), chunk[key])
+
+    def __get_npz_chunk(self):
+        """
+        Returns the per segment and time span information of the PPSD as
+        arrays as stored by
+        :meth:`~obspy.signal.spectral_estimation.PPSD.save_npz`.
+        """
+        num_per = len(self.per_octaves)
+
+        def _spans(spans):
+            if not spans:
+                return np.empty((0, 2), dtype=np.int64)
+            ns = UTCDateTimeArray([t for span in spans for t in span]).ns
+            return ns.reshape((-1, 2))
+
+        if self.times_used:
+            binned_psds = np.array(self._binned_psds, dtype=np.float64)
+        else:
+            binned_psds = np.empty((0, num_per), dtype=np.float64)
+        return {'times_used': UTCDateTimeArray(self.times_used).ns,
+                'binned_psds': binned_psds.reshape((-1, num_per)),
+                'times_data': _spans(self.times_data),
+                'times_gaps': _spans(self.times_gaps)}
+
+    @staticmethod
+    def load_npz(filename, paz=None, parser=None, starttime=None,
+                 endtime=None):
+        """
+        Restores a PPSD instance from a file written by
+        :meth:`~obspy.signal.spectral_estimation.PPSD.save_npz`.
+
+        The histogram is computed from the stored binned spectra, so it can
+        be restricted to any part of the stored time range without
+        processing the data again.
+
+        :type filename: str
+        :param filename: Name of file written by ``save_npz()``.
+        :type paz: dict (optional)
+        :param paz: Response information used when adding more data, see
+                :class:`~obspy.signal.spectral_estimation.PPSD`.
+        :type parser: :class:`obspy.xseed.parser.Parser` (optional)
+        :param parser: Parser instance with response information used when
+                adding more data.
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+                (optional)
+        :param starttime: Only use segments starting at or after this time.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+                (optional)
+        :param endtime: Only use segments ending at or before this time.
+        """
+        setup, chunks = _readNpz(filename)
+        network, station, location, channel = setup['id'].item().split(".")
+        stats = Stats({'network': network, 'station': station,
+                       'location': location, 'channel': channel,
+                       'sampling_rate': float(setup['sampling_rate'])})
+        spec_bins = setup['spec_bins']
+        db_bins = (spec_bins[0], spec_bins[-1], spec_bins[1] - spec_bins[0])
+        ppsd = PPSD(stats, paz=paz, parser=parser,
+                    skip_on_gaps=int(setup['merge_method']) == -1,
+                    is_rotational_data=bool(setup['is_rotational_data']),
+                    db_bins=db_bins,
+                    ppsd_length=float(setup['ppsd_length']),
+                    overlap=float(setup['overlap']))
+        ppsd.spec_bins = spec_bins
+        if not np.array_equal(ppsd.period_bins, setup['period_bins']):
+            msg = "Period bins stored in %s do not match" % filename
+            raise ValueError(msg)
+        data = dict((key, np.concatenate([c[key] for c in chunks]))
+                    for key in NPZ_CHUNK_KEYS)
+        # select the requested time range
+        times = data['times_used']
+        spans = dict((key, data[key]) for key in ('times_data', 'times_gaps'))
+        keep = np.ones(len(times), dtype=np.bool_)
+        if starttime is not None:
+            start = UTCDateTimeArray([starttime]).ns[0]
+            keep &= times >= start
+            for key, value in spans.items():
+                value = value[value[:, 1] >= start]
+                spans[key] = np.maximum(value, start)
+        if endtime is not None:
+            end = UTCDateTimeArray([endtime]).ns[0]
+            keep &= times + int(round(ppsd.ppsd_length * 1e9)) <= end
+            for key, value in spans.items():
+                value = value[value[:, 0] <= end]
+                spans[key] = np.minimum(value, end)
+        order = np.argsort(times[keep], kind="mergesort")
+        times = times[keep][order]
+        binned_psds = data['binned_psds'][keep][order]
+        ppsd.times_used[:] = \
+            UTCDateTimeArray.fromNanoseconds(times).toUTCDateTimes()
+        ppsd._binned_psds = list(binned_psds)
+        if len(binned_psds):
+            ppsd.__add_to_histogram(binned_psds)
+        for key, value in spans.items():
+            value = value[np.lexsort((value[:, 1], value[:, 0]))]
+            utc = UTCDateTimeArray.fromNanoseconds(value.ravel())
+            utc = utc.toUTCDateTimes()
+            setattr(ppsd, key, [[utc[i], utc[i + 1]]
+                                for i in range(0, len(utc), 2)])
+        return ppsd
+
     def plot(self, filename=None, show_coverage=True, show_histogram=True,
              show_percentiles=False, percentiles=[0, 25, 50, 75, 100],
              show_noise_models=True, grid=True, show=True,
@@ -4,10 +4,12 @@ The cross correlation test suite.
 """
 from __future__ import unicode_literals
 
+import numpy as np
 import os
 import unittest
 from obspy import read, UTCDateTime
-from obspy.signal.cross_correlation import xcorrPickCorrection
+from obspy.signal.cross_correlation import xcorrPickCorrection, \
+    xcorrTemplates
 
 
 class CrossCorrelationTestCase(unittest.TestCase):
@@ -45,6 +47,73 @@ class CrossCorrelationTestCase(unittest.TestCase):
         self.assertAlmostEqual(dt, -0.013025086360067755)
         self.assertAlmostEqual(coeff, 0.98279277273758803)
 
+    def test_xcorrTemplates(self):
+        """
+        Test FFT template matching against correlation coefficients computed
+        lag by lag in the time domain.
+        """
+        np.random.seed(815)
+        data = np.random.randn(3, 2000) * 1000 + 5e4
+        # a gap filled with a constant value
+        data[1, 1000:1300] = 5e4
+        templates = np.random.randn(4, 3, 50)
+        offsets = np.random.randint(0, 30, (4, 3))
+        offsets[0] = [0, 10, 20]
+        for channel in range(3):
+            start = 500 + offsets[0, channel]
+            templates[0, channel] = data[channel, start:start + 50]
+        # reference
+        npts = 2000 - 50 + 1 - offsets.max()
+        expected = np.zeros((4, npts))
+        for i, template in enumerate(templates):
+            for channel in range(3):
+                for j in range(npts):
+                    start = j + offsets[i, channel]
+                    window = data[channel, start:start + 50]
+                    if window.std() == 0:
+                        continue
+                    expected[i, j] += np.corrcoef(template[channel],
+                                                  window)[0, 1]
+        for nfft in (None, 128):
+            cc_sum = xcorrTemplates(data, templates, offsets, nfft=nfft)
+            np.testing.assert_allclose(cc_sum, expected, rtol=0, atol=1e-10)
+        self.assertEqual(cc_sum[0].argmax(), 500)
+        self.assertAlmostEqual(cc_sum[0].max(), 3.0)
+        # single channel without offsets
+        cc_sum = xcorrTemplates(data[0], templates[:, 0])
+        self.assertEqual(cc_sum.shape, (4, 1951))
+        # parts in a pool of workers give the same result
+        cc_sum = xcorrTemplates(data, templates, offsets, nfft=128)
+        cc_sum_parallel = xcorrTemplates(data, templates, offsets, nfft=128,
+                                         parallel="thread", workers=3)
+        np.testing.assert_array_equal(cc_sum, cc_sum_parallel)
+        # wrong number of channels and negative offsets
+        self.assertRaises(ValueError, xcorrTemplates, data[:2], templates)
+        self.assertRaises(ValueError, xcorrTemplates, data, templates,
+                          -offsets)
+
+    def test_xcorrTemplatesDynamicRange(self):
+        """
+        Low amplitude windows next to a much larger event in the same FFT
+        block are normalized correctly.
+        """
+        np.random.seed(42)
+        data = np.random.randn(4000)
+        data[3300:3600] += 3e5 * np.random.randn(300)
+        # zero filled gap right after the event
+        data[3600:3700] = 0.0
+        template = data[3000:3100]
+        cc = xcorrTemplates(data, template[np.newaxis], nfft=1024)[0]
+        self.assertEqual(cc.argmax(), 3000)
+        self.assertAlmostEqual(cc[3000], 1.0, places=9)
+        for j in (2500, 2990, 3150, 3650, 3750):
+            window = data[j:j + 100]
+            if window.std() == 0:
+                self.assertEqual(cc[j], 0.0)
+            else:
+                self.assertAlmostEqual(
+                    cc[j], np.corrcoef(template, window)[0, 1], places=9)
+
 
 def suite():
     return unittest.makeSuite(CrossCorrelationTestCase, 'test')
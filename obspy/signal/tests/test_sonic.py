@@ -9,7 +9,8 @@ from future.builtins import range
 from obspy import Trace, Stream, UTCDateTime
 from obspy.core.util import AttribDict
 from obspy.signal.array_analysis import array_transff_freqslowness, \
-    array_processing, array_transff_wavenumber, get_spoint
+    array_processing, array_transff_wavenumber, get_spoint, get_timeshift, \
+    _steering_vectors
 from obspy.signal.util import utlLonLat
 import numpy as np
 import unittest
@@ -21,7 +22,7 @@ class SonicTestCase(unittest.TestCase):
     Test fk analysis, main function is sonic() in array_analysis.py
     """
 
-    def arrayProcessing(self, prewhiten, method):
+    def arrayProcessing(self, prewhiten, method, **kwargs):
         np.random.seed(2348)
 
         geometry = np.array([[0.0, 0.0, 0.0],
@@ -88,7 +89,7 @@ class SonicTestCase(unittest.TestCase):
         args = (st, win_len, step_frac, sll_x, slm_x, sll_y, slm_y, sl_s,
                 semb_thres, vel_thres, frqlow, frqhigh, stime, etime)
         kwargs = dict(prewhiten=prewhiten, coordsys='xy', verbose=False,
-                      method=method)
+                      method=method, **kwargs)
         out = array_processing(*args, **kwargs)
         if False:  # 1 for debugging
             print('\n', out[:, 1:])
@@ -148,6 +149,49 @@ class SonicTestCase(unittest.TestCase):
         # XXX relative tolerance should be lower!
         self.assertTrue(np.allclose(ref, out[:, 1:], rtol=4e-5))
 
+    def test_arrayProcessingParallel(self):
+        """
+        Processing the windows in a pool of workers gives the same results
+        and the same calls to the store function.
+        """
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(2)
+        self.addCleanup(pool.join)
+        self.addCleanup(pool.close)
+        for method in (0, 1):
+            maps, maps_pool = [], []
+            out = self.arrayProcessing(
+                prewhiten=0, method=method,
+                store=lambda r, a, i: maps.append((r.copy(), a.copy(), i)))
+            for parallel in ("thread", True, pool):
+                del maps_pool[:]
+                out_pool = self.arrayProcessing(
+                    prewhiten=0, method=method, parallel=parallel, workers=2,
+                    store=lambda r, a, i: maps_pool.append(
+                        (r.copy(), a.copy(), i)))
+                np.testing.assert_array_equal(out, out_pool)
+                self.assertEqual(len(maps), len(maps_pool))
+                for (r1, a1, i1), (r2, a2, i2) in zip(maps, maps_pool):
+                    self.assertEqual(i1, i2)
+                    np.testing.assert_array_equal(r1, r2)
+                    np.testing.assert_array_equal(a1, a2)
+            self.assertEqual([i for _, _, i in maps], [0, 40, 80, 120, 160,
+                                                       200])
+
+    def test_steeringVectorCache(self):
+        """
+        Worker processes compute the steering vectors only once.
+        """
+        geometry = np.array([[0.0, 0.0, 0.0], [0.1, 0.0, 0.0],
+                             [0.0, 0.1, 0.0]])
+        table = get_timeshift(geometry, -1.0, -1.0, 0.1, 21, 21)
+        steer = _steering_vectors(10, 3, 0.5, table)
+        self.assertEqual(steer.shape, (10, 21, 21, 3))
+        self.assertTrue(_steering_vectors(10, 3, 0.5, table.copy()) is steer)
+        other = _steering_vectors(10, 4, 0.5, table)
+        self.assertFalse(other is steer)
+        np.testing.assert_array_equal(other[:-1], steer[1:])
+
     def test_getSpoint(self):
         stime = UTCDateTime(1970, 1, 1, 0, 0)
         etime = UTCDateTime(1970, 1, 1, 0, 0) + 10
@@ -235,6 +279,36 @@ class SonicTestCase(unittest.TestCase):
         np.testing.assert_array_almost_equal(transff, transffth, decimal=6)
         np.testing.assert_array_almost_equal(transffll, transffth, decimal=6)
 
+    def test_array_transff_limits(self):
+        """
+        Transfer functions on asymmetric grids, compared to the sums over
+        stations evaluated directly for each grid point.
+        """
+        coords = np.array([[10., 60., 0.],
+                           [200., 50., 0.],
+                           [-120., 170., 0.],
+                           [-100., -150., 0.],
+                           [30., -220., 0.]]) / 1000.
+        kx = np.arange(-30., 50.5, 5.)
+        ky = np.arange(-20., 10.5, 5.)
+        phase = (coords[:, 0, np.newaxis, np.newaxis] * kx[:, np.newaxis] +
+                 coords[:, 1, np.newaxis, np.newaxis] * ky)
+        transffth = np.abs(np.exp(1j * phase).sum(axis=0)) ** 2
+        transffth /= transffth.max()
+        transff = array_transff_wavenumber(coords, (-30., 50., -20., 10.),
+                                           5., coordsys='xy')
+        np.testing.assert_array_almost_equal(transff, transffth, decimal=10)
+
+        freqs = np.arange(1., 10.5, 0.5)
+        transffth = np.abs(np.exp(
+            2j * np.pi * freqs[:, np.newaxis, np.newaxis, np.newaxis] *
+            phase / 10.).sum(axis=1)) ** 2
+        transffth = np.trapz(transffth, dx=0.5, axis=0)
+        transffth /= transffth.max()
+        transff = array_transff_freqslowness(
+            coords, (-3., 5., -2., 1.), 0.5, 1., 10., 0.5, coordsys='xy')
+        np.testing.assert_array_almost_equal(transff, transffth, decimal=10)
+
 
 def suite():
     return unittest.makeSuite(SonicTestCase, 'test')
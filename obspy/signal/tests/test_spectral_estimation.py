@@ -9,7 +9,7 @@ from future.builtins import zip
 from obspy import Trace, Stream, UTCDateTime
 from obspy.core.util.base import NamedTemporaryFile
 from obspy.signal.spectral_estimation import PPSD, psd, welch_window, \
-    welch_taper
+    welch_taper, fft_taper, _psd_batch
 import numpy as np
 import os
 import gzip
@@ -82,21 +82,12 @@ class PsdTestCase(unittest.TestCase):
             window_obspy = welch_window(N)
             np.testing.assert_array_almost_equal(window_pitsa, window_obspy)
 
-    def test_PPSD(self):
+    def _get_ppsd_test_data(self):
         """
-        Test PPSD routine with some real data. Data was downsampled to 100Hz
-        so the ppsd is a bit distorted which does not matter for the purpose
-        of testing.
+        Returns trace and poles and zeros of the PPSD test data.
         """
-        # load test file
         file_data = os.path.join(
             self.path, 'BW.KW1._.EHZ.D.2011.090_downsampled.asc.gz')
-        file_histogram = os.path.join(
-            self.path,
-            'BW.KW1._.EHZ.D.2011.090_downsampled__ppsd_hist_stack.npy')
-        file_binning = os.path.join(
-            self.path, 'BW.KW1._.EHZ.D.2011.090_downsampled__ppsd_mixed.npz')
-        # parameters for the test
         # no with due to py 2.6
         f = gzip.open(file_data)
         data = np.loadtxt(f)
@@ -115,13 +106,28 @@ class PsdTestCase(unittest.TestCase):
                  'starttime': UTCDateTime(2011, 3, 31, 0, 0, 0, 180000),
                  'station': 'KW1'}
         tr = Trace(data, stats)
-        st = Stream([tr])
         paz = {'gain': 60077000.0,
                'poles': [(-0.037004 + 0.037016j), (-0.037004 - 0.037016j),
                          (-251.33 + 0j), (-131.04 - 467.29j),
                          (-131.04 + 467.29j)],
                'sensitivity': 2516778400.0,
                'zeros': [0j, 0j]}
+        return tr, paz
+
+    def test_PPSD(self):
+        """
+        Test PPSD routine with some real data. Data was downsampled to 100Hz
+        so the ppsd is a bit distorted which does not matter for the purpose
+        of testing.
+        """
+        # load test file
+        file_histogram = os.path.join(
+            self.path,
+            'BW.KW1._.EHZ.D.2011.090_downsampled__ppsd_hist_stack.npy')
+        file_binning = os.path.join(
+            self.path, 'BW.KW1._.EHZ.D.2011.090_downsampled__ppsd_mixed.npz')
+        tr, paz = self._get_ppsd_test_data()
+        st = Stream([tr])
         ppsd = PPSD(tr.stats, paz, db_bins=(-200, -50, 0.5))
         ppsd.add(st)
         # read results and compare
@@ -167,6 +173,174 @@ class PsdTestCase(unittest.TestCase):
             np.testing.assert_array_equal(ppsd_loaded.period_bins,
                                           binning['period_bins'])
 
+    def test_PPSD_parallel_and_merge(self):
+        """
+        Processing the segments in a pool of workers and merging PPSDs of
+        parts of the data must give the same histogram as the serial run.
+        """
+        file_histogram = os.path.join(
+            self.path,
+            'BW.KW1._.EHZ.D.2011.090_downsampled__ppsd_hist_stack.npy')
+        result_hist = np.load(file_histogram)
+        tr, paz = self._get_ppsd_test_data()
+        t0 = tr.stats.starttime
+        # parallel processing, duplicate traces get merged beforehand
+        ppsd = PPSD(tr.stats, paz, db_bins=(-200, -50, 0.5))
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always', UserWarning)
+            self.assertTrue(ppsd.add(Stream([tr, tr.copy()]),
+                                     parallel="thread", workers=2))
+        self.assertEqual(len(w), 0)
+        self.assertEqual(ppsd.times, [t0 + 1800 * i for i in range(4)])
+        np.testing.assert_array_equal(ppsd.hist_stack, result_hist)
+        # already covered segments are skipped
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always', UserWarning)
+            self.assertFalse(ppsd.add(tr, parallel="thread", workers=2))
+        self.assertEqual(len(w), 4)
+        np.testing.assert_array_equal(ppsd.hist_stack, result_hist)
+        # PPSDs of overlapping parts of the data, in any order
+        ppsd1 = PPSD(tr.stats, paz, db_bins=(-200, -50, 0.5))
+        ppsd1.add(tr.slice(t0, t0 + 5400))
+        ppsd2 = PPSD(tr.stats, paz, db_bins=(-200, -50, 0.5))
+        ppsd2.add(tr.slice(t0 + 3600))
+        self.assertEqual(len(ppsd1.times), 2)
+        self.assertEqual(len(ppsd2.times), 2)
+        for merged in (ppsd1 + ppsd2, ppsd2 + ppsd1):
+            np.testing.assert_array_equal(merged.hist_stack, result_hist)
+            self.assertEqual(merged.times, ppsd.times)
+            self.assertTrue(merged.times is merged.times_used)
+            self.assertEqual(merged.times_data,
+                             sorted(ppsd1.times_data + ppsd2.times_data))
+        # operands are not changed
+        self.assertEqual(len(ppsd1.times), 2)
+        self.assertEqual(len(ppsd2.times), 2)
+        # merging in place and into an empty PPSD
+        empty = PPSD(tr.stats, paz, db_bins=(-200, -50, 0.5))
+        empty += ppsd1
+        empty.merge(ppsd2)
+        np.testing.assert_array_equal(empty.hist_stack, result_hist)
+        self.assertEqual(empty.times, ppsd.times)
+        # same time spans or incompatible setup
+        self.assertRaises(ValueError, ppsd.merge, ppsd1)
+        other = PPSD(tr.stats, paz, db_bins=(-200, -50, 1.0))
+        self.assertRaises(TypeError, other.merge, ppsd1)
+        other = PPSD(tr.stats, paz, db_bins=(-200, -50, 0.5), overlap=0.25)
+        self.assertRaises(TypeError, other.merge, ppsd1)
+        self.assertRaises(TypeError, ppsd1.__add__, tr)
+
+    def test_PPSD_batch(self):
+        """
+        Processing the segments in batches must give the same spectra as the
+        serial processing, except for rounding.
+        """
+        from matplotlib.mlab import detrend_linear
+        file_histogram = os.path.join(
+            self.path,
+            'BW.KW1._.EHZ.D.2011.090_downsampled__ppsd_hist_stack.npy')
+        result_hist = np.load(file_histogram)
+        tr, paz = self._get_ppsd_test_data()
+        ppsd = PPSD(tr.stats, paz, db_bins=(-200, -50, 0.5))
+        # psd of all rows at once
+        data = np.random.RandomState(815).randn(3, ppsd.len)
+        spec = _psd_batch(data, ppsd.nfft, ppsd.sampling_rate, ppsd.nlap)
+        for row, expected in zip(data, spec):
+            got, _ = psd(row, ppsd.nfft, ppsd.sampling_rate,
+                         detrend=detrend_linear, window=fft_taper,
+                         noverlap=ppsd.nlap)
+            np.testing.assert_allclose(got, expected, rtol=1e-10)
+        # binned spectra of single segments
+        t0 = tr.stats.starttime
+        segments = [tr.slice(t0 + 1800 * i, t0 + 1800 * i + 3600)
+                    for i in range(3)]
+        segments.append(segments[0].slice(t0, t0 + 1800))
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('ignore', UserWarning)
+            spectra = ppsd._process_segments(segments)
+        self.assertEqual(spectra[-1], None)
+        for segment, spec_octaves in zip(segments, spectra[:-1]):
+            expected = ppsd._process_segment(segment.copy())
+            np.testing.assert_allclose(spec_octaves, expected, rtol=1e-10)
+        # whole histogram, also together with parallel processing
+        for kwargs in ({}, {'parallel': 'thread', 'workers': 2}):
+            ppsd = PPSD(tr.stats, paz, db_bins=(-200, -50, 0.5))
+            self.assertTrue(ppsd.add(tr, batch=True, **kwargs))
+            self.assertEqual(ppsd.times, [t0 + 1800 * i for i in range(4)])
+            self.assertEqual(ppsd.hist_stack.sum(), result_hist.sum())
+            self.assertTrue(np.abs(ppsd.hist_stack - result_hist).sum() <= 4)
+
+    def test_PPSD_npz(self):
+        """
+        Saving, appending to and loading (parts of) PPSD npz files.
+        """
+        tr, paz = self._get_ppsd_test_data()
+        t0 = tr.stats.starttime
+        ppsd = PPSD(tr.stats, paz, db_bins=(-200, -50, 0.5))
+        ppsd.add(tr)
+        ppsd1 = PPSD(tr.stats, paz, db_bins=(-200, -50, 0.5))
+        ppsd1.add(tr.slice(t0, t0 + 5400))
+        ppsd2 = PPSD(tr.stats, paz, db_bins=(-200, -50, 0.5))
+        ppsd2.add(tr.slice(t0 + 3600))
+        with NamedTemporaryFile(suffix='.npz') as tf:
+            filename = tf.name
+            for compress in (False, True):
+                ppsd.save_npz(filename, compress=compress)
+                loaded = PPSD.load_npz(filename)
+                np.testing.assert_array_equal(loaded.hist_stack,
+                                              ppsd.hist_stack)
+                np.testing.assert_array_equal(loaded.spec_bins,
+                                              ppsd.spec_bins)
+                self.assertEqual(loaded.id, ppsd.id)
+                self.assertEqual(loaded.times, ppsd.times)
+                self.assertTrue(loaded.times is loaded.times_used)
+                self.assertEqual(loaded.times_data, ppsd.times_data)
+                self.assertEqual(loaded.times_gaps, ppsd.times_gaps)
+            # appending only writes new segments as a new chunk
+            ppsd1.save_npz(filename)
+            ppsd2.save_npz(filename, append=True)
+            size = os.path.getsize(filename)
+            ppsd2.save_npz(filename, append=True)
+            self.assertEqual(os.path.getsize(filename), size)
+            with np.load(filename) as npz:
+                self.assertEqual(len(npz['times_used_00000']), 2)
+                self.assertEqual(len(npz['times_used_00001']), 2)
+            loaded = PPSD.load_npz(filename, paz=paz)
+            np.testing.assert_array_equal(loaded.hist_stack, ppsd.hist_stack)
+            self.assertEqual(loaded.times, ppsd.times)
+            self.assertEqual(loaded.paz, paz)
+            # only a part of the time range, without processing again
+            loaded = PPSD.load_npz(filename, starttime=t0 + 3600)
+            np.testing.assert_array_equal(loaded.hist_stack,
+                                          ppsd2.hist_stack)
+            self.assertEqual(loaded.times, ppsd2.times)
+            # time spans of data get cut at the start of the time range
+            self.assertEqual(loaded.times_data,
+                             [[t0 + 3600, t0 + 5400],
+                              [t0 + 3600, tr.stats.endtime]])
+            loaded = PPSD.load_npz(filename, paz=paz, endtime=t0 + 5400)
+            np.testing.assert_array_equal(loaded.hist_stack,
+                                          ppsd1.hist_stack)
+            self.assertEqual(loaded.times, ppsd1.times)
+            # loaded PPSDs can get more data
+            self.assertTrue(loaded.add(tr.slice(t0 + 3600)))
+            np.testing.assert_array_equal(loaded.hist_stack, ppsd.hist_stack)
+            # segments overlapping stored ones are skipped with a warning
+            ppsd3 = PPSD(tr.stats, paz, db_bins=(-200, -50, 0.5))
+            ppsd3.add(tr.slice(t0 + 900))
+            self.assertTrue(len(ppsd3.times))
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter('always', UserWarning)
+                ppsd3.save_npz(filename, append=True)
+            self.assertEqual(len(w), 1)
+            self.assertTrue('Already covered' in str(w[0].message))
+            loaded = PPSD.load_npz(filename)
+            np.testing.assert_array_equal(loaded.hist_stack, ppsd.hist_stack)
+            self.assertEqual(loaded.times, ppsd.times)
+            # setup of file and PPSD must match
+            other = PPSD(tr.stats, paz, db_bins=(-200, -50, 1.0))
+            self.assertRaises(TypeError, other.save_npz, filename,
+                              append=True)
+
 
 def suite():
     return unittest.makeSuite(PsdTestCase, 'test')
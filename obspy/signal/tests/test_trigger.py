@@ -5,9 +5,11 @@ The obspy.signal.trigger test suite.
 from __future__ import unicode_literals
 from future.builtins import zip
 from ctypes import ArgumentError
-from obspy import read, Stream, UTCDateTime
+from obspy import read, Stream, Trace, UTCDateTime
 from obspy.signal import recSTALTA, recSTALTAPy, triggerOnset, pkBaer, \
     coincidenceTrigger, arPick, classicSTALTA, classicSTALTAPy
+from obspy.signal.trigger import carlSTATrig, delayedSTALTA, RecSTALTA, \
+    ClassicSTALTA, DelayedSTALTA, CarlSTATrig, TriggerOnset
 from obspy.signal.util import clibsignal
 import gzip
 import numpy as np
@@ -409,6 +411,60 @@ class TriggerTestCase(unittest.TestCase):
                             'BW.UH4..EHZ']}]
         self.assertTrue(trig == remaining_results)
 
+    def test_coincidenceTriggerRetriggering(self):
+        """
+        Test network coincidence trigger with a station triggering again
+        during an overlap and a station triggering alone.
+        """
+        st = Stream()
+        for sta, ranges in (("A", [(10, 20), (22, 40)]), ("B", [(15, 25)]),
+                            ("C", [(30, 35), (60, 65)])):
+            data = np.zeros(100)
+            for start, end in ranges:
+                data[start:end] = 2.0
+            st.append(Trace(data=data, header={
+                'network': 'XX', 'station': sta, 'channel': 'Z'}))
+        res = coincidenceTrigger(None, 1.5, 0.5, st, 2)
+        self.assertEqual(len(res), 2)
+        self.assertEqual(res[0]['time'], UTCDateTime(10))
+        self.assertEqual(res[0]['duration'], 14.0)
+        self.assertEqual(res[0]['stations'], ['A', 'B'])
+        self.assertEqual(res[0]['coincidence_sum'], 2.0)
+        # the retriggering of A is part of the next coincidence trigger
+        self.assertEqual(res[1]['time'], UTCDateTime(15))
+        self.assertEqual(res[1]['duration'], 24.0)
+        self.assertEqual(res[1]['stations'], ['B', 'A', 'C'])
+        self.assertEqual(res[1]['coincidence_sum'], 3.0)
+        # extending the overlap merges the first triggers of all stations
+        res = coincidenceTrigger(None, 1.5, 0.5, st, 2,
+                                 trigger_off_extension=6)
+        self.assertEqual(len(res), 2)
+        self.assertEqual(res[0]['stations'], ['A', 'B', 'C'])
+        self.assertEqual(res[0]['duration'], 24.0)
+        self.assertEqual(res[1]['stations'], ['B', 'A', 'C'])
+
+    def test_coincidenceTriggerParallel(self):
+        """
+        Test that network coincidence triggering in a pool of workers gives
+        the same result.
+        """
+        st = Stream()
+        files = ["BW.UH1._.SHZ.D.2010.147.cut.slist.gz",
+                 "BW.UH2._.SHZ.D.2010.147.cut.slist.gz",
+                 "BW.UH3._.SHZ.D.2010.147.cut.slist.gz",
+                 "BW.UH4._.EHZ.D.2010.147.cut.slist.gz"]
+        for filename in files:
+            filename = os.path.join(self.path, filename)
+            st += read(filename)
+        st.filter('bandpass', freqmin=10, freqmax=20)
+        kwargs = dict(sta=0.5, lta=10, details=True)
+        res = coincidenceTrigger("recstalta", 3.5, 1, st, 3, **kwargs)
+        self.assertEqual(len(res), 3)
+        res_parallel = coincidenceTrigger("recstalta", 3.5, 1, st, 3,
+                                          parallel="thread", workers=2,
+                                          **kwargs)
+        self.assertEqual(res, res_parallel)
+
     def test_classicSTALTAPyC(self):
         """
         Test case for ctypes version of recSTALTA
@@ -420,6 +476,54 @@ class TriggerTestCase(unittest.TestCase):
         ref = np.array([0.38012302, 0.37704431, 0.47674533, 0.67992292])
         self.assertTrue(np.allclose(ref, c2[99:103]))
 
+    def test_streamingSTALTA(self):
+        """
+        Test that stateful STA/LTAs fed with chunks of data give the same
+        characteristic functions as the functions on the whole data.
+        """
+        nsta, nlta = 50, 500
+        data = self.data[:20000]
+        # irregular chunks including an empty one and ones shorter than nlta
+        chunks = np.split(data, [7, 7, 300, 2048, 2100, 12000, 19999])
+        for trig, cft in (
+                (RecSTALTA(nsta, nlta), recSTALTA(data, nsta, nlta)),
+                (ClassicSTALTA(nsta, nlta), classicSTALTA(data, nsta, nlta)),
+                (CarlSTATrig(nsta, nlta, 0.8, 0.8),
+                 carlSTATrig(data, nsta, nlta, 0.8, 0.8)),
+                # delayedSTALTA wraps around to the end of the array
+                (DelayedSTALTA(nsta, nlta), delayedSTALTA(
+                    np.concatenate((data, np.zeros(nsta + nlta + 1))), nsta,
+                    nlta)[:len(data)])):
+            got = np.concatenate([trig.process(chunk) for chunk in chunks])
+            np.testing.assert_array_equal(got, cft)
+            # reset starts over with a new signal
+            trig.reset()
+            np.testing.assert_array_equal(trig.process(data), cft)
+
+    def test_streamingTriggerOnset(self):
+        """
+        Test that the stateful trigger onset fed with chunks of a
+        characteristic function gives the same picks as triggerOnset.
+        """
+        data = self.data[:20000].copy()
+        data[5000:5200] *= 10
+        data[12000:15000] *= 5
+        cft = recSTALTA(data, 10, 200)
+        chunks = np.split(cft, np.arange(0, len(cft), 333))
+        for kwargs in ({}, {'max_len': 100}, {'max_len_delete': True},
+                       {'max_len': 100, 'max_len_delete': True}):
+            picks = triggerOnset(cft, 2.5, 1.2, **kwargs)
+            self.assertTrue(len(picks) > 3)
+            onset = TriggerOnset(2.5, 1.2, **kwargs)
+            got = []
+            for chunk in chunks:
+                got.extend(onset.process(chunk))
+            got.extend(onset.finish())
+            np.testing.assert_array_equal(got, picks)
+            # finish resets the instance
+            got = onset.process(cft) + onset.finish()
+            np.testing.assert_array_equal(got, picks)
+
 
 def suite():
     return unittest.makeSuite(TriggerTestCase, 'test')
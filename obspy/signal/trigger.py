@@ -33,7 +33,9 @@ import warnings
 import ctypes as C
 from collections import deque
 import numpy as np
-from obspy import UTCDateTime
+from scipy.signal import lfilter
+from obspy import UTCDateTime, Stream
+from obspy.core.util.misc import worker_pool
 from obspy.signal.headers import clibsignal, head_stalta_t
 from obspy.signal.cross_correlation import templatesMaxSimilarity
 
@@ -348,7 +350,7 @@ def triggerOnset(charfct, thres1, thres2, max_len=9e99, max_len_delete=False):
     #
     on = deque([ind1[0]])
     of = deque([-1])
-    of.extend(ind2[np.diff(ind2) > 1].tolist())
+    of.extend(ind2[:-1][np.diff(ind2) > 1].tolist())
     on.extend(ind1[np.where(np.diff(ind1) > 1)[0] + 1].tolist())
     # include last pick if trigger is on or drop it
     if max_len_delete:
@@ -374,6 +376,474 @@ def triggerOnset(charfct, thres1, thres2, max_len=9e99, max_len_delete=False):
     return np.array(pick)
 
 
+class RecSTALTA(object):
+    """
+    Recursive STA/LTA for consecutive chunks of a continuous signal.
+
+    The STA and LTA accumulators are kept between calls of :meth:`process`,
+    so that feeding a signal chunk by chunk results in exactly the same
+    characteristic function as a single call of
+    :func:`~obspy.signal.trigger.recSTALTA` on the whole signal (for signals
+    longer than ``nlta`` samples).
+
+    :type nsta: Int
+    :param nsta: Length of short time average window in samples
+    :type nlta: Int
+    :param nlta: Length of long time average window in samples
+
+    .. rubric:: Example
+
+    >>> np.random.seed(815)
+    >>> data = np.random.randn(1000)
+    >>> trig = RecSTALTA(5, 10)
+    >>> cft = np.concatenate([trig.process(data[:333]),
+    ...                       trig.process(data[333:])])
+    >>> np.array_equal(cft, recSTALTA(data, 5, 10))
+    True
+    """
+    def __init__(self, nsta, nlta):
+        self.nsta = nsta
+        self.nlta = nlta
+        self.reset()
+
+    def reset(self):
+        """
+        Forget all previous chunks, i.e. start with a new signal.
+        """
+        self._count = 0
+        self._sta = 0.0
+        self._lta = 0.0
+
+    def process(self, a):
+        """
+        Compute the characteristic function for the next chunk of data.
+
+        :type a: NumPy ndarray
+        :param a: Next chunk of the seismic trace
+        :rtype: NumPy ndarray dtype float64
+        :return: Characteristic function for the samples in ``a``
+        """
+        sq = np.require(a, 'float64') ** 2
+        charfct = np.zeros(len(sq), dtype='float64')
+        # like the C version, the recursion starts with the second sample
+        start = 1 if self._count == 0 else 0
+        if len(sq) > start:
+            csta = 1. / self.nsta
+            clta = 1. / self.nlta
+            # first order recursive filters give the very same arithmetic as
+            # the loop in recstalta.c
+            sta = lfilter([csta], [1., -(1 - csta)], sq[start:],
+                          zi=[(1 - csta) * self._sta])[0]
+            lta = lfilter([clta], [1., -(1 - clta)], sq[start:],
+                          zi=[(1 - clta) * self._lta])[0]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                charfct[start:] = sta / lta
+            self._sta = sta[-1]
+            self._lta = lta[-1]
+        charfct[:max(self.nlta - self._count, 0)] = 0.0
+        self._count += len(sq)
+        return charfct
+
+
+class ClassicSTALTA(object):
+    """
+    Classic STA/LTA for consecutive chunks of a continuous signal.
+
+    The running sums and the squared samples still needed for them are kept
+    between calls of :meth:`process`, so that feeding a signal chunk by
+    chunk results in exactly the same characteristic function as a single
+    call of :func:`~obspy.signal.trigger.classicSTALTA` on the whole signal
+    (for signals of at least ``nlta`` samples).
+
+    :type nsta: Int
+    :param nsta: Length of short time average window in samples
+    :type nlta: Int
+    :param nlta: Length of long time average window in samples
+    """
+    def __init__(self, nsta, nlta):
+        self.nsta = nsta
+        self.nlta = nlta
+        self.reset()
+
+    def reset(self):
+        """
+        Forget all previous chunks, i.e. start with a new signal.
+        """
+        self._count = 0
+        self._sta = 0.0
+        self._lta = 0.0
+        self._history = np.empty(0, dtype='float64')
+
+    def process(self, a):
+        """
+        Compute the characteristic function for the next chunk of data.
+
+        :type a: NumPy ndarray
+        :param a: Next chunk of the seismic trace
+        :rtype: NumPy ndarray dtype float64
+        :return: Characteristic function for the samples in ``a``
+        """
+        nsta, nlta = self.nsta, self.nlta
+        frac = nlta / nsta
+        sq = np.require(a, 'float64') ** 2
+        charfct = np.zeros(len(sq), dtype='float64')
+        # squared samples of the last nlta samples and of this chunk, sample
+        # i of the whole signal is found at index i + off
+        ext = np.concatenate((self._history, sq))
+        i0 = self._count
+        i1 = i0 + len(sq)
+        off = len(self._history) - i0
+        # np.add.accumulate sums up strictly in order, just like the loops in
+        # stalta.c do
+        # 1) first nsta samples: fill up the STA
+        j0, j1 = i0, min(i1, nsta)
+        if j0 < j1:
+            self._sta = np.add.accumulate(
+                np.concatenate(([self._sta], ext[j0 + off:j1 + off])))[-1]
+            if j1 == nsta:
+                self._lta = self._sta
+        # 2) up to nlta samples: move the STA, fill up the LTA
+        j0, j1 = max(i0, nsta), min(i1, nlta)
+        if j0 < j1:
+            new = ext[j0 + off:j1 + off]
+            old = ext[j0 - nsta + off:j1 - nsta + off]
+            self._sta = np.add.accumulate(
+                np.concatenate(([self._sta], new - old)))[-1]
+            self._lta = np.add.accumulate(
+                np.concatenate(([self._lta], new)))[-1]
+        if i0 <= nlta - 1 < i1:
+            charfct[nlta - 1 - i0] = self._sta / self._lta * frac
+        # 3) afterwards: move both STA and LTA
+        j0 = max(i0, nlta)
+        if j0 < i1:
+            new = ext[j0 + off:i1 + off]
+            sta = np.add.accumulate(np.concatenate((
+                [self._sta], new - ext[j0 - nsta + off:i1 - nsta + off])))
+            lta = np.add.accumulate(np.concatenate((
+                [self._lta], new - ext[j0 - nlta + off:i1 - nlta + off])))
+            charfct[j0 - i0:] = sta[1:] / lta[1:] * frac
+            self._sta = sta[-1]
+            self._lta = lta[-1]
+        self._history = ext[-nlta:].copy()
+        self._count = i1
+        return charfct
+
+
+class DelayedSTALTA(object):
+    """
+    Delayed STA/LTA for consecutive chunks of a continuous signal.
+
+    The STA and LTA accumulators and the samples still needed for them are
+    kept between calls of :meth:`process`. Samples before the start of the
+    signal are taken as zeros, whereas
+    :func:`~obspy.signal.trigger.delayedSTALTA` wraps around to the end of
+    the array for the first samples. Feeding a signal ``a`` chunk by chunk
+    results in exactly the same characteristic function as
+    ``delayedSTALTA(np.concatenate((a, np.zeros(nsta + nlta + 1))), nsta,
+    nlta)[:len(a)]``.
+
+    :type nsta: Int
+    :param nsta: Length of short time average window in samples
+    :type nlta: Int
+    :param nlta: Length of long time average window in samples
+    """
+    def __init__(self, nsta, nlta):
+        self.nsta = nsta
+        self.nlta = nlta
+        self.reset()
+
+    def reset(self):
+        """
+        Forget all previous chunks, i.e. start with a new signal.
+        """
+        self._count = 0
+        self._sta = 0.0
+        self._lta = 0.0
+        self._history = np.zeros(self.nsta + self.nlta + 1, dtype='float64')
+
+    def process(self, a):
+        """
+        Compute the characteristic function for the next chunk of data.
+
+        :type a: NumPy ndarray
+        :param a: Next chunk of the seismic trace
+        :rtype: NumPy ndarray dtype float64
+        :return: Characteristic function for the samples in ``a``
+        """
+        nsta, nlta = self.nsta, self.nlta
+        npts = len(a)
+        ext = np.concatenate((self._history, np.require(a, 'float64') ** 2))
+        # index of the first sample of this chunk in ext
+        k = len(self._history)
+        sta = np.add.accumulate(np.concatenate((
+            [self._sta], (ext[k:] + ext[k - nsta:k - nsta + npts]) / nsta)))
+        lta = np.add.accumulate(np.concatenate((
+            [self._lta], (ext[k - nsta - 1:k - nsta - 1 + npts] +
+                          ext[k - nsta - nlta - 1:k - nsta - nlta - 1 + npts])
+            / nlta)))
+        self._sta = sta[-1]
+        self._lta = lta[-1]
+        sta = sta[1:]
+        lta = lta[1:]
+        mute = max(nlta + nsta + 50 - self._count, 0)
+        sta[:mute] = 0
+        lta[:mute] = 1  # avoid division by zero
+        self._history = ext[-(nsta + nlta + 1):].copy()
+        self._count += npts
+        return sta / lta
+
+
+def _carlMovingMean(ext, n, npts):
+    """
+    Mean over the n values preceding each of the last npts values of ext.
+
+    Sums up in the same order as :func:`~obspy.signal.trigger.carlSTATrig`.
+    """
+    start = len(ext) - npts - n
+    mean = np.zeros(npts, dtype='float64')
+    for i in range(n):
+        mean += ext[start + i:start + i + npts]
+    mean /= n
+    return mean
+
+
+class CarlSTATrig(object):
+    """
+    carlSTATrig characteristic function for consecutive chunks of a
+    continuous signal.
+
+    The samples and intermediate averages still needed for the moving
+    windows are kept between calls of :meth:`process`, so that feeding a
+    signal chunk by chunk results in exactly the same characteristic
+    function as a single call of :func:`~obspy.signal.trigger.carlSTATrig` on
+    the whole signal.
+
+    :type nsta: Int
+    :param nsta: Length of short time average window in samples
+    :type nlta: Int
+    :param nlta: Length of long time average window in samples
+    :type ration: Float
+    :param ratio: as ratio gets smaller, carlSTATrig gets more sensitive
+    :type quiet: Float
+    :param quiet: as quiet gets smaller, carlSTATrig gets more sensitive
+    """
+    def __init__(self, nsta, nlta, ratio, quiet):
+        self.nsta = nsta
+        self.nlta = nlta
+        self.ratio = ratio
+        self.quiet = quiet
+        self.reset()
+
+    def reset(self):
+        """
+        Forget all previous chunks, i.e. start with a new signal.
+        """
+        self._count = 0
+        # the values preceding the next chunk, the moving means ignore them
+        # during the first nsta (nlta) samples
+        self._a = np.zeros(self.nsta, dtype='float64')
+        self._sta = np.zeros(self.nlta, dtype='float64')
+        self._lta = 0.0
+        self._absdiff = np.zeros(self.nsta, dtype='float64')
+        self._star = np.zeros(self.nlta, dtype='float64')
+
+    def process(self, a):
+        """
+        Compute the characteristic function for the next chunk of data.
+
+        :type a: NumPy ndarray
+        :param a: Next chunk of the seismic trace
+        :rtype: NumPy ndarray dtype float64
+        :return: Characteristic function for the samples in ``a``
+        """
+        nsta, nlta = self.nsta, self.nlta
+        a = np.require(a, 'float64')
+        npts = len(a)
+        # number of leading samples of this chunk inside the first nsta (nlta)
+        # samples of the signal
+        pad_sta = min(max(nsta - self._count, 0), npts)
+        pad_lta = min(max(nlta - self._count, 0), npts)
+        #
+        ext = np.concatenate((self._a, a))
+        sta = _carlMovingMean(ext, nsta, npts)
+        sta[:pad_sta] = 0.0
+        self._a = ext[-nsta:].copy()
+        #
+        ext = np.concatenate((self._sta, sta))
+        lta = _carlMovingMean(ext, nlta, npts)
+        lta[:pad_lta] = 0.0
+        self._sta = ext[-nlta:].copy()
+        # the LTA is delayed by one sample
+        lta = np.concatenate(([self._lta], lta))
+        self._lta = lta[-1]
+        lta = lta[:-1]
+        #
+        ext = np.concatenate((self._absdiff, abs(a - lta)))
+        star = _carlMovingMean(ext, nsta, npts)
+        star[:pad_sta] = 0.0
+        self._absdiff = ext[-nsta:].copy()
+        #
+        ext = np.concatenate((self._star, star))
+        ltar = _carlMovingMean(ext, nlta, npts)
+        ltar[:pad_lta] = 0.0
+        self._star = ext[-nlta:].copy()
+        #
+        eta = star - (self.ratio * ltar) - abs(sta - lta) - self.quiet
+        eta[:pad_lta] = -1.0
+        self._count += npts
+        return eta
+
+
+class TriggerOnset(object):
+    """
+    Trigger on and off times for consecutive chunks of a characteristic
+    function.
+
+    Trigger onsets that are not yet switched off at the end of a chunk are
+    kept pending until a later chunk (or :meth:`finish`) decides on them.
+    Collecting the picks of all calls of :meth:`process` and of the final
+    call of :meth:`finish` results in exactly the same picks as a single
+    call of :func:`~obspy.signal.trigger.triggerOnset` on the whole
+    characteristic function. Sample indices are counted from the first
+    sample passed to :meth:`process`.
+
+    :type thres1: Float
+    :param thres1: Value above which trigger (of characteristic function)
+        is activated (higher threshold)
+    :type thres2: Float
+    :param thres2: Value below which trigger (of characteristic function)
+        is deactivated (lower threshold)
+    :type max_len: Int
+    :param max_len: Maximum length of triggered event in samples. A new
+        event will be triggered as soon as the signal reaches again above
+        thres1.
+    :type max_len_delete: Bool
+    :param max_len_delete: Do not write events longer than max_len into
+        report file.
+
+    .. rubric:: Example
+
+    Continuous triggering on consecutive chunks of data, e.g. as received
+    from a SeedLink server:
+
+    >>> np.random.seed(815)
+    >>> data = np.random.randn(10000)
+    >>> data[5000:5100] *= 10
+    >>> sta_lta = RecSTALTA(10, 500)
+    >>> onset = TriggerOnset(3.0, 1.5)
+    >>> picks = []
+    >>> for chunk in np.array_split(data, 7):
+    ...     picks.extend(onset.process(sta_lta.process(chunk)))
+    >>> picks.extend(onset.finish())
+    >>> np.array_equal(picks, triggerOnset(recSTALTA(data, 10, 500), 3.0,
+    ...                                    1.5))
+    True
+    """
+    def __init__(self, thres1, thres2, max_len=9e99, max_len_delete=False):
+        self.thres1 = thres1
+        self.thres2 = thres2
+        self.max_len = max_len
+        self.max_len_delete = max_len_delete
+        self.reset()
+
+    def reset(self):
+        """
+        Forget all previous chunks and pending triggers.
+        """
+        self._count = 0
+        self._above1 = False
+        self._above2 = False
+        # starts of intervals above thres1, ends of intervals above thres2
+        self._on = deque()
+        self._of = deque()
+        # with max_len_delete the end of the last interval above thres2 is
+        # only used once another interval follows (see triggerOnset)
+        self._last_end = []
+        self._last_off = -1
+
+    def process(self, charfct):
+        """
+        Evaluate the next chunk of the characteristic function.
+
+        :type charfct: NumPy ndarray
+        :param charfct: Next chunk of the characteristic function
+        :rtype: List
+        :return: Nested list of the trigger on and off times (in samples)
+            that got decided with this chunk
+        """
+        above1 = np.concatenate(([self._above1], charfct > self.thres1))
+        above2 = np.concatenate(([self._above2], charfct > self.thres2))
+        self._on.extend(
+            (np.where(above1[1:] & ~above1[:-1])[0] + self._count).tolist())
+        ends = (np.where(above2[:-1] & ~above2[1:])[0] + self._count - 1)
+        ends = ends.tolist()
+        if self.max_len_delete:
+            ends = self._last_end + ends
+            starts = np.where(above2[1:] & ~above2[:-1])[0] + self._count
+            if len(starts):
+                self._last_end = [e for e in ends if e >= starts[-1]]
+                ends = [e for e in ends if e < starts[-1]]
+            else:
+                self._last_end, ends = ends, []
+        self._of.extend(ends)
+        self._above1 = bool(above1[-1])
+        self._above2 = bool(above2[-1])
+        self._count += len(charfct)
+        return self._trigger()
+
+    def finish(self):
+        """
+        End of the characteristic function, decide on pending triggers.
+
+        Afterwards the instance is reset and can be used for a new
+        characteristic function.
+
+        :rtype: List
+        :return: Nested list of the remaining trigger on and off times (in
+            samples)
+        """
+        # include last pick if trigger is on or drop it
+        if self.max_len_delete:
+            self._of.append(1e99)
+        elif self._above2:
+            self._of.append(self._count - 1)
+        pick = self._trigger()
+        self.reset()
+        return pick
+
+    def _trigger(self):
+        """
+        Work through the onsets for which the off time is known by now.
+        """
+        on = self._on
+        of = self._of
+        pick = []
+        while on:
+            if on[0] <= self._last_off:
+                on.popleft()
+                continue
+            while of and of[0] < on[0]:
+                of.popleft()
+            if of:
+                off = of[0]
+            elif not self.max_len_delete and \
+                    self._count - 1 - on[0] > self.max_len:
+                # interval above thres2 is already longer than max_len
+                off = self._count - 1
+            else:
+                break
+            if off - on[0] > self.max_len:
+                if self.max_len_delete:
+                    on.popleft()
+                    self._last_off = off
+                    continue
+                off = on[0] + self.max_len
+            pick.append([on[0], off])
+            self._last_off = off
+            on.popleft()
+        return pick
+
+
 def pkBaer(reltrc, samp_int, tdownmax, tupevent, thr1, thr2, preset_len,
            p_dur):
     """
@@ -497,20 +967,79 @@ def plotTrigger(trace, cft, thr_on, thr_off, show=True):
         plt.show()
 
 
+def _coincidenceMembers(i, end, ons, offs, codes, extension, buf):
+    """
+    Single station triggers of a coincidence trigger starting with trigger i.
+
+    Following triggers (up to index end) are added as long as they overlap
+    with the triggers added so far, retriggerings of a trace already present
+    are skipped. Returns the indices of the triggers and the off time.
+    ``buf`` is a scratch array with one entry per trace.
+    """
+    size = 64
+    while True:
+        stop = min(end, i + 1 + size)
+        window = codes[i + 1:stop]
+        # only the first trigger of each trace is added, with repeated
+        # indices the last assignment wins
+        index = np.arange(len(window))
+        buf[window[::-1]] = index[::-1]
+        member = (buf[window] == index) & (window != codes[i])
+        # off time of the coincidence trigger before each trigger
+        off = np.concatenate(([offs[i]],
+                              np.where(member, offs[i + 1:stop], -np.inf)))
+        off = np.maximum.accumulate(off)
+        gap = np.nonzero(ons[i + 1:stop] > off[:-1] + extension)[0]
+        if len(gap):
+            stop = i + 1 + gap[0]
+        elif stop < end:
+            size *= 4
+            continue
+        members = np.nonzero(member[:stop - i - 1])[0] + i + 1
+        return np.concatenate(([i], members)), off[stop - i - 1]
+
+
+def _coincidenceTriggerWorker(args):
+    """
+    Single station triggering of one trace for coincidenceTrigger.
+
+    Returns a list of (on, off, trace id, cft peak, cft std) tuples with on
+    and off as timestamps.
+    """
+    (tr, trigger_type, thr_on, thr_off, max_trigger_length,
+     delete_long_trigger, options) = args
+    if trigger_type is not None:
+        tr.trigger(trigger_type, **options)
+    max_len = max_trigger_length * tr.stats.sampling_rate
+    triggers = []
+    for on, off in triggerOnset(tr.data, thr_on, thr_off, max_len=max_len,
+                                max_len_delete=delete_long_trigger):
+        cft = tr.data[int(on):int(off)]
+        cft_peak = cft.max()
+        cft_std = cft.std()
+        on = tr.stats.starttime + float(on) / tr.stats.sampling_rate
+        off = tr.stats.starttime + float(off) / tr.stats.sampling_rate
+        triggers.append((on.timestamp, off.timestamp, tr.id, cft_peak,
+                         cft_std))
+    return triggers
+
+
 def coincidenceTrigger(trigger_type, thr_on, thr_off, stream,
                        thr_coincidence_sum, trace_ids=None,
                        max_trigger_length=1e6, delete_long_trigger=False,
                        trigger_off_extension=0, details=False,
                        event_templates={}, similarity_threshold=0.7,
-                       **options):
+                       parallel=False, workers=None, **options):
     """
     Perform a network coincidence trigger.
 
     The routine works in the following steps:
       * take every single trace in the stream
-      * apply specified triggering routine
+      * apply specified triggering routine (optionally in a pool of workers)
       * evaluate triggering results
       * compile chronological overall list of all single station triggers
+      * split the list into clusters of overlapping triggers, skip clusters
+        that can not reach the coincidence sum
       * find overlapping single station triggers
       * calculate coincidence sum every individual overlapping trigger
       * add to coincidence trigger list if it exceeds the given threshold
@@ -592,6 +1121,14 @@ def coincidenceTrigger(trigger_type, thr_on, thr_off, stream,
         trigger list. A common threshold can be set for all stations (float) or
         a dictionary mapping station names to float values for each station.
     :type similarity_threshold: float or dict
+    :type parallel: bool, str or pool-like object (optional)
+    :param parallel: Computes the characteristic functions and single
+        station triggers of the traces in a pool of workers, either
+        ``"thread"``, ``"process"`` or a pool-like object, see
+        :func:`~obspy.core.util.misc.worker_pool`. The result is the same as
+        with serial processing.
+    :type workers: int (optional)
+    :param workers: Number of workers used if a new pool is created.
     :rtype: list
     :returns: List of event triggers sorted chronologically.
     """
@@ -608,98 +1145,127 @@ def coincidenceTrigger(trigger_type, thr_on, thr_off, stream,
                                              similarity_threshold)
 
     # the single station triggering
-    triggers = []
-    # prepare kwargs for triggerOnset
-    kwargs = {'max_len_delete': delete_long_trigger}
+    jobs = []
     for tr in st:
         if tr.id not in trace_ids:
             msg = "At least one trace's ID was not found in the " + \
                   "trace ID list and was disregarded (%s)" % tr.id
             warnings.warn(msg, UserWarning)
             continue
-        if trigger_type is not None:
-            tr.trigger(trigger_type, **options)
-        kwargs['max_len'] = max_trigger_length * tr.stats.sampling_rate
-        tmp_triggers = triggerOnset(tr.data, thr_on, thr_off, **kwargs)
-        for on, off in tmp_triggers:
-            cft_peak = tr.data[on:off].max()
-            cft_std = tr.data[on:off].std()
-            on = tr.stats.starttime + float(on) / tr.stats.sampling_rate
-            off = tr.stats.starttime + float(off) / tr.stats.sampling_rate
-            triggers.append((on.timestamp, off.timestamp, tr.id, cft_peak,
-                             cft_std))
+        jobs.append((tr, trigger_type, thr_on, thr_off, max_trigger_length,
+                     delete_long_trigger, options))
+    if parallel:
+        with worker_pool(parallel, workers) as pool:
+            results = list(pool.map(_coincidenceTriggerWorker, jobs))
+    else:
+        results = [_coincidenceTriggerWorker(job) for job in jobs]
+    triggers = [trigger for result in results for trigger in result]
     triggers.sort()
+    if not triggers:
+        return []
+
+    # interval sweep: split the chronological trigger list into clusters of
+    # triggers chained by overlaps, a coincidence trigger never reaches
+    # beyond the end of the cluster it starts in
+    ons = np.array([trigger[0] for trigger in triggers])
+    offs = np.array([trigger[1] for trigger in triggers])
+    reach = np.maximum.accumulate(offs) + trigger_off_extension
+    starts = np.concatenate(([0], np.nonzero(ons[1:] > reach[:-1])[0] + 1))
+    ends = np.append(starts[1:], len(triggers))
+    cluster_offs = np.maximum.reduceat(offs, starts)
+    # skip clusters that can not reach the coincidence sum, not even with all
+    # of their triggers, unless a similarity check might rescue them
+    trigger_weights = np.array(
+        [trace_ids[trigger[2]] for trigger in triggers], dtype=np.float64)
+    stations = [trigger[2].split(".")[1] for trigger in triggers]
+    codes = np.unique([trigger[2] for trigger in triggers],
+                      return_inverse=True)[1]
+    buf = np.empty(codes.max() + 1, dtype=np.intp)
+    skip = np.zeros(len(starts), dtype=np.bool_)
+    if (trigger_weights >= 0).all():
+        max_sums = np.add.reduceat(trigger_weights, starts)
+        # allow for rounding differences to the sums computed one by one
+        skip = max_sums + 1e-6 * np.abs(max_sums) < thr_coincidence_sum
+        with_templates = np.array(
+            [bool(event_templates.get(sta)) for sta in stations])
+        skip &= ~np.logical_or.reduceat(with_templates, starts)
+
+    # similarity checks of a station only need the traces in its templates,
+    # each station is checked at most once per event time
+    similarity_streams = {}
+    similarities = {}
+
+    def similarity(sta, time):
+        key = (sta, time.timestamp)
+        if key not in similarities:
+            if sta not in similarity_streams:
+                selected = set()
+                for st_tmpl in event_templates[sta]:
+                    for tr in st_tmpl:
+                        selected.update(id(tr_) for tr_ in
+                                        stream.select(id=tr.id))
+                similarity_streams[sta] = Stream(
+                    [tr for tr in stream if id(tr) in selected])
+            similarities[key] = templatesMaxSimilarity(
+                similarity_streams[sta], time, event_templates[sta])
+        return similarities[key]
 
     # the coincidence triggering and coincidence sum computation
     coincidence_triggers = []
     last_off_time = 0.0
-    while triggers != []:
-        # remove first trigger from list and look for overlaps
-        on, off, tr_id, cft_peak, cft_std = triggers.pop(0)
-        sta = tr_id.split(".")[1]
-        event = {}
-        event['time'] = UTCDateTime(on)
-        event['stations'] = [tr_id.split(".")[1]]
-        event['trace_ids'] = [tr_id]
-        event['coincidence_sum'] = float(trace_ids[tr_id])
-        event['similarity'] = {}
-        if details:
-            event['cft_peaks'] = [cft_peak]
-            event['cft_stds'] = [cft_std]
-        # evaluate maximum similarity for station if event templates were
-        # provided
-        templates = event_templates.get(sta)
-        if templates:
-            event['similarity'][sta] = \
-                templatesMaxSimilarity(stream, event['time'], templates)
-        # compile the list of stations that overlap with the current trigger
-        for trigger in triggers:
-            tmp_on, tmp_off, tmp_tr_id, tmp_cft_peak, tmp_cft_std = trigger
-            tmp_sta = tmp_tr_id.split(".")[1]
-            # skip retriggering of already present station in current
-            # coincidence trigger
-            if tmp_tr_id in event['trace_ids']:
-                continue
-            # check for overlapping trigger,
-            # break if there is a gap in between the two triggers
-            if tmp_on > off + trigger_off_extension:
+    for cluster in np.nonzero(~skip)[0]:
+        end = ends[cluster]
+        for i in range(starts[cluster], end):
+            # all remaining triggers of the cluster would only give subsets
+            # of the previous coincidence trigger
+            if cluster_offs[cluster] <= last_off_time:
                 break
-            event['stations'].append(tmp_sta)
-            event['trace_ids'].append(tmp_tr_id)
-            event['coincidence_sum'] += trace_ids[tmp_tr_id]
-            if details:
-                event['cft_peaks'].append(tmp_cft_peak)
-                event['cft_stds'].append(tmp_cft_std)
-            # allow sets of triggers that overlap only on subsets of all
-            # stations (e.g. A overlaps with B and B overlaps w/ C => ABC)
-            off = max(off, tmp_off)
-            # evaluate maximum similarity for station if event templates were
-            # provided
-            templates = event_templates.get(tmp_sta)
-            if templates:
-                event['similarity'][tmp_sta] = \
-                    templatesMaxSimilarity(stream, event['time'], templates)
-        # skip if both coincidence sum and similarity thresholds are not met
-        if event['coincidence_sum'] < thr_coincidence_sum:
-            if not event['similarity']:
-                continue
-            elif not any([val > similarity_threshold[_s]
-                          for _s, val in event['similarity'].items()]):
+            # look for overlaps of the current trigger with the following
+            members, off = _coincidenceMembers(i, end, ons, offs, codes,
+                                               trigger_off_extension, buf)
+            # skip coincidence trigger if it is just a subset of the previous
+            # (determined by a shared off-time, this is a bit sloppy)
+            if off <= last_off_time:
                 continue
-        # skip coincidence trigger if it is just a subset of the previous
-        # (determined by a shared off-time, this is a bit sloppy)
-        if off <= last_off_time:
-            continue
-        event['duration'] = off - on
-        if details:
-            weights = np.array([trace_ids[i] for i in event['trace_ids']])
-            weighted_values = np.array(event['cft_peaks']) * weights
-            event['cft_peak_wmean'] = weighted_values.sum() / weights.sum()
-            weighted_values = np.array(event['cft_stds']) * weights
-            event['cft_std_wmean'] = \
-                (np.array(event['cft_stds']) * weights).sum() / weights.sum()
-        coincidence_triggers.append(event)
-        last_off_time = off
+            on = triggers[i][0]
+            off = float(off)
+            event = {}
+            event['time'] = UTCDateTime(on)
+            event['stations'] = [stations[j] for j in members]
+            event['trace_ids'] = [triggers[j][2] for j in members]
+            # sum up one by one in chronological order
+            event['coincidence_sum'] = \
+                float(np.add.accumulate(trigger_weights[members])[-1])
+            event['similarity'] = {}
+            # evaluate maximum similarity for stations if event templates
+            # were provided
+            for sta in event['stations']:
+                if event_templates.get(sta):
+                    event['similarity'][sta] = similarity(sta, event['time'])
+            # skip if both coincidence sum and similarity thresholds are not
+            # met
+            if event['coincidence_sum'] < thr_coincidence_sum:
+                if not event['similarity']:
+                    continue
+                elif not any([val > similarity_threshold[_s]
+                              for _s, val in event['similarity'].items()]):
+                    continue
+            if details:
+                event['cft_peaks'] = [triggers[j][3] for j in members]
+                event['cft_stds'] = [triggers[j][4] for j in members]
+            event['duration'] = off - on
+            if details:
+                weights = np.array([trace_ids[_id]
+                                    for _id in event['trace_ids']])
+                weighted_values = np.array(event['cft_peaks']) * weights
+                event['cft_peak_wmean'] = \
+                    weighted_values.sum() / weights.sum()
+                weighted_values = np.array(event['cft_stds']) * weights
+                event['cft_std_wmean'] = \
+                    (np.array(event['cft_stds']) * weights).sum() / \
+                    weights.sum()
+            coincidence_triggers.append(event)
+            last_off_time = off
     return coincidence_triggers
 
 
@@ -12,11 +12,11 @@ Provides the Inventory class.
 from __future__ import unicode_literals
 from __future__ import print_function
 from future.builtins import str
-from pkg_resources import load_entry_point
 import obspy
 from obspy.core.util.base import ComparingObject
 from obspy.core.util.decorator import map_example_filename
-from obspy.core.util.base import ENTRY_POINTS, _readFromPlugin
+from obspy.core.util.base import ENTRY_POINTS, _readFromPlugin, \
+    _getPluginFunction
 from obspy.station.stationxml import SOFTWARE_MODULE, SOFTWARE_URI
 from obspy.station.network import Network
 import textwrap
@@ -179,9 +179,8 @@ class Inventory(ComparingObject):
             # get format specific entry point
             format_ep = ENTRY_POINTS['inventory_write'][format]
             # search writeFormat method for given entry point
-            writeFormat = load_entry_point(
-                format_ep.dist.key,
-                'obspy.plugin.inventory.%s' % (format_ep.name), 'writeFormat')
+            writeFormat = _getPluginFunction('inventory', format_ep,
+                                             'writeFormat')
         except (IndexError, ImportError, KeyError):
             msg = "Writing format \"%s\" is not supported. Supported types: %s"
             raise TypeError(msg % (format,
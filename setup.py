@@ -392,6 +392,7 @@ def configuration(parent_package="", top_path=None):
     path = os.path.join(SETUP_DIRECTORY, "obspy", "mseed", "src")
     files = glob.glob(os.path.join(path, "libmseed", "*.c"))
     files.append(os.path.join(path, "obspy-readbuffer.c"))
+    files.append(os.path.join(path, "obspy-steim.c"))
     # compiler specific options
     kwargs = {}
     if IS_MSVC:
@@ -402,6 +403,8 @@ def configuration(parent_package="", top_path=None):
             export_symbols(path, 'libmseed', 'libmseed.def')
         kwargs['export_symbols'] += \
             export_symbols(path, 'obspy-readbuffer.def')
+        kwargs['export_symbols'] += \
+            export_symbols(path, 'obspy-steim.def')
         # workaround Win32 and MSVC - see issue #64
         if '32' in platform.architecture()[0]:
             kwargs['extra_compile_args'] = ["/fp:strict"]